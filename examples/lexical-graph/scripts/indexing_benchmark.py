@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+
+import argparse
+import json
+import logging
+import sys
+
+from graphrag_toolkit.lexical_graph.benchmarks import IndexingBenchmarkConfig, run_indexing_benchmark
+
+logging.basicConfig(stream=sys.stdout, level=logging.WARNING)
+
+
+def do_benchmark():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-documents', type=int, default=20, help = 'Number of synthetic documents (optional, default 20)')
+    parser.add_argument('--paragraphs-per-document', type=int, default=4, help = 'Paragraphs per document (optional, default 4)')
+    parser.add_argument('--sentences-per-paragraph', type=int, default=6, help = 'Sentences per paragraph (optional, default 6)')
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0, help = 'Latency injected into each LLM completion (optional, default 0)')
+    parser.add_argument('--embedding-latency-ms', type=float, default=0.0, help = 'Latency injected into each embedding batch (optional, default 0)')
+    parser.add_argument('--graph-store-latency-ms', type=float, default=0.0, help = 'Latency injected into each graph query (optional, default 0)')
+    parser.add_argument('--vector-store-latency-ms', type=float, default=0.0, help = 'Latency injected into each vector index write (optional, default 0)')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help = 'Maximum variation of injected latencies, as a fraction (optional, default 0)')
+    parser.add_argument('--extraction-num-workers', type=int, help = 'Number of extraction workers (optional)')
+    parser.add_argument('--build-num-workers', type=int, help = 'Number of build workers (optional)')
+    parser.add_argument('--json', action='store_true', help = 'Print results as JSON (optional)')
+    args, _ = parser.parse_known_args()
+
+    config = IndexingBenchmarkConfig(
+        num_documents=args.num_documents,
+        paragraphs_per_document=args.paragraphs_per_document,
+        sentences_per_paragraph=args.sentences_per_paragraph,
+        llm_latency_millis=args.llm_latency_ms,
+        embedding_latency_millis=args.embedding_latency_ms,
+        graph_store_latency_millis=args.graph_store_latency_ms,
+        vector_store_latency_millis=args.vector_store_latency_ms,
+        latency_jitter=args.latency_jitter,
+        extraction_num_workers=args.extraction_num_workers,
+        build_num_workers=args.build_num_workers
+    )
+
+    results = run_indexing_benchmark(config)
+
+    if args.json:
+        print(json.dumps(results.to_dict(), indent=2))
+    else:
+        print(results.format())
+    
+            
+if __name__ == '__main__':
+    do_benchmark()
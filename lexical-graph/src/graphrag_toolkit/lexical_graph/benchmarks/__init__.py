@@ -0,0 +1,6 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from .mock_models import MockExtractionLLM, MockEmbedding
+from .stand_in_stores import BenchmarkGraphStore, BenchmarkVectorIndex, benchmark_vector_store
+from .indexing_benchmark import IndexingBenchmarkConfig, IndexingBenchmarkResults, generate_documents, run_indexing_benchmark
@@ -0,0 +1,366 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+import queue
+import pickle
+import random
+import logging
+import tempfile
+import threading
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generator, List, Optional
+
+from graphrag_toolkit.lexical_graph import LexicalGraphIndex
+from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+from graphrag_toolkit.lexical_graph.indexing import NodeHandler
+from graphrag_toolkit.lexical_graph.utils.fm_observability import LatencyHistogram, SpanEvent, get_fm_observability_queue, set_fm_observability_queue
+from graphrag_toolkit.lexical_graph.benchmarks.mock_models import MockExtractionLLM, MockEmbedding, max_rss_kb
+from graphrag_toolkit.lexical_graph.benchmarks.stand_in_stores import BenchmarkGraphStore, benchmark_vector_store
+
+from llama_index.core.bridge.pydantic import Field
+from llama_index.core.schema import BaseNode, Document
+
+logger = logging.getLogger(__name__)
+
+STAGE_SPANS = {
+    'extract': ('pipeline.extract', 'pipeline.extract.worker', ['benchmark.llm']),
+    'build': ('pipeline.build', 'pipeline.build.worker', ['benchmark.graph_store', 'benchmark.vector_store', 'benchmark.embedding'])
+}
+
+_FIRST_NAMES = ['Alice', 'Bruno', 'Chen', 'Dana', 'Emeka', 'Fatima', 'Goran', 'Hana', 'Ivan', 'Julia']
+_LAST_NAMES = ['Abbott', 'Brennan', 'Castillo', 'Dubois', 'Eriksen', 'Fujita', 'Garcia', 'Haddad', 'Ito', 'Jensen']
+_ORGANIZATIONS = ['Acme Robotics', 'Blue Harbor Bank', 'Cedar Labs', 'Delta Freight', 'Evergreen Health', 'Foxglove Media']
+_LOCATIONS = ['Lisbon', 'Nairobi', 'Osaka', 'Portland', 'Quito', 'Rotterdam', 'Seoul', 'Toronto']
+_ACTIONS = [
+    'signed a supply agreement with', 'opened a research office for', 'presented quarterly results to',
+    'hired engineers from', 'announced a partnership with', 'audited the accounts of'
+]
+
+@dataclass
+class IndexingBenchmarkConfig:
+    """
+    Configuration of an offline indexing benchmark run.
+
+    Attributes:
+        num_documents (int): The number of synthetic documents to index.
+        paragraphs_per_document (int): The number of paragraphs in each document.
+        sentences_per_paragraph (int): The number of sentences in each paragraph.
+        seed (int): Seed for the synthetic document generator.
+        llm_latency_millis (float): Latency injected into each LLM completion.
+        embedding_latency_millis (float): Latency injected into each embedding batch.
+        graph_store_latency_millis (float): Latency injected into each graph query.
+        vector_store_latency_millis (float): Latency injected into each vector index write.
+        latency_jitter (float): Maximum variation of each injected latency, as a fraction
+            of that latency.
+        embed_dimensions (int): The number of dimensions of the mock embeddings.
+        extraction_num_workers (Optional[int]): Overrides `GraphRAGConfig.extraction_num_workers`.
+        extraction_num_threads_per_worker (Optional[int]): Overrides
+            `GraphRAGConfig.extraction_num_threads_per_worker`.
+        extraction_batch_size (Optional[int]): Overrides `GraphRAGConfig.extraction_batch_size`.
+        build_num_workers (Optional[int]): Overrides `GraphRAGConfig.build_num_workers`.
+        build_batch_size (Optional[int]): Overrides `GraphRAGConfig.build_batch_size`.
+        build_batch_write_size (Optional[int]): Overrides `GraphRAGConfig.build_batch_write_size`.
+        batch_writes_enabled (Optional[bool]): Overrides `GraphRAGConfig.batch_writes_enabled`.
+        measure_output_bytes (bool): Whether to measure the pickled size of the nodes
+            emitted by the build stage. The output nodes are retained until the end of
+            the run, and are pickled after the run has been timed.
+    """
+    num_documents:int = 20
+    paragraphs_per_document:int = 4
+    sentences_per_paragraph:int = 6
+    seed:int = 42
+    llm_latency_millis:float = 0.0
+    embedding_latency_millis:float = 0.0
+    graph_store_latency_millis:float = 0.0
+    vector_store_latency_millis:float = 0.0
+    latency_jitter:float = 0.0
+    embed_dimensions:int = 1024
+    extraction_num_workers:Optional[int] = None
+    extraction_num_threads_per_worker:Optional[int] = None
+    extraction_batch_size:Optional[int] = None
+    build_num_workers:Optional[int] = None
+    build_batch_size:Optional[int] = None
+    build_batch_write_size:Optional[int] = None
+    batch_writes_enabled:Optional[bool] = None
+    measure_output_bytes:bool = True
+
+
+def generate_documents(num_documents:int, paragraphs_per_document:int=4, sentences_per_paragraph:int=6, seed:int=42) -> List[Document]:
+    """
+    Returns deterministic synthetic documents, each comprising paragraphs of sentences
+    relating people, organizations and locations to one another.
+    """
+    rnd = random.Random(seed)
+    documents = []
+
+    for i in range(num_documents):
+        paragraphs = []
+        for _ in range(paragraphs_per_document):
+            sentences = []
+            for _ in range(sentences_per_paragraph):
+                person = f'{rnd.choice(_FIRST_NAMES)} {rnd.choice(_LAST_NAMES)}'
+                sentences.append(
+                    f'{person} of {rnd.choice(_ORGANIZATIONS)} {rnd.choice(_ACTIONS)} '
+                    f'{rnd.choice(_ORGANIZATIONS)} in {rnd.choice(_LOCATIONS)} during week {rnd.randint(1, 52)}.'
+                )
+            paragraphs.append(' '.join(sentences))
+        documents.append(Document(text='\n\n'.join(paragraphs), metadata={'source': f'benchmark-document-{i}'}))
+
+    return documents
+
+
+class _SpanAggregate:
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.attributes:Dict[str, float] = {}
+        self.max_rss_kb = 0
+        self.pids = set()
+
+    def add(self, event:SpanEvent):
+        self.histogram.record(event.duration_millis, error=event.error is not None)
+        self.pids.add(event.pid)
+        for k, v in event.attributes.items():
+            if k == 'max_rss_kb':
+                self.max_rss_kb = max(self.max_rss_kb, v)
+            elif isinstance(v, (int, float)) and not isinstance(v, bool):
+                self.attributes[k] = self.attributes.get(k, 0) + v
+
+
+class _SpanCollector(threading.Thread):
+
+    def __init__(self, observability_queue):
+        super().__init__(daemon=True)
+        self.observability_queue = observability_queue
+        self.spans:Dict[str, _SpanAggregate] = {}
+        self._discontinue = threading.Event()
+
+    def run(self):
+        while True:
+            try:
+                event = self.observability_queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._discontinue.is_set():
+                    return
+                continue
+            if isinstance(event, SpanEvent):
+                self.spans.setdefault(event.name, _SpanAggregate()).add(event)
+
+    def stop(self) -> Dict[str, _SpanAggregate]:
+        self._discontinue.set()
+        self.join()
+        return self.spans
+
+
+class _OutputCollector(NodeHandler):
+
+    nodes:List[BaseNode] = Field(default_factory=list)
+    num_nodes:int = Field(default=0)
+    retain_nodes:bool = Field(default=True)
+
+    def accept(self, nodes:List[BaseNode], **kwargs:Any) -> Generator[BaseNode, None, None]:
+        for node in nodes:
+            self.num_nodes += 1
+            if self.retain_nodes:
+                self.nodes.append(node)
+            yield node
+
+
+@dataclass
+class IndexingBenchmarkResults:
+    """
+    The results of an offline indexing benchmark run.
+
+    Attributes:
+        config (IndexingBenchmarkConfig): The benchmark configuration.
+        wall_seconds (float): The elapsed time of `extract_and_build()`.
+        num_documents (int): The number of documents indexed.
+        num_output_nodes (int): The number of nodes emitted by the build stage.
+        stages (Dict[str, Dict[str, Any]]): Per-stage (extract, build) nodes processed,
+            batches, busy time, throughput, batch latency percentiles and peak worker memory.
+        queries (Dict[str, int]): The number of LLM completions, embedding batches, graph
+            queries and vector index writes issued.
+        bytes (Dict[str, int]): The number of bytes serialized for documents, LLM prompts
+            and responses, graph queries, vector index writes, the node batches sent to
+            and returned from each stage's workers, and output nodes.
+        peak_memory_mb (float): The peak resident set size of the driving process.
+        latencies (Dict[str, Dict[str, Any]]): Latency percentiles for every span recorded
+            during the run.
+    """
+    config:IndexingBenchmarkConfig
+    wall_seconds:float
+    num_documents:int
+    num_output_nodes:int
+    stages:Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    queries:Dict[str, int] = field(default_factory=dict)
+    bytes:Dict[str, int] = field(default_factory=dict)
+    peak_memory_mb:float = 0.0
+    latencies:Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'config': self.config.__dict__,
+            'wall_seconds': round(self.wall_seconds, 3),
+            'num_documents': self.num_documents,
+            'num_output_nodes': self.num_output_nodes,
+            'documents_per_second': round(self.num_documents / self.wall_seconds, 3) if self.wall_seconds else 0.0,
+            'stages': self.stages,
+            'queries': self.queries,
+            'bytes': self.bytes,
+            'peak_memory_mb': round(self.peak_memory_mb, 1),
+            'latencies': self.latencies
+        }
+
+    def format(self) -> str:
+        """
+        Returns a human-readable summary of the results.
+        """
+        lines = [
+            f'Indexed {self.num_documents} documents ({self.num_output_nodes} output nodes) in {self.wall_seconds:.2f}s',
+            ''
+        ]
+        for stage, s in self.stages.items():
+            lines.append(
+                f'{stage:<8} nodes: {s["nodes"]:<6} batches: {s["batches"]:<4} busy: {s["busy_seconds"]:.2f}s  '
+                f'throughput: {s["nodes_per_second"]:.1f} nodes/s  '
+                f'batch p50/p99: {s["batch_p50_millis"]:.0f}/{s["batch_p99_millis"]:.0f}ms  '
+                f'peak worker memory: {s["peak_worker_memory_mb"]:.1f}MB'
+            )
+        lines.append('')
+        lines.append('Queries: ' + ', '.join(f'{k}: {v}' for k, v in self.queries.items()))
+        lines.append('Bytes:   ' + ', '.join(f'{k}: {v}' for k, v in self.bytes.items()))
+        lines.append(f'Peak memory (driver): {self.peak_memory_mb:.1f}MB')
+        return '\n'.join(lines)
+
+
+def _stage_results(spans:Dict[str, _SpanAggregate]) -> Dict[str, Dict[str, Any]]:
+    stages = {}
+    for stage, (stage_span, worker_span, operation_spans) in STAGE_SPANS.items():
+        stage_spans = spans.get(stage_span, _SpanAggregate())
+        worker_spans = spans.get(worker_span, _SpanAggregate())
+        nodes = int(worker_spans.attributes.get('num_nodes', 0))
+        busy_seconds = stage_spans.histogram.total_millis / 1000
+        peak_rss_kb = max([spans[name].max_rss_kb for name in operation_spans if name in spans] or [0])
+        stages[stage] = {
+            'nodes': nodes,
+            'batches': worker_spans.histogram.count,
+            'workers': len(worker_spans.pids),
+            'busy_seconds': round(busy_seconds, 3),
+            'nodes_per_second': round(nodes / busy_seconds, 3) if busy_seconds else 0.0,
+            'batch_p50_millis': worker_spans.histogram.percentile(50),
+            'batch_p99_millis': worker_spans.histogram.percentile(99),
+            'peak_worker_memory_mb': round(peak_rss_kb / 1024, 1)
+        }
+    return stages
+
+def run_indexing_benchmark(config:Optional[IndexingBenchmarkConfig]=None) -> IndexingBenchmarkResults:
+    """
+    Runs `LexicalGraphIndex.extract_and_build()` over synthetic documents, using a
+    deterministic mock LLM and embedding model and in-process stand-in graph and vector
+    stores, and reports throughput, queries issued, bytes serialized and peak memory for
+    the extract and build stages.
+
+    No network access or hardware accelerator is required. The mock models and stand-in
+    stores publish their work as spans (see `trace_span()`), which are collected from the
+    pipeline worker processes via the observability queue. Latency can be injected into
+    each mock model and store to approximate remote services.
+
+    `GraphRAGConfig.extraction_llm`, `GraphRAGConfig.embed_model` and
+    `GraphRAGConfig.enable_cache` are replaced for the duration of the run, together
+    with any worker and batch size overrides in the configuration, and are restored
+    afterwards.
+    """
+    config = config or IndexingBenchmarkConfig()
+
+    overrides = {
+        'extraction_llm': MockExtractionLLM(latency_millis=config.llm_latency_millis, latency_jitter=config.latency_jitter),
+        'embed_model': MockEmbedding(dimensions=config.embed_dimensions, latency_millis=config.embedding_latency_millis, latency_jitter=config.latency_jitter),
+        'embed_dimensions': config.embed_dimensions,
+        'enable_cache': False
+    }
+    for name in ['extraction_num_workers', 'extraction_num_threads_per_worker', 'extraction_batch_size', 'build_num_workers', 'build_batch_size', 'build_batch_write_size', 'batch_writes_enabled']:
+        value = getattr(config, name)
+        if value is not None:
+            overrides[name] = value
+
+    previous_config = {name: getattr(GraphRAGConfig, f'_{name}') for name in overrides}
+    previous_queue = get_fm_observability_queue()
+    if previous_queue is not None:
+        logger.warning('An observability queue is already active: spans recorded during the benchmark will not be published to it')
+
+    documents = generate_documents(config.num_documents, config.paragraphs_per_document, config.sentences_per_paragraph, config.seed)
+    input_bytes = sum(len(pickle.dumps(d)) for d in documents)
+
+    observability_queue = multiprocessing.Queue()
+    collector = _SpanCollector(observability_queue)
+    output = _OutputCollector(show_progress=False, retain_nodes=config.measure_output_bytes)
+
+    try:
+        for name, value in overrides.items():
+            setattr(GraphRAGConfig, name, value)
+        set_fm_observability_queue(observability_queue)
+        collector.start()
+
+        with tempfile.TemporaryDirectory() as extraction_dir:
+            graph_index = LexicalGraphIndex(
+                graph_store=BenchmarkGraphStore(
+                    latency_millis=config.graph_store_latency_millis,
+                    latency_jitter=config.latency_jitter
+                ),
+                vector_store=benchmark_vector_store(
+                    embed_model=overrides['embed_model'],
+                    latency_millis=config.vector_store_latency_millis,
+                    latency_jitter=config.latency_jitter
+                ),
+                extraction_dir=extraction_dir
+            )
+
+            start = time.perf_counter()
+            graph_index.extract_and_build(documents, handler=output)
+            wall_seconds = time.perf_counter() - start
+
+    finally:
+        set_fm_observability_queue(previous_queue)
+        spans = collector.stop()
+        for name, value in previous_config.items():
+            setattr(GraphRAGConfig, f'_{name}', value)
+
+    def total(span_name:str, attribute:str) -> int:
+        return int(spans[span_name].attributes.get(attribute, 0)) if span_name in spans else 0
+
+    def count(span_name:str) -> int:
+        return spans[span_name].histogram.count if span_name in spans else 0
+
+    bytes_serialized = {
+        'input_documents': input_bytes,
+        'llm_prompts': total('benchmark.llm', 'prompt_bytes'),
+        'llm_responses': total('benchmark.llm', 'response_bytes'),
+        'embedding_texts': total('benchmark.embedding', 'text_bytes'),
+        'graph_queries': total('benchmark.graph_store', 'query_bytes'),
+        'vector_writes': total('benchmark.vector_store', 'payload_bytes')
+    }
+    for stage, (_, worker_span, _) in STAGE_SPANS.items():
+        bytes_serialized[f'{stage}_batches_sent'] = total(worker_span, 'sent_bytes')
+        bytes_serialized[f'{stage}_batches_returned'] = total(worker_span, 'returned_bytes')
+    if config.measure_output_bytes:
+        bytes_serialized['output_nodes'] = sum(len(pickle.dumps(n)) for n in output.nodes)
+
+    return IndexingBenchmarkResults(
+        config=config,
+        wall_seconds=wall_seconds,
+        num_documents=len(documents),
+        num_output_nodes=output.num_nodes,
+        stages=_stage_results(spans),
+        queries={
+            'llm_completions': count('benchmark.llm'),
+            'embedding_batches': count('benchmark.embedding'),
+            'embedded_texts': total('benchmark.embedding', 'num_texts'),
+            'graph_queries': count('benchmark.graph_store'),
+            'vector_writes': count('benchmark.vector_store')
+        },
+        bytes=bytes_serialized,
+        peak_memory_mb=max_rss_kb() / 1024,
+        latencies={name: s.histogram.to_dict() for name, s in sorted(spans.items())}
+    )
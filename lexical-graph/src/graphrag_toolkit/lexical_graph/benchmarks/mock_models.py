@@ -0,0 +1,208 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import sys
+import time
+import zlib
+import random
+import logging
+import numpy as np
+from typing import Any, List
+
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
+
+from llama_index.core.bridge.pydantic import Field
+from llama_index.core.embeddings import BaseEmbedding
+from llama_index.core.llms import CustomLLM, CompletionResponse, CompletionResponseGen, LLMMetadata
+from llama_index.core.llms.callbacks import llm_completion_callback
+
+logger = logging.getLogger(__name__)
+
+MOCK_ENTITY_CLASSIFICATIONS = ['Person', 'Organization', 'Location']
+MAX_PROPOSITIONS_PER_TOPIC = 5
+
+_TEXT = re.compile(r'<text>\s*(.*?)\s*</text>', re.DOTALL)
+_PROPOSITIONS = re.compile(r'<propositions>\s*(.*?)\s*</propositions>', re.DOTALL)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+_ENTITY = re.compile(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)*\b')
+
+def max_rss_kb() -> int:
+    """
+    Returns the peak resident set size of the current process in kilobytes, or 0 if it
+    cannot be determined on this platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, and in kilobytes elsewhere
+    return int(max_rss / 1024) if sys.platform == 'darwin' else int(max_rss)
+
+def inject_latency(latency_millis:float, latency_jitter:float, key:str):
+    """
+    Sleeps for `latency_millis`, varied by up to +/- `latency_jitter` (a fraction of
+    `latency_millis`). The jitter is derived from the given key, so that repeated runs
+    over the same inputs sleep for the same durations.
+    """
+    if latency_millis <= 0:
+        return
+    jitter = 0.0
+    if latency_jitter > 0:
+        jitter = latency_jitter * (2 * random.Random(zlib.crc32(key.encode('utf-8'))).random() - 1)
+    time.sleep(max(0.0, latency_millis * (1 + jitter)) / 1000)
+
+def _classify(entity:str) -> str:
+    return MOCK_ENTITY_CLASSIFICATIONS[zlib.crc32(entity.encode('utf-8')) % len(MOCK_ENTITY_CLASSIFICATIONS)]
+
+def _mock_propositions(text:str) -> str:
+    propositions = []
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        if sentence and sentence not in propositions:
+            propositions.append(sentence)
+    return '\n'.join(propositions)
+
+def _mock_topics(text:str) -> str:
+    propositions = [p.strip() for p in text.split('\n') if p.strip()]
+    lines = []
+
+    for i in range(0, len(propositions), MAX_PROPOSITIONS_PER_TOPIC):
+        topic_propositions = propositions[i:i + MAX_PROPOSITIONS_PER_TOPIC]
+        topic_entities = []
+        for proposition in topic_propositions:
+            for entity in _ENTITY.findall(proposition):
+                if entity not in topic_entities:
+                    topic_entities.append(entity)
+
+        lines.append(f'topic: {topic_entities[0] if topic_entities else "General"}')
+        lines.append('  entities:')
+        lines.extend(f'    {entity}|{_classify(entity)}' for entity in topic_entities)
+
+        for proposition in topic_propositions:
+            entities = list(dict.fromkeys(_ENTITY.findall(proposition)))
+            lines.append(f'  proposition: {proposition}')
+            lines.append('    entity-entity relationships:')
+            lines.extend(f'    {s}|RELATED_TO|{o}' for (s, o) in zip(entities, entities[1:]))
+            lines.append('    entity-attributes:')
+            lines.extend(f'    {entity}|MENTION_COUNT|{proposition.count(entity)}' for entity in entities)
+
+        lines.append('')
+
+    return '\n'.join(lines)
+
+def mock_extraction_response(prompt:str) -> str:
+    """
+    Returns a deterministic response to a proposition or topic extraction prompt.
+
+    A proposition extraction prompt is answered with the sentences of the `<text>`
+    section, one per line. A topic extraction prompt is answered with topics of up to
+    five of the propositions in the `<propositions>` section, with capitalized words and
+    phrases treated as entities, and consecutive entities in each proposition related to
+    one another.
+    """
+    propositions = _PROPOSITIONS.search(prompt)
+    if propositions:
+        return _mock_topics(propositions.group(1))
+    text = _TEXT.search(prompt)
+    return _mock_propositions(text.group(1) if text else prompt)
+
+
+class MockExtractionLLM(CustomLLM):
+    """
+    A deterministic, offline stand-in for the extraction LLM.
+
+    Responses are derived from the prompt (see `mock_extraction_response()`), and are
+    returned after an injected latency. Each completion is published as a
+    `benchmark.llm` span, with the prompt and response sizes in bytes.
+
+    Attributes:
+        model (str): The model name.
+        latency_millis (float): The latency injected into each completion, in milliseconds.
+        latency_jitter (float): The maximum variation of the injected latency, as a
+            fraction of `latency_millis`.
+    """
+    model: str = Field(default='mock-extraction-llm')
+    latency_millis: float = Field(default=0.0)
+    latency_jitter: float = Field(default=0.0)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return 'MockExtractionLLM'
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name=self.model, is_chat_model=False)
+
+    def _complete(self, prompt:str) -> str:
+        response = mock_extraction_response(prompt)
+        with trace_span(
+            'benchmark.llm',
+            prompt_bytes=len(prompt.encode('utf-8')),
+            response_bytes=len(response.encode('utf-8')),
+            max_rss_kb=max_rss_kb()
+        ):
+            inject_latency(self.latency_millis, self.latency_jitter, prompt)
+        return response
+
+    @llm_completion_callback()
+    def complete(self, prompt:str, formatted:bool=False, **kwargs:Any) -> CompletionResponse:
+        return CompletionResponse(text=self._complete(prompt))
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt:str, formatted:bool=False, **kwargs:Any) -> CompletionResponseGen:
+        response = self._complete(prompt)
+        def gen() -> CompletionResponseGen:
+            yield CompletionResponse(text=response, delta=response)
+        return gen()
+
+
+class MockEmbedding(BaseEmbedding):
+    """
+    A deterministic, offline stand-in for the embedding model.
+
+    Each text is embedded as a unit-length pseudo-random vector seeded from the text, so
+    that the same text always has the same embedding. Latency is injected once per
+    batch of texts, and each batch is published as a `benchmark.embedding` span.
+
+    Attributes:
+        dimensions (int): The number of dimensions of each embedding.
+        latency_millis (float): The latency injected into each batch, in milliseconds.
+        latency_jitter (float): The maximum variation of the injected latency, as a
+            fraction of `latency_millis`.
+    """
+    model_name: str = Field(default='mock-embedding')
+    dimensions: int = Field(default=1024)
+    latency_millis: float = Field(default=0.0)
+    latency_jitter: float = Field(default=0.0)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return 'MockEmbedding'
+
+    def _embed(self, texts:List[str]) -> List[List[float]]:
+        with trace_span(
+            'benchmark.embedding',
+            num_texts=len(texts),
+            text_bytes=sum(len(text.encode('utf-8')) for text in texts),
+            max_rss_kb=max_rss_kb()
+        ):
+            inject_latency(self.latency_millis, self.latency_jitter, texts[0] if texts else '')
+        embeddings = []
+        for text in texts:
+            vector = np.random.default_rng(zlib.crc32(text.encode('utf-8'))).standard_normal(self.dimensions)
+            embeddings.append((vector / np.linalg.norm(vector)).tolist())
+        return embeddings
+
+    def _get_query_embedding(self, query:str) -> List[float]:
+        return self._embed([query])[0]
+
+    async def _aget_query_embedding(self, query:str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text:str) -> List[float]:
+        return self._embed([text])[0]
+
+    def _get_text_embeddings(self, texts:List[str]) -> List[List[float]]:
+        return self._embed(texts)
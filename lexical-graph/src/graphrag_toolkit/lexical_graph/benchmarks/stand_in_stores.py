@@ -0,0 +1,102 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from typing import Any, Optional
+
+from graphrag_toolkit.lexical_graph.config import GraphRAGConfig, EmbeddingType
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
+from graphrag_toolkit.lexical_graph.storage.constants import DEFAULT_EMBEDDING_INDEXES
+from graphrag_toolkit.lexical_graph.storage.graph.dummy_graph_store import DummyGraphStore
+from graphrag_toolkit.lexical_graph.storage.vector import VectorStore
+from graphrag_toolkit.lexical_graph.storage.vector.dummy_vector_index import DummyVectorIndex
+from graphrag_toolkit.lexical_graph.benchmarks.mock_models import inject_latency, max_rss_kb
+
+from llama_index.core.bridge.pydantic import Field
+from llama_index.core.indices.utils import embed_nodes
+from llama_index.core.schema import MetadataMode
+
+logger = logging.getLogger(__name__)
+
+class BenchmarkGraphStore(DummyGraphStore):
+    """
+    An in-process stand-in for a graph store, for use in benchmarks.
+
+    Queries are not executed. Instead, each query is serialized (the query text plus its
+    JSON-encoded parameters), as it would be for a remote store, and is published as a
+    `benchmark.graph_store` span with the size of the request in bytes, after an
+    injected latency.
+
+    Attributes:
+        latency_millis (float): The latency injected into each query, in milliseconds.
+        latency_jitter (float): The maximum variation of the injected latency, as a
+            fraction of `latency_millis`.
+    """
+    latency_millis: float = Field(default=0.0)
+    latency_jitter: float = Field(default=0.0)
+
+    def _execute_query(self, cypher, parameters={}, correlation_id=None):
+        query_bytes = len(cypher.encode('utf-8')) + len(json.dumps(parameters, default=str).encode('utf-8'))
+        with trace_span('benchmark.graph_store', query_bytes=query_bytes, max_rss_kb=max_rss_kb()):
+            inject_latency(self.latency_millis, self.latency_jitter, cypher)
+            return super()._execute_query(cypher, parameters, correlation_id)
+
+
+class BenchmarkVectorIndex(DummyVectorIndex):
+    """
+    An in-process stand-in for a vector index, for use in benchmarks.
+
+    Nodes added to the index are embedded with the embedding model and serialized to
+    JSON documents, as they would be for a remote index, but are not stored. Each write
+    is published as a `benchmark.vector_store` span with the size of its payload in
+    bytes, after an injected latency.
+
+    Attributes:
+        embed_model (Optional[EmbeddingType]): The embedding model. Defaults to
+            `GraphRAGConfig.embed_model`.
+        latency_millis (float): The latency injected into each write, in milliseconds.
+        latency_jitter (float): The maximum variation of the injected latency, as a
+            fraction of `latency_millis`.
+    """
+    embed_model: Optional[Any] = Field(default=None)
+    latency_millis: float = Field(default=0.0)
+    latency_jitter: float = Field(default=0.0)
+
+    def add_embeddings(self, nodes):
+        if not nodes:
+            return nodes
+
+        id_to_embed_map = embed_nodes(nodes, self.embed_model or GraphRAGConfig.embed_model)
+
+        payload_bytes = 0
+        for node in nodes:
+            node.embedding = id_to_embed_map[node.node_id]
+            document = {
+                'id': node.node_id,
+                'embedding': node.embedding,
+                'value': node.get_content(metadata_mode=MetadataMode.NONE),
+                'metadata': node.metadata
+            }
+            payload_bytes += len(json.dumps(document, default=str).encode('utf-8'))
+
+        with trace_span('benchmark.vector_store', index=self.index_name, num_nodes=len(nodes), payload_bytes=payload_bytes, max_rss_kb=max_rss_kb()):
+            inject_latency(self.latency_millis, self.latency_jitter, nodes[0].node_id)
+
+        return nodes
+
+
+def benchmark_vector_store(embed_model:Optional[EmbeddingType]=None, latency_millis:float=0.0, latency_jitter:float=0.0) -> VectorStore:
+    """
+    Returns a vector store comprising a `BenchmarkVectorIndex` for each of the default
+    embedding indexes.
+    """
+    return VectorStore(indexes={
+        index_name: BenchmarkVectorIndex(
+            index_name=index_name,
+            embed_model=embed_model,
+            latency_millis=latency_millis,
+            latency_jitter=latency_jitter
+        )
+        for index_name in DEFAULT_EMBEDDING_INDEXES
+    })
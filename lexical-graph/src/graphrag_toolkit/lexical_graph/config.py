@@ -36,6 +36,7 @@ DEFAULT_RESPONSE_MODEL = 'us.anthropic.claude-3-7-sonnet-20250219-v1:0'
 DEFAULT_EMBEDDINGS_MODEL = 'cohere.embed-english-v3'
 DEFAULT_RERANKING_MODEL = 'mixedbread-ai/mxbai-rerank-xsmall-v1'
 DEFAULT_BEDROCK_RERANKING_MODEL = 'cohere.rerank-v3-5:0'
+DEFAULT_RERANKING_SCORE_CACHE_SIZE = 10000
 DEFAULT_EMBEDDINGS_DIMENSIONS = 1024
 DEFAULT_EXTRACTION_NUM_WORKERS = 2
 DEFAULT_EXTRACTION_BATCH_SIZE = 4
@@ -43,15 +44,24 @@ DEFAULT_EXTRACTION_NUM_THREADS_PER_WORKER = 4
 DEFAULT_BUILD_NUM_WORKERS = 2
 DEFAULT_BUILD_BATCH_SIZE = 4
 DEFAULT_BUILD_BATCH_WRITE_SIZE = 25
+DEFAULT_BUILD_BATCH_WRITE_CONCURRENCY = 4
 DEFAULT_BATCH_WRITES_ENABLED = True
 DEFAULT_INCLUDE_DOMAIN_LABELS = False
 DEFAULT_INCLUDE_LOCAL_ENTITIES = False
 DEFAULT_INCLUDE_CLASSIFICATION_IN_ENTITY_ID = True
 DEFAULT_ENABLE_CACHE = False
+DEFAULT_LLM_CACHE_BACKEND = 'file'
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 0
+DEFAULT_LLM_CACHE_TTL = 0
+DEFAULT_LLM_MAX_CONCURRENT_REQUESTS = 0
+DEFAULT_QUERY_EMBEDDING_CACHE_SIZE = 10000
+DEFAULT_STATEMENT_EMBEDDING_CACHE_SIZE = 50000
+DEFAULT_NEPTUNE_PLAN_CACHE_ENABLED = True
 DEFAULT_METADATA_DATETIME_SUFFIXES = ['_date', '_datetime']
 DEFAULT_OPENSEARCH_ENGINE = 'nmslib'
 DEFAULT_ENABLE_VERSIONING = False
 DEFAULT_CHUNK_EXTERNAL_PROPERTIES = None
+DEFAULT_EXTRACT_BUILD_QUEUE_DEPTH = 8
 
 def _is_json_string(s):
     """
@@ -276,21 +286,31 @@ class _GraphRAGConfig:
     _embed_dimensions: Optional[int] = None
     _reranking_model: Optional[str] = None
     _bedrock_reranking_model: Optional[str] = None
+    _reranking_score_cache_size: Optional[int] = None
     _extraction_num_workers: Optional[int] = None
     _extraction_num_threads_per_worker: Optional[int] = None
     _extraction_batch_size: Optional[int] = None
     _build_num_workers: Optional[int] = None
     _build_batch_size: Optional[int] = None
     _build_batch_write_size: Optional[int] = None
+    _build_batch_write_concurrency: Optional[int] = None
     _batch_writes_enabled: Optional[bool] = None
     _include_domain_labels: Optional[bool] = None
     _include_local_entities: Optional[bool] = None
     _include_classification_in_entity_id: Optional[bool] = None
     _enable_cache: Optional[bool] = None
+    _llm_cache_backend: Optional[str] = None
+    _llm_cache_max_entries: Optional[int] = None
+    _llm_cache_ttl: Optional[int] = None
+    _llm_max_concurrent_requests: Optional[int] = None
+    _query_embedding_cache_size: Optional[int] = None
+    _statement_embedding_cache_size: Optional[int] = None
+    _neptune_plan_cache_enabled: Optional[bool] = None
     _metadata_datetime_suffixes: Optional[List[str]] = None
     _opensearch_engine: Optional[str] = None
     _enable_versioning = None
     _chunk_external_properties: Optional[Dict[str, str]] = None
+    _extract_build_queue_depth: Optional[int] = None
 
     @contextlib.contextmanager
     def _validate_sso_token(self, profile):
@@ -701,6 +721,46 @@ class _GraphRAGConfig:
         """
         self._build_batch_write_size = batch_size
 
+    @property
+    def build_batch_write_concurrency(self) -> int:
+        """
+        Gets the maximum number of batches of a single graph query that each build worker
+        writes concurrently to the graph store when batch writes are enabled.
+
+        Returns:
+            int: The number of concurrent batch writes per query.
+        """
+        if self._build_batch_write_concurrency is None:
+            self.build_batch_write_concurrency = int(os.environ.get('BUILD_BATCH_WRITE_CONCURRENCY', DEFAULT_BUILD_BATCH_WRITE_CONCURRENCY))
+
+        return self._build_batch_write_concurrency
+
+    @build_batch_write_concurrency.setter
+    def build_batch_write_concurrency(self, concurrency: int) -> None:
+        self._build_batch_write_concurrency = concurrency
+
+    @property
+    def extract_build_queue_depth(self) -> int:
+        """
+        Gets the maximum number of extracted source documents that can be buffered
+        between the extract and build stages when running `extract_and_build()`.
+
+        The extract stage runs ahead of the build stage until this many documents are
+        waiting to be built, at which point it blocks. A value of 0 disables overlapping
+        of the two stages.
+
+        Returns:
+            int: The queue depth between the extract and build stages.
+        """
+        if self._extract_build_queue_depth is None:
+            self.extract_build_queue_depth = int(os.environ.get('EXTRACT_BUILD_QUEUE_DEPTH', DEFAULT_EXTRACT_BUILD_QUEUE_DEPTH))
+
+        return self._extract_build_queue_depth
+
+    @extract_build_queue_depth.setter
+    def extract_build_queue_depth(self, queue_depth: int) -> None:
+        self._extract_build_queue_depth = queue_depth
+
     @property
     def batch_writes_enabled(self) -> bool:
         """
@@ -814,6 +874,129 @@ class _GraphRAGConfig:
         """
         self._enable_cache = enable_cache
 
+    @property
+    def llm_cache_backend(self) -> str:
+        """
+        Gets the store used to hold cached LLM responses when `enable_cache` is True:
+        'file' (one file per response in the `cache/llm` directory) or 'sqlite' (a single
+        embedded database at `cache/llm_cache.db`, with optional size bound and expiry).
+
+        Returns:
+            str: The LLM cache backend type.
+        """
+        if self._llm_cache_backend is None:
+            self.llm_cache_backend = os.environ.get('LLM_CACHE_BACKEND', DEFAULT_LLM_CACHE_BACKEND)
+        return self._llm_cache_backend
+
+    @llm_cache_backend.setter
+    def llm_cache_backend(self, backend: str) -> None:
+        self._llm_cache_backend = backend
+
+    @property
+    def llm_cache_max_entries(self) -> int:
+        """
+        Gets the maximum number of responses retained by the 'sqlite' LLM cache backend.
+        Least-recently-used responses are evicted first. 0 means unbounded.
+
+        Returns:
+            int: The maximum number of cached responses.
+        """
+        if self._llm_cache_max_entries is None:
+            self.llm_cache_max_entries = int(os.environ.get('LLM_CACHE_MAX_ENTRIES', DEFAULT_LLM_CACHE_MAX_ENTRIES))
+        return self._llm_cache_max_entries
+
+    @llm_cache_max_entries.setter
+    def llm_cache_max_entries(self, max_entries: int) -> None:
+        self._llm_cache_max_entries = max_entries
+
+    @property
+    def llm_cache_ttl(self) -> int:
+        """
+        Gets the time-to-live, in seconds, of cached LLM responses. Expired responses are
+        treated as cache misses. 0 means responses never expire.
+
+        Returns:
+            int: The cached response time-to-live in seconds.
+        """
+        if self._llm_cache_ttl is None:
+            self.llm_cache_ttl = int(os.environ.get('LLM_CACHE_TTL', DEFAULT_LLM_CACHE_TTL))
+        return self._llm_cache_ttl
+
+    @llm_cache_ttl.setter
+    def llm_cache_ttl(self, ttl: int) -> None:
+        self._llm_cache_ttl = ttl
+
+    @property
+    def llm_max_concurrent_requests(self) -> int:
+        """
+        Gets the maximum number of concurrent requests that each process issues to a
+        single model via `LLMCache`. 0 means unbounded.
+
+        Returns:
+            int: The maximum number of concurrent requests per model.
+        """
+        if self._llm_max_concurrent_requests is None:
+            self.llm_max_concurrent_requests = int(os.environ.get('LLM_MAX_CONCURRENT_REQUESTS', DEFAULT_LLM_MAX_CONCURRENT_REQUESTS))
+        return self._llm_max_concurrent_requests
+
+    @llm_max_concurrent_requests.setter
+    def llm_max_concurrent_requests(self, max_concurrent_requests: int) -> None:
+        self._llm_max_concurrent_requests = max_concurrent_requests
+
+    @property
+    def query_embedding_cache_size(self) -> int:
+        """
+        Gets the maximum number of query embeddings held in each process's in-memory
+        query embedding cache. Least-recently-used embeddings are evicted first. 0
+        disables the cache.
+
+        Returns:
+            int: The maximum number of cached query embeddings.
+        """
+        if self._query_embedding_cache_size is None:
+            self.query_embedding_cache_size = int(os.environ.get('QUERY_EMBEDDING_CACHE_SIZE', DEFAULT_QUERY_EMBEDDING_CACHE_SIZE))
+        return self._query_embedding_cache_size
+
+    @query_embedding_cache_size.setter
+    def query_embedding_cache_size(self, cache_size: int) -> None:
+        self._query_embedding_cache_size = cache_size
+
+    @property
+    def statement_embedding_cache_size(self) -> int:
+        """
+        Gets the maximum number of statement embeddings held in the shared embedding
+        cache used by semantic-guided search. Least-recently-used embeddings are evicted
+        first.
+
+        Returns:
+            int: The maximum number of cached statement embeddings.
+        """
+        if self._statement_embedding_cache_size is None:
+            self.statement_embedding_cache_size = int(os.environ.get('STATEMENT_EMBEDDING_CACHE_SIZE', DEFAULT_STATEMENT_EMBEDDING_CACHE_SIZE))
+        return self._statement_embedding_cache_size
+
+    @statement_embedding_cache_size.setter
+    def statement_embedding_cache_size(self, cache_size: int) -> None:
+        self._statement_embedding_cache_size = cache_size
+
+    @property
+    def neptune_plan_cache_enabled(self) -> bool:
+        """
+        Gets whether Neptune Analytics queries that are safe to plan-cache are executed
+        with the query plan cache enabled. A query is safe to plan-cache if its values are
+        passed as parameters, or if its inlined literal values do not vary between executions.
+
+        Returns:
+            bool: True if the query plan cache is used for plan-cacheable queries.
+        """
+        if self._neptune_plan_cache_enabled is None:
+            self.neptune_plan_cache_enabled = string_to_bool(os.environ.get('NEPTUNE_PLAN_CACHE_ENABLED'), DEFAULT_NEPTUNE_PLAN_CACHE_ENABLED)
+        return self._neptune_plan_cache_enabled
+
+    @neptune_plan_cache_enabled.setter
+    def neptune_plan_cache_enabled(self, neptune_plan_cache_enabled: bool) -> None:
+        self._neptune_plan_cache_enabled = neptune_plan_cache_enabled
+
     @property
     def metadata_datetime_suffixes(self) -> List[str]:
         """
@@ -1150,6 +1333,24 @@ class _GraphRAGConfig:
     def bedrock_reranking_model(self, bedrock_reranking_model: str) -> None:
         self._bedrock_reranking_model = bedrock_reranking_model
 
+    @property
+    def reranking_score_cache_size(self) -> int:
+        """
+        Gets the maximum number of (query, statement) reranking scores held in each
+        process's in-memory score cache. Least-recently-used scores are evicted first.
+        0 disables the cache.
+
+        Returns:
+            int: The maximum number of cached reranking scores.
+        """
+        if self._reranking_score_cache_size is None:
+            self.reranking_score_cache_size = int(os.environ.get('RERANKING_SCORE_CACHE_SIZE', DEFAULT_RERANKING_SCORE_CACHE_SIZE))
+        return self._reranking_score_cache_size
+
+    @reranking_score_cache_size.setter
+    def reranking_score_cache_size(self, cache_size: int) -> None:
+        self._reranking_score_cache_size = cache_size
+
     @property
     def opensearch_engine(self) -> str:
         if self._opensearch_engine is None:
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from .node_handler import NodeHandler
-from .utils.pipeline_utils import sink
+from .utils.pipeline_utils import sink, prefetch
 from .utils.metadata_utils import last_accessed_date
 from .id_generator import IdGenerator
 from . import build
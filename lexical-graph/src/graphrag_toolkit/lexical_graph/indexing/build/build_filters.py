@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Callable, Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 
 from graphrag_toolkit.lexical_graph.metadata import MetadataFiltersType, FilterConfig
 from llama_index.core.bridge.pydantic import BaseModel
@@ -116,3 +116,17 @@ class BuildFilters(BaseModel):
         """
         return self.source_filters.filter_source_metadata_dictionary(d)
 
+    def filter_source_metadata_dictionaries(self, ds:List[Dict[str, Any]]) -> List[bool]:
+        """
+        Filters a list of source metadata dictionaries through the source filters
+        in a single pass.
+
+        Args:
+            ds (List[Dict[str, Any]]): The source metadata dictionaries to be filtered.
+
+        Returns:
+            List[bool]: For each dictionary, in order, True if it passes the filtering
+            criteria, False otherwise.
+        """
+        return self.source_filters.filter_source_metadata_dictionaries(ds)
+
@@ -12,7 +12,8 @@ from graphrag_toolkit.lexical_graph import TenantId
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.metadata import SourceMetadataFormatter, DefaultSourceMetadataFormatter
 from graphrag_toolkit.lexical_graph.indexing import NodeHandler, IdGenerator
-from graphrag_toolkit.lexical_graph.indexing.utils.pipeline_utils import run_pipeline
+from graphrag_toolkit.lexical_graph.indexing.utils.pipeline_utils import PipelineWorkerPool
+from graphrag_toolkit.lexical_graph.utils.fm_observability import start_span
 from graphrag_toolkit.lexical_graph.indexing.model import SourceType, SourceDocument, source_documents_from_source_types
 from graphrag_toolkit.lexical_graph.indexing.build.node_builder import NodeBuilder
 from graphrag_toolkit.lexical_graph.indexing.build.checkpoint import Checkpoint, CheckpointWriter
@@ -52,6 +53,8 @@ class BuildPipeline():
         batch_size (int): Size of batches for processing data. Defaults to a configured batch size.
         batch_writes_enabled (bool): Flag indicating whether batch writes are enabled.
         batch_write_size (int): Size of batches for processing writes. Defaults to a configured size.
+        batch_write_concurrency (int): Number of batches of a single graph query written concurrently.
+        Defaults to a configured value.
         include_domain_labels (bool): Flag indicating whether domain labels should be included.
         node_builders (NodeBuilders): Object that encapsulates the logic for building nodes,
         applying filters, and formatting metadata.
@@ -64,6 +67,7 @@ class BuildPipeline():
                batch_size:Optional[int]=None, 
                batch_writes_enabled:Optional[bool]=None, 
                batch_write_size:Optional[int]=None, 
+               batch_write_concurrency:Optional[int]=None,
                builders:Optional[List[NodeBuilder]]=None, 
                show_progress=False, 
                checkpoint:Optional[Checkpoint]=None,
@@ -91,6 +95,8 @@ class BuildPipeline():
             processing. Defaults to None.
             batch_write_size (Optional[int]): Size of data batches for write operations,
             applicable if batching is enabled. Defaults to None.
+            batch_write_concurrency (Optional[int]): Number of batches of a single graph
+            query written concurrently, applicable if batching is enabled. Defaults to None.
             builders (Optional[List[NodeBuilder]]): Optional list of node builders if specific
             building structures are required. Defaults to an empty list.
             show_progress (bool): Flag indicating whether to show progress during processing.
@@ -121,6 +127,7 @@ class BuildPipeline():
                 batch_size=batch_size,
                 batch_writes_enabled=batch_writes_enabled,
                 batch_write_size=batch_write_size,
+                batch_write_concurrency=batch_write_concurrency,
                 builders=builders,
                 show_progress=show_progress,
                 checkpoint=checkpoint,
@@ -140,6 +147,7 @@ class BuildPipeline():
                  batch_size:Optional[int]=None, 
                  batch_writes_enabled:Optional[bool]=None, 
                  batch_write_size:Optional[int]=None, 
+                 batch_write_concurrency:Optional[int]=None,
                  builders:Optional[List[NodeBuilder]]=None, 
                  show_progress=False, 
                  checkpoint:Optional[Checkpoint]=None,
@@ -168,6 +176,8 @@ class BuildPipeline():
             during processing. Defaults to a preconfigured value.
             batch_write_size (Optional[int]): Specifies the number of items to include in each
             batch write operation. Defaults to a preconfigured value.
+            batch_write_concurrency (Optional[int]): Specifies the number of batches of a single
+            graph query written concurrently. Defaults to a preconfigured value.
             builders (Optional[List[NodeBuilder]]): A list of node builders used for node creation
             in the pipeline. Defaults to an empty list.
             show_progress (bool): Whether to display progress updates during processing.
@@ -192,6 +202,7 @@ class BuildPipeline():
         batch_size = batch_size or GraphRAGConfig.build_batch_size
         batch_writes_enabled = batch_writes_enabled or GraphRAGConfig.batch_writes_enabled
         batch_write_size = batch_write_size or GraphRAGConfig.build_batch_write_size
+        batch_write_concurrency = batch_write_concurrency or GraphRAGConfig.build_batch_write_concurrency
         include_domain_labels = include_domain_labels or GraphRAGConfig.include_domain_labels
         include_local_entities = include_local_entities or GraphRAGConfig.include_local_entities
         include_classification_in_entity_id = include_classification_in_entity_id or GraphRAGConfig.include_classification_in_entity_id
@@ -221,6 +232,7 @@ class BuildPipeline():
         self.batch_size = batch_size
         self.batch_writes_enabled = batch_writes_enabled
         self.batch_write_size = batch_write_size
+        self.batch_write_concurrency = batch_write_concurrency
         self.include_domain_labels = include_domain_labels
         self.include_local_entities = include_local_entities
         self.node_builders = NodeBuilders(
@@ -291,30 +303,45 @@ class BuildPipeline():
         """
         input_source_documents = source_documents_from_source_types(inputs)
 
-        for source_documents in iter_batch(input_source_documents, self.batch_size):
+        worker_pool = PipelineWorkerPool(
+            self.inner_pipeline,
+            num_workers=self.num_workers,
+            span_name='pipeline.build.worker',
+            batch_writes_enabled=self.batch_writes_enabled,
+            batch_size=self.batch_size,
+            batch_write_size=self.batch_write_size,
+            batch_write_concurrency=self.batch_write_concurrency,
+            include_domain_labels=self.include_domain_labels,
+            include_local_entities=self.include_local_entities,
+            **self.pipeline_kwargs
+        )
 
-            build_timestamp = int(time.time() * 1000)
+        with worker_pool:
 
-            num_source_docs_per_batch = math.ceil(len(source_documents)/self.num_workers)
-            source_doc_batches = iter_batch(source_documents, num_source_docs_per_batch)
-            
-            node_batches:List[List[BaseNode]] = self._to_node_batches(source_doc_batches, build_timestamp)
-
-            logger.info(f'Running build pipeline [batch_size: {self.batch_size}, num_workers: {self.num_workers}, job_sizes: {[len(b) for b in node_batches]}, batch_writes_enabled: {self.batch_writes_enabled}, batch_write_size: {self.batch_write_size}]')
-
-            output_nodes = run_pipeline(
-                self.inner_pipeline,
-                node_batches,
-                num_workers=self.num_workers,
-                batch_writes_enabled=self.batch_writes_enabled,
-                batch_size=self.batch_size,
-                batch_write_size=self.batch_write_size,
-                include_domain_labels=self.include_domain_labels,
-                include_local_entities=self.include_local_entities,
-                versioning_timestamp=build_timestamp,
-                **self.pipeline_kwargs
-            )
+            for source_documents in iter_batch(input_source_documents, self.batch_size):
+
+                build_timestamp = int(time.time() * 1000)
+
+                num_source_docs_per_batch = math.ceil(len(source_documents)/self.num_workers)
+                source_doc_batches = iter_batch(source_documents, num_source_docs_per_batch)
+                
+                node_batches:List[List[BaseNode]] = self._to_node_batches(source_doc_batches, build_timestamp)
+
+                logger.info(f'Running build pipeline [batch_size: {self.batch_size}, num_workers: {self.num_workers}, job_sizes: {[len(b) for b in node_batches]}, batch_writes_enabled: {self.batch_writes_enabled}, batch_write_size: {self.batch_write_size}, batch_write_concurrency: {self.batch_write_concurrency}]')
+
+                # the span is held open across yields, so it is started (and passed to
+                # the workers) explicitly rather than made the current span
+                span = start_span('pipeline.build', num_nodes=sum(len(b) for b in node_batches))
+                error = None
 
-            for node in output_nodes:
-                yield node       
+                try:
+                    for node in worker_pool.run(node_batches, parent_span=span.context, versioning_timestamp=build_timestamp):
+                        yield node
+                except GeneratorExit:
+                    raise
+                except BaseException as e:
+                    error = type(e).__name__
+                    raise
+                finally:
+                    span.end(error=error)       
 
@@ -3,8 +3,10 @@
 
 import logging
 import os
+import sqlite3
+import threading
 from os.path import join
-from typing import Any, List
+from typing import Any, List, Iterable, Set
 
 from graphrag_toolkit.lexical_graph.tenant_id import TenantId
 from graphrag_toolkit.lexical_graph.indexing.node_handler import NodeHandler
@@ -13,9 +15,128 @@ from graphrag_toolkit.lexical_graph.storage.constants import INDEX_KEY
 from llama_index.core.schema import TransformComponent, BaseNode
 
 SAVEPOINT_ROOT_DIR = 'save_points'
+CHECKPOINT_DB_NAME = 'checkpoints.db'
+CHECKPOINT_COMMIT_SIZE = 1000
+SQLITE_MAX_PARAMS = 900
 
 logger = logging.getLogger(__name__)
 
+class CheckpointStore():
+    """
+    Records checkpointed node ids in a single embedded SQLite database in the checkpoint
+    directory.
+
+    The database is opened in WAL mode so that it can be shared by extract and build
+    worker processes. Membership is checked in bulk, and ids known to be checkpointed are
+    remembered in an in-memory set, so that resuming a large job requires neither a file
+    per node nor a filesystem lookup per node. Ids are added in atomic batches.
+
+    Checkpoint directories created by earlier versions of the lexical-graph, which contain
+    an empty file per checkpointed node, are imported into the database the first time it
+    is opened.
+
+    Attributes:
+        checkpoint_dir (str): Directory containing the checkpoint database.
+    """
+    def __init__(self, checkpoint_dir:str):
+        self.checkpoint_dir = checkpoint_dir
+        self.db_path = join(checkpoint_dir, CHECKPOINT_DB_NAME)
+        self._local = threading.local()
+        self._checkpointed_ids:Set[str] = set()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_local']
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=60.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS checkpoints (node_id TEXT PRIMARY KEY) WITHOUT ROWID')
+            conn.execute('CREATE TABLE IF NOT EXISTS checkpoint_metadata (key TEXT PRIMARY KEY, value TEXT)')
+            self._local.conn = conn
+        return conn
+
+    def import_legacy_checkpoints(self):
+        """
+        Imports the ids of any per-node checkpoint files in the checkpoint directory into
+        the database. The import runs once per checkpoint directory.
+        """
+        conn = self._connection()
+        
+        if conn.execute("SELECT 1 FROM checkpoint_metadata WHERE key = 'legacy_imported'").fetchone():
+            return
+        
+        db_files = {CHECKPOINT_DB_NAME, f'{CHECKPOINT_DB_NAME}-wal', f'{CHECKPOINT_DB_NAME}-shm'}
+
+        with os.scandir(self.checkpoint_dir) as entries:
+            node_ids = [e.name for e in entries if e.is_file() and e.name not in db_files]
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany('INSERT OR IGNORE INTO checkpoints (node_id) VALUES (?)', ((node_id,) for node_id in node_ids))
+            conn.execute("INSERT OR REPLACE INTO checkpoint_metadata (key, value) VALUES ('legacy_imported', ?)", (str(len(node_ids)),))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+        if node_ids:
+            logger.info(f'Imported {len(node_ids)} legacy checkpoint files [checkpoint_dir: {self.checkpoint_dir}]')
+
+    def checkpointed(self, node_ids:Iterable[str]) -> Set[str]:
+        """
+        Returns the subset of the given node ids that have been checkpointed.
+        """
+        with self._lock:
+            known_ids = self._checkpointed_ids
+            results = {node_id for node_id in node_ids if node_id in known_ids}
+            unknown_ids = list({node_id for node_id in node_ids if node_id not in known_ids})
+        
+        if unknown_ids:
+            conn = self._connection()
+            found_ids = set()
+            for i in range(0, len(unknown_ids), SQLITE_MAX_PARAMS):
+                batch = unknown_ids[i:i + SQLITE_MAX_PARAMS]
+                placeholders = ','.join('?' * len(batch))
+                rows = conn.execute(f'SELECT node_id FROM checkpoints WHERE node_id IN ({placeholders})', batch).fetchall()
+                found_ids.update(row[0] for row in rows)
+            with self._lock:
+                self._checkpointed_ids.update(found_ids)
+            results.update(found_ids)
+
+        return results
+
+    def add_all(self, node_ids:Iterable[str]):
+        """
+        Records the given node ids as checkpointed in a single transaction.
+        """
+        node_ids = list(node_ids)
+        if not node_ids:
+            return
+        
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany('INSERT OR IGNORE INTO checkpoints (node_id) VALUES (?)', ((node_id,) for node_id in node_ids))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+        with self._lock:
+            self._checkpointed_ids.update(node_ids)
+
 class DoNotCheckpoint:
     """Represents a placeholder class with no specific implementation.
 
@@ -42,6 +163,7 @@ class CheckpointFilter(TransformComponent, DoNotCheckpoint):
     """
     checkpoint_name:str
     checkpoint_dir:str
+    checkpoint_store:CheckpointStore
     inner:TransformComponent
     tenant_id:TenantId
         
@@ -64,8 +186,7 @@ class CheckpointFilter(TransformComponent, DoNotCheckpoint):
                 indicating the node should be included.
         """
         tenant_node_id = self.tenant_id.rewrite_id(node_id)
-        node_checkpoint_path = join(self.checkpoint_dir, tenant_node_id)
-        if os.path.exists(node_checkpoint_path):
+        if self.checkpoint_store.checkpointed([tenant_node_id]):
             logger.debug(f'Ignoring node because checkpoint already exists [node_id: {tenant_node_id}, checkpoint: {self.checkpoint_name}, component: {type(self.inner).__name__}]')
             return False
         else:
@@ -77,7 +198,7 @@ class CheckpointFilter(TransformComponent, DoNotCheckpoint):
         Filters nodes based on specific criteria and forwards the filtered list to an inner callable.
 
         This method processes a list of nodes, removing nodes that satisfy a particular condition
-        (checkpoint existence). The filtered list is then passed to another callable for further
+        (checkpoint existence, checked in bulk for the whole list). The filtered list is then passed to another callable for further
         processing.
 
         Args:
@@ -89,11 +210,15 @@ class CheckpointFilter(TransformComponent, DoNotCheckpoint):
         """
         discarded_count = 0
         filtered_nodes = []
+
+        tenant_node_ids = [self.tenant_id.rewrite_id(node.id_) for node in nodes]
+        checkpointed_ids = self.checkpoint_store.checkpointed(tenant_node_ids)
         
-        for node in nodes:
-            if self.checkpoint_does_not_exist(node.id_):
+        for node, tenant_node_id in zip(nodes, tenant_node_ids):
+            if tenant_node_id not in checkpointed_ids:
                 filtered_nodes.append(node)
             else:
+                logger.debug(f'Ignoring node because checkpoint already exists [node_id: {tenant_node_id}, checkpoint: {self.checkpoint_name}, component: {type(self.inner).__name__}]')
                 discarded_count += 1
         
         if discarded_count > 0:
@@ -106,24 +231,18 @@ class CheckpointWriter(NodeHandler):
 
     checkpoint_name:str
     checkpoint_dir:str
+    checkpoint_store:CheckpointStore
     inner:NodeHandler
-
-    def touch(self, path):
-        """
-        Creates an empty file or updates the modification and access times
-        of the specified file. If the file does not exist, it is created.
-
-        Args:
-            path (str): The path of the file to be created or modified.
-        """
-        with open(path, 'a'):
-            os.utime(path, None)
     
     def accept(self, nodes: List[BaseNode], **kwargs: Any):
         """
         Processes and categorizes nodes as checkpointable or non-checkpointable based on metadata,
         performing checkpoint-related operations for applicable nodes.
 
+        Checkpointable node ids are committed to the checkpoint store in atomic batches of
+        `CHECKPOINT_COMMIT_SIZE` ids, and when the inner handler has been exhausted. A node
+        is checkpointed only after it has been yielded downstream.
+
         Args:
             nodes (List[BaseNode]): A list of nodes to be processed. Each node contains a unique
                 identifier and associated metadata that determines whether it is checkpointable.
@@ -133,15 +252,23 @@ class CheckpointWriter(NodeHandler):
             BaseNode: Nodes that have been processed and classified. Each node is yielded
                 after logging and performing checkpoint-related operations if applicable.
         """
-        for node in self.inner.accept(nodes, **kwargs):
-            node_id = node.node_id
-            if [key for key in [INDEX_KEY] if key in node.metadata]:
-                logger.debug(f'Non-checkpointable node [checkpoint: {self.checkpoint_name}, node_id: {node_id}, component: {type(self.inner).__name__}]') 
-            else:
-                logger.debug(f'Checkpointable node [checkpoint: {self.checkpoint_name}, node_id: {node_id}, component: {type(self.inner).__name__}]') 
-                node_checkpoint_path = join(self.checkpoint_dir, node_id)
-                self.touch(node_checkpoint_path)
-            yield node
+        pending_node_ids = []
+
+        try:
+            for node in self.inner.accept(nodes, **kwargs):
+                node_id = node.node_id
+                if [key for key in [INDEX_KEY] if key in node.metadata]:
+                    logger.debug(f'Non-checkpointable node [checkpoint: {self.checkpoint_name}, node_id: {node_id}, component: {type(self.inner).__name__}]') 
+                    yield node
+                else:
+                    logger.debug(f'Checkpointable node [checkpoint: {self.checkpoint_name}, node_id: {node_id}, component: {type(self.inner).__name__}]') 
+                    yield node
+                    pending_node_ids.append(node_id)
+                    if len(pending_node_ids) >= CHECKPOINT_COMMIT_SIZE:
+                        self.checkpoint_store.add_all(pending_node_ids)
+                        pending_node_ids = []
+        finally:
+            self.checkpoint_store.add_all(pending_node_ids)
 
 class Checkpoint():
     """
@@ -150,7 +277,9 @@ class Checkpoint():
     This class is used to wrap certain components with checkpointing functionality.
     Checkpoints allow intermediate states or results of data processing components to
     be saved and restored. It can optionally enable or disable checkpointing, and
-    ensures the necessary directory structure is prepared for storing checkpoint files.
+    ensures the necessary directory structure is prepared for storing checkpoints.
+    Checkpointed node ids are recorded in a single `CheckpointStore` database in the
+    checkpoint directory.
 
     Attributes:
         checkpoint_name (str): The name of the checkpoint.
@@ -168,8 +297,12 @@ class Checkpoint():
         """
         self.checkpoint_name = checkpoint_name
         self.checkpoint_dir = self.prepare_output_directories(checkpoint_name, output_dir)
+        self.checkpoint_store = CheckpointStore(self.checkpoint_dir)
         self.enabled = enabled
 
+        if self.enabled:
+            self.checkpoint_store.import_legacy_checkpoints()
+
     def add_filter(self, o, tenant_id:TenantId):
         """
         Adds a checkpoint filter to a transform component if conditions are met.
@@ -189,7 +322,7 @@ class Checkpoint():
         """
         if self.enabled and isinstance(o, TransformComponent) and not isinstance(o, DoNotCheckpoint):
             logger.debug(f'Wrapping with checkpoint filter [checkpoint: {self.checkpoint_name}, component: {type(o).__name__}]')
-            return CheckpointFilter(inner=o, checkpoint_dir=self.checkpoint_dir, checkpoint_name=self.checkpoint_name, tenant_id=tenant_id)
+            return CheckpointFilter(inner=o, checkpoint_dir=self.checkpoint_dir, checkpoint_store=self.checkpoint_store, checkpoint_name=self.checkpoint_name, tenant_id=tenant_id)
         else:
             logger.debug(f'Not wrapping with checkpoint filter [checkpoint: {self.checkpoint_name}, component: {type(o).__name__}]')
             return o
@@ -210,7 +343,7 @@ class Checkpoint():
         """
         if self.enabled and isinstance(o, NodeHandler):
             logger.debug(f'Wrapping with checkpoint writer [checkpoint: {self.checkpoint_name}, component: {type(o).__name__}]')
-            return CheckpointWriter(inner=o, checkpoint_dir=self.checkpoint_dir, checkpoint_name=self.checkpoint_name)
+            return CheckpointWriter(inner=o, checkpoint_dir=self.checkpoint_dir, checkpoint_store=self.checkpoint_store, checkpoint_name=self.checkpoint_name)
         else:
             logger.debug(f'Not wrapping with checkpoint writer [checkpoint: {self.checkpoint_name}, component: {type(o).__name__}]')
             return o
@@ -0,0 +1,151 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from graphrag_toolkit.lexical_graph.indexing.build.graph_batch_client import GraphBatchClient
+
+logger = logging.getLogger(__name__)
+
+UNWIND_PARAMS = 'UNWIND $params AS params'
+FUSABLE_CLAUSE_PREFIXES = ('MERGE ', 'ON CREATE SET ', 'ON MATCH SET ', 'SET ', '//')
+
+PARAMS_REFERENCE_PATTERN = re.compile(r'\bparams\.(\w+)')
+MERGE_LABEL_PATTERN = re.compile(r'MERGE \(\w+:`(\w+)`')
+
+class _Write():
+    def __init__(self, query:Any, properties:Optional[Dict[str, Any]], kwargs:Dict[str, Any]):
+        self.query = query
+        self.properties = properties
+        self.kwargs = kwargs
+        self.body = self._fusable_body()
+
+    def _fusable_body(self) -> Optional[List[str]]:
+        """
+        Returns the clauses following the `UNWIND $params AS params` header if this write
+        can be fused with the other writes for the same node, otherwise None.
+
+        A write is fusable if it is a parameterized string query with exactly one parameter
+        set, and comprises only MERGE and SET clauses. Writes that MERGE two nodes with the
+        same label (e.g. statement-to-previous-statement or chunk-to-chunk links) are not
+        fused: they depend on other nodes of the same type, and so must run after all nodes
+        of that type have been written.
+        """
+        if not isinstance(self.query, str) or not self.properties:
+            return None
+
+        params = self.properties.get('params', [])
+        if len(params) != 1:
+            return None
+
+        lines = [l.strip() for l in self.query.split('\n') if l.strip()]
+
+        comments = [l for l in lines if l.startswith('//')]
+        clauses = [l for l in lines if not l.startswith('//')]
+
+        if not clauses or clauses[0] != UNWIND_PARAMS:
+            return None
+
+        body = clauses[1:]
+
+        if not body or not all(c.startswith(FUSABLE_CLAUSE_PREFIXES) for c in body):
+            return None
+
+        labels = MERGE_LABEL_PATTERN.findall('\n'.join(body))
+        if len(labels) != len(set(labels)):
+            return None
+
+        return comments + body
+
+class FusedGraphClient():
+    """
+    Combines the graph writes issued by all the graph builders for a single node into
+    one composite `UNWIND` query.
+
+    Graph builders typically issue several small MERGE queries for each node: one for the
+    node itself, and one for each of its relationships to other nodes (e.g. a statement's
+    chunk and topic relationships). `FusedGraphClient` stands in for the `GraphBatchClient`
+    while the builders for a node run, collecting their writes. When `flush()` is called,
+    the fusable writes are rewritten into a single query, with the parameters of each
+    constituent write namespaced with a `p<n>_` prefix, and submitted to the underlying
+    batch client with a single parameter set. Nodes of the same type with the same shape
+    produce the same fused query, and so are batched together by the batch client.
+
+    Writes that cannot be fused (query trees, parameterless queries, queries containing
+    MATCH, WITH or UNWIND clauses, and links between nodes of the same type) are passed
+    through to the batch client unchanged, in their original order relative to the fused
+    query.
+
+    Attributes:
+        batch_client (GraphBatchClient): The batch client to which writes are submitted.
+    """
+    def __init__(self, batch_client:GraphBatchClient):
+        self.batch_client = batch_client
+        self.writes:List[_Write] = []
+
+    @property
+    def tenant_id(self):
+        return self.batch_client.tenant_id
+
+    def node_id(self, id_name:str):
+        return self.batch_client.node_id(id_name)
+
+    def property_assigment_fn(self, key:str, value:Any) -> Callable[[str], str]:
+        return self.batch_client.property_assigment_fn(key, value)
+
+    def execute_query_with_retry(self, query:Any, properties:Dict[str, Any], **kwargs):
+        """
+        Records a write issued by a graph builder. The write is not submitted to the batch
+        client until `flush()` is called.
+        """
+        self.writes.append(_Write(query, properties, kwargs))
+
+    def _fuse(self, writes:List[_Write]) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+
+        lines = [f'// fused writes ({len(writes)})', UNWIND_PARAMS]
+        fused_params = {}
+
+        for i, write in enumerate(writes):
+            prefix = f'p{i}_'
+            if i > 0:
+                lines.append('WITH params')
+            for line in write.body:
+                lines.append(PARAMS_REFERENCE_PATTERN.sub(lambda m: f'params.{prefix}{m.group(1)}', line))
+            for key, value in write.properties['params'][0].items():
+                fused_params[f'{prefix}{key}'] = value
+
+        kwargs = {
+            'max_attempts': max(w.kwargs.get('max_attempts', 3) for w in writes),
+            'max_wait': max(w.kwargs.get('max_wait', 5) for w in writes)
+        }
+
+        return ('\n'.join(lines), { 'params': [fused_params] }, kwargs)
+
+    def flush(self):
+        """
+        Submits the writes recorded since the last flush to the batch client, fusing those
+        that can be fused into a single query. The fused query takes the position of the
+        first fusable write.
+        """
+        writes = self.writes
+        self.writes = []
+
+        fusable_writes = [w for w in writes if w.body is not None]
+
+        if len(fusable_writes) < 2:
+            for w in writes:
+                self.batch_client.execute_query_with_retry(w.query, w.properties, **w.kwargs)
+            return
+
+        (fused_query, fused_properties, fused_kwargs) = self._fuse(fusable_writes)
+
+        fused_query_submitted = False
+
+        for w in writes:
+            if w.body is None:
+                self.batch_client.execute_query_with_retry(w.query, w.properties, **w.kwargs)
+            elif not fused_query_submitted:
+                self.batch_client.execute_query_with_retry(fused_query, fused_properties, **fused_kwargs)
+                fused_query_submitted = True
@@ -1,8 +1,11 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import re
 import logging
-from typing import Dict, Any, List, Callable
+import concurrent.futures
+from collections import OrderedDict
+from typing import Dict, Any, List, Callable, Set
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore, Query, QueryTree
 
 BATCH_MAX_ATTEMPTS = 10
@@ -10,6 +13,74 @@ BATCH_MAX_WAIT = 7
 
 logger = logging.getLogger(__name__)
 
+_NODE_PATTERN_PROPERTIES = re.compile(r'\(\s*\w*\s*(?::[^{()]*)?\{([^}]*)\}\s*\)')
+_WHERE_CLAUSE = re.compile(r'\bWHERE\b(.*?)(?=\b(?:MERGE|MATCH|OPTIONAL|SET|RETURN|WITH|CREATE|DELETE|DETACH|REMOVE|UNWIND|CALL)\b|$)', re.DOTALL)
+_PARAMS_REFERENCE = re.compile(r'\bparams\.(\w+)')
+
+def _node_key_params(query:str) -> Set[str]:
+    """
+    Returns the names of the parameters that identify the nodes a query MERGEs or
+    MATCHes: those referenced in node property maps (e.g. `(n:Label {id: params.x})`)
+    and in WHERE clauses (e.g. `WHERE id(n) = params.x`). Parameters referenced only in
+    SET clauses or relationship property maps do not identify nodes.
+    """
+    key_params = set()
+    for properties in _NODE_PATTERN_PROPERTIES.findall(query):
+        key_params.update(_PARAMS_REFERENCE.findall(properties))
+    for condition in _WHERE_CLAUSE.findall(query):
+        key_params.update(_PARAMS_REFERENCE.findall(condition))
+    return key_params
+
+def _group_by_node_keys(query:str, rows:List, batch_write_size:int) -> List[List[List]]:
+    """
+    Partitions the parameter rows of a batched query into groups of chunks, such that all
+    the rows that touch a node with the same key value (for example, two relationships
+    that share an entity, two statements that belong to the same topic, or two
+    `__NEXT__` links that share a fact) are in the same group. Groups can be written
+    concurrently, provided the chunks within each group are written one after another,
+    without two writers MERGE-ing the same node, or relationships on the same node, at
+    the same time.
+    """
+    key_params = _node_key_params(query)
+    parents = list(range(len(rows)))
+
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    if key_params:
+        first_row_for_key = {}
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict):
+                continue
+            for key_param in key_params:
+                if key_param in row:
+                    j = first_row_for_key.setdefault(str(row[key_param]), i)
+                    if j != i:
+                        parents[find(i)] = find(j)
+
+    components = OrderedDict()
+    for i, row in enumerate(rows):
+        components.setdefault(find(i), []).append(row)
+
+    groups = []
+    current_group = []
+    for component in components.values():
+        current_group.extend(component)
+        if len(current_group) >= batch_write_size:
+            groups.append(current_group)
+            current_group = []
+    if current_group:
+        groups.append(current_group)
+
+    return [
+        [group[x:x+batch_write_size] for x in range(0, len(group), batch_write_size)]
+        for group in groups
+    ]
+
+
 class GraphBatchClient():
     """
     Handles batched operations with a graph store client.
@@ -23,10 +94,12 @@ class GraphBatchClient():
             queries and node operations.
         batch_writes_enabled (bool): Flag indicating whether batch writes are enabled.
         batch_write_size (int): The maximum number of entries in a batch.
+        batch_write_concurrency (int): The maximum number of groups of batches of a single
+            query written concurrently. Batches in different groups never touch the same node.
         batches (dict): A mapping of queries to their associated batched parameters.
         all_nodes (list): A collection of all nodes processed for yielding.
     """
-    def __init__(self, graph_client:GraphStore, batch_writes_enabled:bool, batch_write_size:int):
+    def __init__(self, graph_client:GraphStore, batch_writes_enabled:bool, batch_write_size:int, batch_write_concurrency:int=1):
         """
         Initializes an instance of the class that manages the graph client and facilitates
         batch processing of operations, such as writes. This class maintains a reference
@@ -41,10 +114,13 @@ class GraphBatchClient():
                 enabled or not.
             batch_write_size: The number of items to include in a single batch when
                 performing batch operations.
+            batch_write_concurrency: The maximum number of groups of batches of a single
+                query to write concurrently. Defaults to 1.
         """
         self.graph_client = graph_client
         self.batch_writes_enabled = batch_writes_enabled
         self.batch_write_size = batch_write_size
+        self.batch_write_concurrency = max(1, batch_write_concurrency)
         self.batches:Dict[str, List] = {}
         self.query_trees:Dict[str, QueryTree] = {}
         self.all_nodes = []
@@ -168,122 +244,132 @@ class GraphBatchClient():
             for x in range(0, len(parameterless_queries), parameterless_batch_write_size)
         ]
 
-        for parameterless_query_batch in parameterless_query_batches:
+        def apply_parameterless_query_batch(parameterless_query_batch):
             parameterless_query_batch = ['// parameterless queries'] + parameterless_query_batch
             query = '\n'.join(parameterless_query_batch)
             self.graph_client.execute_query_with_retry(query, {}, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
 
-    def _apply_batch_query(self, query, parameters):
-
-        retry_batches = []
-
-        deduped_parameters = self._dedup(parameters)
-        parameter_chunks = [
-            deduped_parameters[x:x+self.batch_write_size] 
-            for x in range(0, len(deduped_parameters), self.batch_write_size)
-        ]
+        # parameterless queries for the same node (e.g. different domain labels for the
+        # same entity) can be in different batches, so the batches are written in order
+        for parameterless_query_batch in parameterless_query_batches:
+            apply_parameterless_query_batch(parameterless_query_batch)
 
-        for p in parameter_chunks:
-            params = {
-                'params': p
-            }
-            try:
-                self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
-            except Exception as e:
-                logger.debug(f'Batch failed - queuing for retry: [query: {query}, params: {params}]')
-                retry_batches.append((query, params))
-
-        failed_batches = []
-
-        for (query, params) in retry_batches:
-            try:
-                self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
-            except Exception as e:
-                logger.debug(f'Retry batch failed - queuing for return: [query: {query}, params: {params}]')
-                failed_batches.append((query, params))
-
-        return failed_batches
-    
-    def _retry_failed_batches(self, failed_batches):
+    def _write_chunk(self, query:str, chunk:List) -> List[Any]:
+        """
+        Writes a chunk of parameters for the given query. If the write fails, the chunk is
+        split in half and each half is written separately, recursively, until either the
+        writes succeed or a single-row write fails, in which case the error is raised.
 
-        last_chance_batches = []
+        Args:
+            query (str): The query to execute.
+            chunk (List): The parameter sets to be written by the query.
 
-        for (query, params) in failed_batches:
-            try:
-                self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
-            except Exception as e:
-                logger.debug(f'Retry failed batch failed - queuing for individual writes retry: [query: {query}, params: {params}]')
-                last_chance_batches.append((query, params))
+        Returns:
+            List[Any]: The results of the query for all the parameter sets in the chunk.
+        """
+        params = {
+            'params': chunk
+        }
+        try:
+            return list(self.graph_client.execute_query_with_retry(query, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT) or [])
+        except Exception as e:
+            if len(chunk) < 2:
+                logger.error(f'Failed single write: [query: {query}, params: {params}, error: {str(e)}]') 
+                raise e
+            midpoint = len(chunk) // 2
+            logger.debug(f'Batch failed - splitting into smaller batches and retrying: [query: {query}, batch_sizes: {[midpoint, len(chunk) - midpoint]}]')
+            results = self._write_chunk(query, chunk[:midpoint])
+            results.extend(self._write_chunk(query, chunk[midpoint:]))
+            return results
+
+    def _write_chunks(self, query:str, chunks:List[List]) -> List[Any]:
+        results = []
+        for chunk in chunks:
+            results.extend(self._write_chunk(query, chunk))
+        return results
+
+    def _apply_batch_query(self, query:str, parameters:List, executor:concurrent.futures.Executor):
 
-        for (query, params) in last_chance_batches:
-            logger.debug('Splitting failed batch into individual writes retrying')
-            failed_params = params['params']
-            for p in failed_params:
-                single_params = {
-                    'params': [p]
-                }
-                try:
-                    self.graph_client.execute_query_with_retry(query, single_params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
-                except Exception as e:
-                    logger.error(f'Failed single write: [query: {query}, params: {params}, error: {str(e)}]') 
-                    raise e    
+        deduped_parameters = self._dedup(parameters)
+        chunk_groups = _group_by_node_keys(query, deduped_parameters, self.batch_write_size)
 
+        self._wait_for_all([
+            executor.submit(self._write_chunks, query, chunks)
+            for chunks in chunk_groups
+        ])
 
-    def _apply_batch_query_tree(self, query_tree_id, parameters):
+    def _apply_batch_query_tree(self, query_tree_id:str, parameters:List, executor:concurrent.futures.Executor):
 
         query_tree = self.query_trees[query_tree_id]
 
         def graph_store_op(q, p):
 
-            all_params = p['params']
+            chunk_groups = _group_by_node_keys(q, p['params'], self.batch_write_size)
 
-            parameter_chunks = [
-                all_params[x:x+self.batch_write_size] 
-                for x in range(0, len(all_params), self.batch_write_size)
+            futures = [
+                executor.submit(self._write_chunks, q, chunks)
+                for chunks in chunk_groups
             ]
+            self._wait_for_all(futures)
 
-            for chunk in parameter_chunks:
-                
-                params = {
-                    'params': chunk
-                }
-
-                results = self.graph_client.execute_query_with_retry(q, params, max_attempts=BATCH_MAX_ATTEMPTS, max_wait=BATCH_MAX_WAIT)
-
-                for r in results:
+            for future in futures:
+                for r in future.result():
                     yield r
 
         for r in query_tree.run(parameters, graph_store_op):
             continue
+
+    def _wait_for_all(self, futures:List[concurrent.futures.Future]):
+        """
+        Waits for all of the given futures to complete, and then raises the first error
+        (in submission order), if any. Waiting for all the futures before raising ensures
+        no writes for the current query are still in flight when the next query starts.
+        """
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
         
     def apply_batch_operations(self):
         """
         Executes batch operations by processing stored queries and parameters, deduplicating
         them, and executing the queries in chunks according to the defined batch size.
 
-        Executes queries in retries to handle transient errors, ensuring robust and reliable
-        execution. Returns the resulting nodes from the performed operations.
+        Queries are applied in the order in which they were first submitted by the graph
+        builders, so that, for example, nodes are written before the relationships that
+        connect them. Query trees are applied after all other queries: the queries in a
+        tree MATCH nodes and relationships written by other queries, some of which (for
+        example, the fused writes of a `FusedGraphClient`, whose text depends on the shape
+        of the fact being written) may first be submitted after the tree. The chunks belonging to an individual query are not independent of
+        one another: different rows often MERGE or MATCH the same entity, topic, chunk or
+        fact node. The rows of each query are therefore grouped so that all the rows that
+        identify the same node are in the same group (see `_group_by_node_keys()`),
+        including the rows of the queries in a query tree. Groups are written
+        concurrently, with up to `batch_write_concurrency` groups in flight at any one time,
+        while the chunks within a group are written one after another. A chunk that fails
+        is split in half and its halves retried, down to single-row writes; this applies
+        to the queries in a query tree as well, whose results are collected and passed
+        to the child queries.
 
         Raises:
-            Any exceptions raised during the execution of queries are managed internally
-            and retried up to the specified maximum attempts.
+            GraphQueryError: If a single-row write fails after all retries.
 
         Returns:
             list: A list of all nodes resulting from the operations.
         """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.batch_write_concurrency) as executor:
 
-        failed_batches = []
+            query_trees = {}
 
-        for query, parameters in self.batches.items():
-
-            if query.startswith('query-tree-'):
-                self._apply_batch_query_tree(query, parameters)
-            else:
-                failed_batches.extend(self._apply_batch_query(query, parameters))
+            for query, parameters in self.batches.items():
+                if query.startswith('query-tree-'):
+                    query_trees[query] = parameters
+                else:
+                    self._apply_batch_query(query, parameters, executor)
 
-        self._apply_parameterless_queries()
+            for query, parameters in query_trees.items():
+                self._apply_batch_query_tree(query, parameters, executor)
 
-        self._retry_failed_batches(failed_batches)
+            self._apply_parameterless_queries()
 
         return self.all_nodes
   
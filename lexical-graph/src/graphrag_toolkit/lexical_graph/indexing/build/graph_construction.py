@@ -8,6 +8,7 @@ from typing import Any, List, Union
 from graphrag_toolkit.lexical_graph.indexing.build.graph_builder import GraphBuilder
 from graphrag_toolkit.lexical_graph.indexing.node_handler import NodeHandler
 from graphrag_toolkit.lexical_graph.indexing.build.graph_batch_client import GraphBatchClient
+from graphrag_toolkit.lexical_graph.indexing.build.fused_graph_client import FusedGraphClient
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.graph_store_factory import GraphStoreFactory
 from graphrag_toolkit.lexical_graph.storage.constants import INDEX_KEY 
@@ -69,6 +70,8 @@ class GraphConstruction(NodeHandler):
         graph_client (GraphStore): The graph client used to perform operations on the graph store.
         builders (List[GraphBuilder]): A collection of graph builders used to process nodes during
             graph construction.
+        fuse_node_writes (bool): Whether the writes issued by all the builders for a node are
+            combined into a single composite query (see `FusedGraphClient`).
     """
     @staticmethod
     def for_graph_store(graph_info:GraphInfoType=None, **kwargs):
@@ -97,6 +100,10 @@ class GraphConstruction(NodeHandler):
         description='Graph builders',
         default_factory=default_builders
     )
+    fuse_node_writes:bool = Field(
+        description='Combine the writes issued by all builders for a node into a single query',
+        default=True
+    )
 
     def accept(self, nodes: List[BaseNode], **kwargs: Any):
         """
@@ -115,6 +122,8 @@ class GraphConstruction(NodeHandler):
                   operations.
                 - batch_write_size (int): Configures the maximum size of each batch for
                   operations.
+                - batch_write_concurrency (int): Configures the maximum number of batches
+                  of a single query written concurrently.
 
         Yields:
             BaseNode: Nodes that have been processed by the builders and subjected to
@@ -134,11 +143,12 @@ class GraphConstruction(NodeHandler):
 
         batch_writes_enabled = kwargs.pop('batch_writes_enabled')
         batch_write_size = kwargs.pop('batch_write_size')
+        batch_write_concurrency = kwargs.pop('batch_write_concurrency', 1)
         
-        logger.debug(f'Batch config: [batch_writes_enabled: {batch_writes_enabled}, batch_write_size: {batch_write_size}]')
+        logger.debug(f'Batch config: [batch_writes_enabled: {batch_writes_enabled}, batch_write_size: {batch_write_size}, batch_write_concurrency: {batch_write_concurrency}]')
         logger.debug(f'Graph construction kwargs: {kwargs}')
 
-        with GraphBatchClient(self.graph_client, batch_writes_enabled=batch_writes_enabled, batch_write_size=batch_write_size) as batch_client:
+        with GraphBatchClient(self.graph_client, batch_writes_enabled=batch_writes_enabled, batch_write_size=batch_write_size, batch_write_concurrency=batch_write_concurrency) as batch_client:
         
             node_iterable = nodes if not self.show_progress else tqdm(nodes, desc=f'Building graph [batch_writes_enabled: {batch_writes_enabled}, batch_write_size: {batch_write_size}]')
 
@@ -154,8 +164,11 @@ class GraphConstruction(NodeHandler):
                         builders = builders_dict.get(index, None)
 
                         if builders:
+                            node_client = FusedGraphClient(batch_client) if self.fuse_node_writes else batch_client
                             for builder in builders:
-                                builder.build(node, batch_client, **kwargs)
+                                builder.build(node, node_client, **kwargs)
+                            if self.fuse_node_writes:
+                                node_client.flush()
                         else:
                             logger.debug(f'No builders for node [index: {index}]')
 
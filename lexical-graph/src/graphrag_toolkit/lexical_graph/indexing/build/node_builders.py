@@ -169,10 +169,14 @@ class NodeBuilders():
 
         results = []
 
+        filter_results = self.build_filters.filter_source_metadata_dictionaries(
+            [node.relationships[NodeRelationship.SOURCE].metadata for node in input_nodes]
+        )
+
         filtered_nodes = [
             node 
-            for node in input_nodes 
-            if self.build_filters.filter_source_metadata_dictionary(node.relationships[NodeRelationship.SOURCE].metadata) 
+            for (node, filter_result) in zip(input_nodes, filter_results)
+            if filter_result
         ]
 
         pre_processed_nodes = [
@@ -12,7 +12,8 @@ from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.versioning import EXTRACT_TIMESTAMP
 from graphrag_toolkit.lexical_graph.indexing import IdGenerator
-from graphrag_toolkit.lexical_graph.indexing.utils.pipeline_utils import run_pipeline, node_batcher
+from graphrag_toolkit.lexical_graph.indexing.utils.pipeline_utils import PipelineWorkerPool, node_batcher
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
 from graphrag_toolkit.lexical_graph.indexing.model import SourceType, SourceDocument, source_documents_from_source_types
 from graphrag_toolkit.lexical_graph.indexing.extract.pipeline_decorator import PipelineDecorator
 from graphrag_toolkit.lexical_graph.indexing.extract.source_doc_parser import SourceDocParser
@@ -370,57 +371,60 @@ class ExtractionPipeline():
 
         input_source_documents = source_documents_from_source_types(inputs)
 
-        for source_documents in iter_batch(input_source_documents, self.batch_size):
+        with PipelineWorkerPool(self.ingestion_pipeline, num_workers=self.num_workers, span_name='pipeline.extract.worker', **self.pipeline_kwargs) as worker_pool:
 
-            for pre_processor in self.pre_processors:
-                source_documents = pre_processor.parse_source_docs(source_documents)
+            for source_documents in iter_batch(input_source_documents, self.batch_size):
 
-            source_documents = self.id_rewriter.handle_source_docs(source_documents)
-            source_documents = self.extraction_decorator.handle_input_docs(source_documents)
+                for pre_processor in self.pre_processors:
+                    source_documents = pre_processor.parse_source_docs(source_documents)
 
-            input_nodes = [
-                n
-                for sd in source_documents
-                for n in sd.nodes
-            ]
+                source_documents = self.id_rewriter.handle_source_docs(source_documents)
+                source_documents = self.extraction_decorator.handle_input_docs(source_documents)
+
+                input_nodes = [
+                    n
+                    for sd in source_documents
+                    for n in sd.nodes
+                ]
             
-            filtered_input_nodes = [
-                node 
-                for node in input_nodes 
-                if self.extraction_filters.filter_source_metadata_dictionary(get_source_metadata(node)) 
-            ]
+                filter_results = self.extraction_filters.filter_source_metadata_dictionaries(
+                    [get_source_metadata(node) for node in input_nodes]
+                )
+
+                filtered_input_nodes = [
+                    node 
+                    for (node, filter_result) in zip(input_nodes, filter_results)
+                    if filter_result
+                ]
 
-            logger.info(f'Running extraction pipeline [batch_size: {self.batch_size}, num_workers: {self.num_workers}]')
+                logger.info(f'Running extraction pipeline [batch_size: {self.batch_size}, num_workers: {self.num_workers}]')
             
-            node_batches = node_batcher(
-                num_batches=self.num_workers, 
-                nodes=filtered_input_nodes
-            )
+                node_batches = node_batcher(
+                    num_batches=self.num_workers, 
+                    nodes=filtered_input_nodes
+                )
                         
-            output_nodes = run_pipeline(
-                self.ingestion_pipeline,
-                node_batches,
-                num_workers=self.num_workers,
-                **self.pipeline_kwargs
-            )
-
-            extract_timestamp = self.extract_timestamp or int(time.time() * 1000)
+                extract_timestamp = self.extract_timestamp or int(time.time() * 1000)
 
-            def add_timestamp(node):
-                if EXTRACT_TIMESTAMP in node.metadata:
+                def add_timestamp(node):
+                    if EXTRACT_TIMESTAMP in node.metadata:
+                        return node
+                    node.metadata[EXTRACT_TIMESTAMP] = extract_timestamp
                     return node
-                node.metadata[EXTRACT_TIMESTAMP] = extract_timestamp
-                return node
 
-            timestamped_nodes = [
-                add_timestamp(node)
-                for node in output_nodes
-            ]
+                with trace_span('pipeline.extract', num_nodes=len(filtered_input_nodes)):
+
+                    output_nodes = worker_pool.run(node_batches)
+
+                    timestamped_nodes = [
+                        add_timestamp(node)
+                        for node in output_nodes
+                    ]
   
-            output_source_documents = self._source_documents_from_base_nodes(timestamped_nodes)
+                output_source_documents = self._source_documents_from_base_nodes(timestamped_nodes)
             
-            for source_document in output_source_documents:
-                yield self.extraction_decorator.handle_output_doc(source_document)
+                for source_document in output_source_documents:
+                    yield self.extraction_decorator.handle_output_doc(source_document)
 
     
    
\ No newline at end of file
@@ -2,11 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-import asyncio
 from typing import List, Optional, Sequence, Dict
 
 from graphrag_toolkit.lexical_graph.utils import LLMCache, LLMCacheType
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
 from graphrag_toolkit.lexical_graph.indexing.model import Propositions
 from graphrag_toolkit.lexical_graph.indexing.constants import PROPOSITIONS_KEY
 from graphrag_toolkit.lexical_graph.indexing.prompts import EXTRACT_PROPOSITIONS_PROMPT
@@ -106,7 +106,8 @@ class LLMPropositionExtractor(BaseExtractor):
         Returns:
             A list of dictionaries containing proposition data for the given nodes.
         """
-        proposition_entries = await self._extract_propositions_for_nodes(nodes)
+        with trace_span('extractor.propositions', num_nodes=len(nodes)):
+            proposition_entries = await self._extract_propositions_for_nodes(nodes)
         return [proposition_entry for proposition_entry in proposition_entries]
     
     async def _extract_propositions_for_nodes(self, nodes):
@@ -181,8 +182,8 @@ propositions: {proposition_collection}
 
         This method interacts with a large language model (LLM) to extract a list of
         unique propositions based on a provided text input. The process involves
-        executing a blocking LLM call in an asynchronous-friendly manner through the
-        use of asyncio's to_thread. The resulting LLM response is then split into
+        awaiting the LLM's asynchronous `apredict()`, which coalesces identical in-flight
+        requests. The resulting LLM response is then split into
         lines, and duplicate propositions are filtered out to ensure uniqueness.
 
         Args:
@@ -192,17 +193,12 @@ propositions: {proposition_collection}
             Propositions: An object containing a list of unique propositions extracted
             from the text.
         """
-        def blocking_llm_call():
-            return self.llm.predict(
-                PromptTemplate(template=self.prompt_template),
-                text=text,
-                source_info=source_info,
-                exclude_cache_keys=['source_info']
-            )
-        
-        coro = asyncio.to_thread(blocking_llm_call)
-        
-        raw_response = await coro
+        raw_response = await self.llm.apredict(
+            PromptTemplate(template=self.prompt_template),
+            text=text,
+            source_info=source_info,
+            exclude_cache_keys=['source_info']
+        )
 
         propositions = raw_response.split('\n')
 
@@ -2,11 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-import asyncio
 from typing import Tuple, List, Optional, Sequence, Dict
 
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.utils import LLMCache, LLMCacheType
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
 from graphrag_toolkit.lexical_graph.indexing.utils.topic_utils import parse_extracted_topics, format_list, format_text
 from graphrag_toolkit.lexical_graph.indexing.extract.preferred_values import PreferredValuesProvider, default_preferred_values
 from graphrag_toolkit.lexical_graph.indexing.model import TopicCollection
@@ -103,7 +103,8 @@ class TopicExtractor(BaseExtractor):
         logger.debug(f'Prompt template: {self.prompt_template}')
     
     async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
-        fact_entries = await self._extract_for_nodes(nodes)
+        with trace_span('extractor.topics', num_nodes=len(nodes)):
+            fact_entries = await self._extract_for_nodes(nodes)
         return [fact_entry for fact_entry in fact_entries]
     
     async def _extract_for_nodes(self, nodes):
@@ -182,8 +183,8 @@ class TopicExtractor(BaseExtractor):
         """
         Asynchronously extracts topics from the given text by calling a Language Learning
         Model (LLM). The function aims to retrieve topics based on the preferred
-        classifications and topics provided. It uses a blocking LLM call in conjunction
-        with asyncio's to_thread method to keep the extraction process non-blocking.
+        classifications and topics provided. It awaits the LLM's asynchronous `apredict()`,
+        which coalesces identical in-flight requests.
         The extracted topics are parsed and returned as a tuple comprising a
         TopicCollection and the remaining unprocessed data.
 
@@ -198,18 +199,13 @@ class TopicExtractor(BaseExtractor):
             Tuple[TopicCollection, List[str]]: A tuple containing a TopicCollection
             object with extracted topics and a list of unprocessed or residual data.
         """
-        def blocking_llm_call():
-            return self.llm.predict(
-                PromptTemplate(template=self.prompt_template),
-                text=text,
-                preferred_entity_classifications=format_list(preferred_entity_classifications),
-                preferred_topics=format_list(preferred_topics),
-                #exclude_cache_keys=['preferred_entity_classifications', 'preferred_topics']
-            )
-        
-        coro = asyncio.to_thread(blocking_llm_call)
-        
-        raw_response = await coro
+        raw_response = await self.llm.apredict(
+            PromptTemplate(template=self.prompt_template),
+            text=text,
+            preferred_entity_classifications=format_list(preferred_entity_classifications),
+            preferred_topics=format_list(preferred_topics),
+            #exclude_cache_keys=['preferred_entity_classifications', 'preferred_topics']
+        )
 
         (topics, garbage) = parse_extracted_topics(raw_response)
         return (topics, garbage)
\ No newline at end of file
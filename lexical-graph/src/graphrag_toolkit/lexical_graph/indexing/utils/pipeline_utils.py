@@ -1,16 +1,29 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import logging
+import pickle
+import queue
+import threading
 from pipe import Pipe
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
-from typing import List, Optional, Sequence, Any, cast, Callable, Generator, Union
+from typing import List, Optional, Sequence, Any, Dict, Callable, Generator, Union
 
 
 from llama_index.core.ingestion import IngestionPipeline
 from llama_index.core.ingestion.pipeline import run_transformations
 from llama_index.core.schema import BaseNode, Document
 
+from graphrag_toolkit.lexical_graph.utils.fm_observability import SpanContext, trace_span, add_span_attributes, current_span_context, get_fm_observability_queue, set_fm_observability_queue
+
+logger = logging.getLogger(__name__)
+
+# Per-process transform installed by the worker pool initializer. Each worker
+# deserializes the pipeline's transformations once, when it starts, and then
+# reuses them for every batch it is given.
+_worker_transform: Optional[Callable[..., List[BaseNode]]] = None
+
 def _sink():
     def _sink_from(generator):
         for item in generator:
@@ -19,6 +32,249 @@ def _sink():
 
 sink = _sink()
 
+_END_OF_STREAM = object()
+
+def prefetch(queue_depth:int):
+    """
+    Returns a pipe that runs the upstream stages in a background thread, handing
+    their output to the downstream stages through a bounded queue.
+
+    This allows an upstream stage (e.g. extraction) to continue producing items
+    while a downstream stage (e.g. build) is consuming previously produced items.
+    The producer blocks when the queue is full, providing backpressure. Exceptions
+    raised by the upstream stages are re-raised in the consuming thread. If the
+    consumer stops early, the producer is stopped and the upstream generator closed.
+
+    Args:
+        queue_depth (int): The maximum number of items buffered between the upstream
+            and downstream stages. A value less than 1 disables prefetching, and items
+            are passed through synchronously.
+
+    Returns:
+        Pipe: A pipe that can be placed between two pipeline stages.
+    """
+    def _prefetch_from(generator):
+
+        if queue_depth < 1:
+            for item in generator:
+                yield item
+            return
+
+        buffer = queue.Queue(maxsize=queue_depth)
+        stopped = threading.Event()
+
+        def put(entry):
+            while not stopped.is_set():
+                try:
+                    buffer.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for item in generator:
+                    if not put((item, None)):
+                        return
+                put((_END_OF_STREAM, None))
+            except BaseException as e:
+                put((_END_OF_STREAM, e))
+            finally:
+                close = getattr(generator, 'close', None)
+                if close:
+                    close()
+
+        producer = threading.Thread(target=produce, name='prefetch-producer', daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                (item, error) = buffer.get()
+                if error is not None:
+                    raise error
+                if item is _END_OF_STREAM:
+                    break
+                yield item
+        finally:
+            stopped.set()
+            while not buffer.empty():
+                try:
+                    buffer.get_nowait()
+                except queue.Empty:
+                    break
+            producer.join()
+
+    return Pipe(_prefetch_from)
+
+def _init_worker(transformations:List[Any], in_place:bool, cache:Any, cache_collection:Optional[str], pipeline_kwargs:Dict[str, Any], observability_queue:Any=None):
+    global _worker_transform
+    if observability_queue is not None:
+        set_fm_observability_queue(observability_queue)
+    _worker_transform = partial(
+        run_transformations,
+        transformations=transformations,
+        in_place=in_place,
+        cache=cache,
+        cache_collection=cache_collection,
+        **pipeline_kwargs
+    )
+
+def _warm_up_worker() -> bool:
+    return _worker_transform is not None
+
+class _NodeBatch():
+    """
+    A batch of nodes passed between the parent process and a worker. The nodes are
+    pickled once, when the batch is itself pickled (or its size is first requested), so
+    that the size of the batch as sent to or returned from a worker can be measured
+    without serializing the nodes a second time.
+    """
+    def __init__(self, nodes:List[BaseNode]):
+        self._nodes = nodes
+        self._data = None
+
+    @property
+    def nodes(self) -> List[BaseNode]:
+        if self._nodes is None:
+            self._nodes = pickle.loads(self._data)
+        return self._nodes
+
+    @property
+    def num_bytes(self) -> int:
+        return len(self._pickled())
+
+    def _pickled(self) -> bytes:
+        if self._data is None:
+            self._data = pickle.dumps(self._nodes, protocol=pickle.HIGHEST_PROTOCOL)
+        return self._data
+
+    def __getstate__(self):
+        return self._pickled()
+
+    def __setstate__(self, data:bytes):
+        self._nodes = None
+        self._data = data
+
+def _run_worker_transform(node_batch:_NodeBatch, batch_kwargs:Dict[str, Any], span_name:str, parent_span:Optional[SpanContext]) -> _NodeBatch:
+    nodes = node_batch.nodes
+    with trace_span(span_name, parent=parent_span, num_nodes=len(nodes), sent_bytes=node_batch.num_bytes):
+        processed_node_batch = _NodeBatch(_worker_transform(nodes, **batch_kwargs))
+        add_span_attributes(returned_bytes=processed_node_batch.num_bytes)
+        return processed_node_batch
+
+
+class PipelineWorkerPool():
+    """
+    A long-lived pool of worker processes that runs an ingestion pipeline's
+    transformations over batches of nodes.
+
+    The pipeline's transformations (and any pipeline-wide keyword arguments) are
+    handed to each worker once, when the worker starts, and are kept in memory for
+    the lifetime of the pool. Subsequent calls to `run` send only the node batches,
+    plus any small per-batch keyword arguments, to the workers. This avoids paying
+    for process startup, module imports, and pickling of the transformations for
+    every batch.
+
+    Workers publish observability events to the parent process's observability queue.
+    Each batch is measured in its worker as a span named `span_name`, whose parent is
+    the span active in the parent process when `run` was called. The span records the
+    pickled size of the batch sent to the worker (`sent_bytes`) and of the processed
+    batch returned from it (`returned_bytes`).
+
+    The pool should be used as a context manager, or closed explicitly with `close`.
+
+    Attributes:
+        num_workers (int): The number of worker processes in the pool.
+        span_name (str): The name of the span measuring each batch.
+    """
+    def __init__(self,
+                 pipeline:IngestionPipeline,
+                 num_workers:int=1,
+                 cache_collection:Optional[str]=None,
+                 in_place:bool=True,
+                 span_name:str='pipeline.batch',
+                 **kwargs:Any):
+        """
+        Initializes the pool. Worker processes are started and warmed up immediately.
+
+        Args:
+            pipeline (IngestionPipeline): The pipeline whose transformations will be run
+                by the workers.
+            num_workers (int): The number of worker processes. Defaults to 1.
+            cache_collection (Optional[str]): Optional cache collection name passed to
+                `run_transformations`.
+            in_place (bool): Whether transformations modify nodes in place. Defaults to True.
+            span_name (str): The name of the span measuring each batch. Defaults to
+                'pipeline.batch'.
+            **kwargs (Any): Pipeline-wide keyword arguments passed to every invocation of
+                the transformations.
+        """
+        self.num_workers = max(1, num_workers)
+        self.span_name = span_name
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=_init_worker,
+            initargs=(
+                pipeline.transformations,
+                in_place,
+                pipeline.cache if not pipeline.disable_cache else None,
+                cache_collection,
+                kwargs,
+                get_fm_observability_queue()
+            )
+        )
+        self._warm_up()
+
+    def _warm_up(self):
+        warm_up_tasks = [self._executor.submit(_warm_up_worker) for _ in range(self.num_workers)]
+        for task in warm_up_tasks:
+            task.result()
+        logger.debug(f'Started worker pool [num_workers: {self.num_workers}]')
+
+    def run(self, node_batches:Sequence[List[BaseNode]], parent_span:Optional[SpanContext]=None, **kwargs:Any) -> Generator[BaseNode, None, None]:
+        """
+        Runs the pipeline's transformations over each batch of nodes in parallel, and
+        yields the processed nodes in batch order.
+
+        Args:
+            node_batches (Sequence[List[BaseNode]]): The batches of nodes to be processed.
+                Each batch is dispatched to a single worker.
+            parent_span (Optional[SpanContext]): The parent of the span measuring each
+                batch. Defaults to the span current when the first node is requested.
+            **kwargs (Any): Per-batch keyword arguments passed to the transformations
+                in addition to the pipeline-wide keyword arguments.
+
+        Yields:
+            BaseNode: The processed nodes.
+        """
+        node_batches = [node_batch for node_batch in node_batches if node_batch]
+
+        processed_node_batches = self._executor.map(
+            _run_worker_transform,
+            [_NodeBatch(node_batch) for node_batch in node_batches],
+            [kwargs] * len(node_batches),
+            [self.span_name] * len(node_batches),
+            [parent_span or current_span_context()] * len(node_batches)
+        )
+
+        for processed_node_batch in processed_node_batches:
+            for processed_node in processed_node_batch.nodes:
+                yield processed_node
+
+    def close(self):
+        """
+        Shuts down the worker processes, waiting for any outstanding work to complete.
+        """
+        self._executor.shutdown(wait=True)
+        logger.debug(f'Stopped worker pool [num_workers: {self.num_workers}]')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
 def run_pipeline(
     pipeline:IngestionPipeline,
     node_batches:List[List[BaseNode]],
@@ -27,21 +283,17 @@ def run_pipeline(
     num_workers: int = 1,
     **kwargs: Any,
 ) -> Sequence[BaseNode]:
-    transform: Callable[[List[BaseNode]], List[BaseNode]] = partial(
-        run_transformations,
-        transformations=pipeline.transformations,
-        in_place=in_place,
-        cache=pipeline.cache if not pipeline.disable_cache else None,
-        cache_collection=cache_collection,
+    with PipelineWorkerPool(
+        pipeline, 
+        num_workers=num_workers, 
+        cache_collection=cache_collection, 
+        in_place=in_place, 
         **kwargs
-    )
-
-    with ProcessPoolExecutor(max_workers=num_workers) as p:
-        processed_node_batches = p.map(transform, node_batches)
+    ) as p:
+        processed_nodes = list(p.run(node_batches))
         
-    for processed_node_batch in processed_node_batches:
-        for processed_node in processed_node_batch:
-            yield processed_node
+    for processed_node in processed_nodes:
+        yield processed_node
 
 def node_batcher(
         num_batches: int, nodes: Union[Sequence[BaseNode], List[Document]]
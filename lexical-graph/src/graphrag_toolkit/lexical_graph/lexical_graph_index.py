@@ -18,7 +18,7 @@ from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import filter_conf
 from graphrag_toolkit.lexical_graph.storage.vector import MultiTenantVectorStore
 from graphrag_toolkit.lexical_graph.indexing.extract import BatchConfig
 from graphrag_toolkit.lexical_graph.indexing import NodeHandler
-from graphrag_toolkit.lexical_graph.indexing import sink
+from graphrag_toolkit.lexical_graph.indexing import sink, prefetch
 from graphrag_toolkit.lexical_graph.indexing.constants import PROPOSITIONS_KEY, DEFAULT_ENTITY_CLASSIFICATIONS
 from graphrag_toolkit.lexical_graph.indexing.extract import PREFERRED_VALUES_PROVIDER_TYPE, default_preferred_values
 from graphrag_toolkit.lexical_graph.indexing.extract import LLMPropositionExtractor, BatchLLMPropositionExtractorSync
@@ -540,6 +540,11 @@ class LexicalGraphIndex():
         of graph and vector indices. This method also supports a checkpoint mechanism and optional
         progress visualization.
 
+        The extract and build stages run concurrently: extraction of the next batch proceeds
+        while the previous batch is written to the graph and vector stores. The number of
+        extracted documents buffered between the two stages is bounded by
+        `GraphRAGConfig.extract_build_queue_depth`.
+
         Args:
             nodes (List[BaseNode], optional): A list of nodes to process. Defaults to an empty list.
             handler (Optional[NodeHandler]): A handler object to manage processed nodes. Defaults to None.
@@ -588,7 +593,7 @@ class LexicalGraphIndex():
         )
 
         sink_fn = sink if not handler else Pipe(handler)
-        nodes | extraction_pipeline | build_pipeline | sink_fn
+        nodes | extraction_pipeline | prefetch(GraphRAGConfig.extract_build_queue_depth) | build_pipeline | sink_fn
 
     def get_stats(self) -> Dict[str, Any]:
 
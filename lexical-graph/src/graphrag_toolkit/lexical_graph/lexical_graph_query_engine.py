@@ -3,10 +3,11 @@
 
 import json
 import yaml
+import asyncio
 import logging
 import time
 from json2xml import json2xml
-from typing import Optional, List, Type, Union
+from typing import Optional, List, Type, Union, Tuple, Any
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.versioning import VersioningConfig, to_versioning_config
@@ -23,7 +24,7 @@ from graphrag_toolkit.lexical_graph.storage import GraphStoreFactory, GraphStore
 from graphrag_toolkit.lexical_graph.storage import VectorStoreFactory, VectorStoreType
 from graphrag_toolkit.lexical_graph.storage.graph import MultiTenantGraphStore
 from graphrag_toolkit.lexical_graph.storage.vector import MultiTenantVectorStore, ReadOnlyVectorStore
-from graphrag_toolkit.lexical_graph.storage.vector import to_embedded_query
+from graphrag_toolkit.lexical_graph.storage.vector import to_embedded_query, to_embedded_query_async
 from graphrag_toolkit.lexical_graph.prompts.prompt_provider_factory import PromptProviderFactory
 
 from llama_index.core import ChatPromptTemplate
@@ -364,6 +365,28 @@ class LexicalGraphQueryEngine(BaseQueryEngine):
             logger.exception(f'Error answering query [query: {query_bundle.query_str}, search_results: {search_results}, additional_context: {additional_context}]')
             raise
 
+    async def _agenerate_response(
+            self,
+            query_bundle: QueryBundle,
+            search_results: str,
+            additional_context: List[str] = []
+    ) -> str:
+        """
+        Asynchronous version of `_generate_response()`.
+        """
+        try:
+            response = await self.llm.apredict(
+                prompt=self.chat_template,
+                query=query_bundle.query_str,
+                search_results=search_results,
+                additionalContext='\n'.join(additional_context),
+                answer_mode='fully' if self.verbose else 'concisely'
+            )
+            return response
+        except Exception:
+            logger.exception(f'Error answering query [query: {query_bundle.query_str}, search_results: {search_results}, additional_context: {additional_context}]')
+            raise
+
     def _generate_streaming_response(
             self,
             query_bundle: QueryBundle,
@@ -475,11 +498,99 @@ class LexicalGraphQueryEngine(BaseQueryEngine):
 
         results = self.retriever.retrieve(query_bundle)
 
+        return self._postprocess_nodes(results, query_bundle)
+     
+    async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """
+        Asynchronous version of `retrieve()`.
+
+        Args:
+            query_bundle: A `QueryBundle` object containing details of the query to be
+                executed. If a string is provided, it is converted into a `QueryBundle`.
+
+        Returns:
+            List[NodeWithScore]: A list of nodes with their corresponding scores, sorted by
+                relevance to the provided query.
+        """
+        query_bundle = QueryBundle(query_bundle) if isinstance(query_bundle, str) else query_bundle
+
+        query_bundle = await to_embedded_query_async(query_bundle, GraphRAGConfig.embed_model)
+
+        results = await self.retriever.aretrieve(query_bundle)
+
+        return await asyncio.to_thread(self._postprocess_nodes, results, query_bundle)
+    
+    def _postprocess_nodes(self, results: List[NodeWithScore], query_bundle: QueryBundle) -> List[NodeWithScore]:
         for post_processor in self.post_processors:
             results = post_processor.postprocess_nodes(results, query_bundle)
-
         return results
      
+    def _get_contexts(self, results: List[NodeWithScore]) -> Tuple[Any, List[str]]:
+        context = self._format_context(results, self.context_format)
+        entity_contexts = self._get_entity_contexts(results)
+        return (context, entity_contexts)
+
+    def _to_response(
+            self,
+            query_bundle: QueryBundle,
+            results: List[NodeWithScore],
+            context: Any,
+            entity_contexts: List[str],
+            answer: Any,
+            start: float,
+            end_retrieve: float,
+            end_postprocessing: float) -> RESPONSE_TYPE:
+        """
+        Builds the response to a query, together with its timing and configuration metadata.
+
+        Args:
+            query_bundle: The embedded query.
+            results: The post-processed source nodes.
+            context: The formatted context passed to the LLM.
+            entity_contexts: The entity contexts passed to the LLM.
+            answer: The generated answer, or a generator of answer tokens if streaming is
+                enabled.
+            start: The time at which query processing started.
+            end_retrieve: The time at which retrieval finished.
+            end_postprocessing: The time at which post-processing finished.
+
+        Returns:
+            Response: A Response (or StreamingResponse if streaming is enabled).
+        """
+        end = time.time()
+
+        retrieve_ms = (end_retrieve - start) * 1000
+        postprocess_ms = (end_postprocessing - end_retrieve) * 1000
+        answer_ms = (end - end_retrieve) * 1000
+        total_ms = (end - start) * 1000
+
+        metadata = {
+            'retrieve_ms': retrieve_ms,
+            'postprocessing_ms': postprocess_ms,
+            'answer_ms': answer_ms,
+            'total_ms': total_ms,
+            'context_format': self.context_format,
+            'retriever': f'{type(self.retriever).__name__}: {self.retriever.__dict__}',
+            'query': query_bundle.query_str,
+            'postprocessors': [type(p).__name__ for p in self.post_processors],
+            'context': context,
+            'entity_contexts': entity_contexts,
+            'num_source_nodes': len(results)
+        }
+
+        if self.streaming:
+            return StreamingResponse(
+                response_gen=answer,
+                source_nodes=results,
+                metadata=metadata
+            )
+        else:
+            return Response(
+                response=answer,
+                source_nodes=results,
+                metadata=metadata
+            )
+
     def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
         """
         Executes a query against the system and processes the results to generate a
@@ -510,58 +621,72 @@ class LexicalGraphQueryEngine(BaseQueryEngine):
 
             end_retrieve = time.time()
 
-            for post_processor in self.post_processors:
-                results = post_processor.postprocess_nodes(results, query_bundle)
+            results = self._postprocess_nodes(results, query_bundle)
 
             end_postprocessing = time.time()
 
-            context = self._format_context(results, self.context_format)
-            entity_contexts = self._get_entity_contexts(results)
+            (context, entity_contexts) = self._get_contexts(results)
             
             if self.streaming:
                 answer = self._generate_streaming_response(query_bundle, context, entity_contexts)
             else:
                 answer = self._generate_response(query_bundle, context, entity_contexts)
 
-            end = time.time()
-
-            retrieve_ms = (end_retrieve - start) * 1000
-            postprocess_ms = (end_postprocessing - end_retrieve) * 1000
-            answer_ms = (end - end_retrieve) * 1000
-            total_ms = (end - start) * 1000
-
-            metadata = {
-                'retrieve_ms': retrieve_ms,
-                'postprocessing_ms': postprocess_ms,
-                'answer_ms': answer_ms,
-                'total_ms': total_ms,
-                'context_format': self.context_format,
-                'retriever': f'{type(self.retriever).__name__}: {self.retriever.__dict__}',
-                'query': query_bundle.query_str,
-                'postprocessors': [type(p).__name__ for p in self.post_processors],
-                'context': context,
-                'entity_contexts': entity_contexts,
-                'num_source_nodes': len(results)
-            }
+            return self._to_response(query_bundle, results, context, entity_contexts, answer, start, end_retrieve, end_postprocessing)
 
-            if self.streaming:
-                return StreamingResponse(
-                    response_gen=answer,
-                    source_nodes=results,
-                    metadata=metadata
-                )
-            else:
-                return Response(
-                    response=answer,
-                    source_nodes=results,
-                    metadata=metadata
-                )
         except Exception as e:
             logger.exception('Error in query processing')
             raise
 
     async def _aquery(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
-        pass
+        """
+        Asynchronous version of `_query()`.
+
+        The query embedding and answer generation use the async APIs of the embedding model
+        and LLM, and retrieval uses the retriever's `aretrieve()`. Work that has no async
+        equivalent – the synchronous graph and vector store clients used by the retrievers,
+        and CPU-bound post-processing – runs on worker threads, so that the event loop can
+        interleave many concurrent queries. The response carries the same timing metadata as
+        `_query()`.
+
+        Args:
+            query_bundle: An instance of QueryBundle containing the query string and
+                additional data required for the query.
+
+        Returns:
+            Response: An instance of the Response class (or StreamingResponse if streaming
+                is enabled) containing the generated response, the source nodes and metadata.
+
+        Raises:
+            Exception: If any error occurs during query processing, it is logged and
+                re-raised.
+        """
+        try:
+
+            start = time.time()
+
+            query_bundle = await to_embedded_query_async(query_bundle, GraphRAGConfig.embed_model)
+
+            results = await self.retriever.aretrieve(query_bundle)
+
+            end_retrieve = time.time()
+
+            results = await asyncio.to_thread(self._postprocess_nodes, results, query_bundle)
+
+            end_postprocessing = time.time()
+
+            (context, entity_contexts) = self._get_contexts(results)
+            
+            if self.streaming:
+                answer = await asyncio.to_thread(self._generate_streaming_response, query_bundle, context, entity_contexts)
+            else:
+                answer = await self._agenerate_response(query_bundle, context, entity_contexts)
+
+            return self._to_response(query_bundle, results, context, entity_contexts, answer, start, end_retrieve, end_postprocessing)
+
+        except Exception as e:
+            logger.exception('Error in async query processing')
+            raise
 
     def _get_prompts(self) -> PromptDictType:
         pass
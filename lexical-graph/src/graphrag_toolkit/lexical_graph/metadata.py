@@ -10,7 +10,7 @@ from datetime import datetime, date
 from graphrag_toolkit.lexical_graph import GraphRAGConfig
 
 from llama_index.core.vector_stores.types import FilterCondition, FilterOperator, MetadataFilter, MetadataFilters
-from llama_index.core.bridge.pydantic import BaseModel
+from llama_index.core.bridge.pydantic import BaseModel, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -232,16 +232,221 @@ class FilterConfig(BaseModel):
             logger.debug(f'filter result: [{str(d)}: {result}]')
         return result
 
+    def filter_source_metadata_dictionaries(self, ds: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Filters a list of metadata dictionaries in a single pass.
+
+        Args:
+            ds (List[Dict[str, Any]]): The metadata dictionaries to be filtered.
+
+        Returns:
+            List[bool]: For each dictionary, in order, True if it passes the filter;
+            otherwise, False.
+        """
+        filter_fn = self.source_metadata_dictionary_filter_fn
+        if isinstance(filter_fn, DictionaryFilter):
+            results = filter_fn.filter_all(ds)
+        else:
+            results = [filter_fn(d) for d in ds]
+        if logger.isEnabledFor(logging.DEBUG):
+            for d, result in zip(ds, results):
+                if not result:
+                    logger.debug(f'filter result: [{str(d)}: {result}]')
+        return results
+
+
+_FILTER_OPERATORS:Dict[FilterOperator, Callable[[Any, Any], bool]] = {
+    FilterOperator.EQ: lambda metadata_value, value: metadata_value == value,
+    FilterOperator.NE: lambda metadata_value, value: metadata_value != value,
+    FilterOperator.GT: lambda metadata_value, value: metadata_value > value,
+    FilterOperator.GTE: lambda metadata_value, value: metadata_value >= value,
+    FilterOperator.LT: lambda metadata_value, value: metadata_value < value,
+    FilterOperator.LTE: lambda metadata_value, value: metadata_value <= value,
+    FilterOperator.IN: lambda metadata_value, value: metadata_value in value,
+    FilterOperator.NIN: lambda metadata_value, value: metadata_value not in value,
+    FilterOperator.CONTAINS: lambda metadata_value, value: value in metadata_value,
+    FilterOperator.TEXT_MATCH: lambda metadata_value, value: value.lower() in metadata_value.lower(),
+    FilterOperator.ALL: lambda metadata_value, value: all(val in metadata_value for val in value),
+    FilterOperator.ANY: lambda metadata_value, value: any(val in metadata_value for val in value),
+}
+
+
+class MetadataPredicate(abc.ABC):
+    """
+    A metadata filter compiled into a predicate over metadata dictionaries.
+
+    Predicates are built once, by `compile_metadata_filters()`, with the filter values
+    already coerced to their target types and the formatter for each key resolved ahead
+    of time. A predicate can be evaluated against a single metadata dictionary (by
+    calling it), or against a list of dictionaries (using `select()`), in which case
+    each node in the filter tree is evaluated over the whole batch, and the children of
+    AND and OR nodes are only evaluated for dictionaries whose result is still undecided.
+    """
+    @abc.abstractmethod
+    def __call__(self, metadata:Dict[str, Any]) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def select(self, metadata_list:List[Dict[str, Any]], indexes:List[int]) -> List[int]:
+        """
+        Returns the subset of `indexes` (in order) whose metadata dictionaries in
+        `metadata_list` satisfy this predicate.
+        """
+        raise NotImplementedError
+
+
+class _IsEmptyPredicate(MetadataPredicate):
+
+    def __init__(self, key:str):
+        self.key = key
+
+    def __call__(self, metadata:Dict[str, Any]) -> bool:
+        metadata_value = metadata.get(self.key, None)
+        return metadata_value is None or metadata_value == '' or metadata_value == []
+
+    def select(self, metadata_list:List[Dict[str, Any]], indexes:List[int]) -> List[int]:
+        return [i for i in indexes if self(metadata_list[i])]
+
+
+class _OperatorPredicate(MetadataPredicate):
+
+    def __init__(self, key:str, operator_fn:Callable[[Any, Any], bool], formatter:Optional[Callable[[Any], Any]], value:Any):
+        self.key = key
+        self.operator_fn = operator_fn
+        self.formatter = formatter
+        self.value = value
+
+    def __call__(self, metadata:Dict[str, Any]) -> bool:
+        metadata_value = metadata.get(self.key, None)
+        if self.formatter is not None:
+            metadata_value = self.formatter(metadata_value)
+        if metadata_value is None:
+            return False
+        return self.operator_fn(metadata_value, self.value)
+
+    def select(self, metadata_list:List[Dict[str, Any]], indexes:List[int]) -> List[int]:
+        return [i for i in indexes if self(metadata_list[i])]
+
+
+class _AndPredicate(MetadataPredicate):
+
+    def __init__(self, predicates:List[MetadataPredicate]):
+        self.predicates = predicates
+
+    def __call__(self, metadata:Dict[str, Any]) -> bool:
+        return all(predicate(metadata) for predicate in self.predicates)
+
+    def select(self, metadata_list:List[Dict[str, Any]], indexes:List[int]) -> List[int]:
+        for predicate in self.predicates:
+            if not indexes:
+                break
+            indexes = predicate.select(metadata_list, indexes)
+        return indexes
+
+
+class _OrPredicate(MetadataPredicate):
+
+    def __init__(self, predicates:List[MetadataPredicate]):
+        self.predicates = predicates
+
+    def __call__(self, metadata:Dict[str, Any]) -> bool:
+        return any(predicate(metadata) for predicate in self.predicates)
+
+    def select(self, metadata_list:List[Dict[str, Any]], indexes:List[int]) -> List[int]:
+        matched = set()
+        remaining = indexes
+        for predicate in self.predicates:
+            if not remaining:
+                break
+            selected = set(predicate.select(metadata_list, remaining))
+            matched.update(selected)
+            remaining = [i for i in remaining if i not in selected]
+        return [i for i in indexes if i in matched]
+
+
+class _NotPredicate(MetadataPredicate):
+
+    def __init__(self, predicate:MetadataPredicate):
+        self.predicate = predicate
+
+    def __call__(self, metadata:Dict[str, Any]) -> bool:
+        return not self.predicate(metadata)
+
+    def select(self, metadata_list:List[Dict[str, Any]], indexes:List[int]) -> List[int]:
+        selected = set(self.predicate.select(metadata_list, indexes))
+        return [i for i in indexes if i not in selected]
+
+
+def _compile_metadata_filter(f:MetadataFilter) -> MetadataPredicate:
+
+    if f.operator == FilterOperator.IS_EMPTY:
+        return _IsEmptyPredicate(f.key)
+
+    operator_fn = _FILTER_OPERATORS.get(f.operator, None)
+    if operator_fn is None:
+        raise ValueError(f'Unsupported filter operator: {f.operator}')
+
+    type_name = type_name_for_key_value(f.key, f.value)
+    formatter = formatter_for_type(type_name)
+
+    return _OperatorPredicate(
+        key=f.key,
+        operator_fn=operator_fn,
+        formatter=formatter if type_name != 'text' else None,
+        value=formatter(f.value)
+    )
+
+
+def compile_metadata_filters(metadata_filters:MetadataFilters) -> MetadataPredicate:
+    """
+    Compiles a (possibly nested) set of metadata filters into a single `MetadataPredicate`.
+
+    Type inference and coercion of the filter values are performed once, here, rather
+    than each time a metadata dictionary is evaluated.
+
+    Args:
+        metadata_filters (MetadataFilters): The filters and condition (AND, OR, or NOT) to compile.
+
+    Returns:
+        MetadataPredicate: A predicate that evaluates metadata dictionaries against the filters.
+
+    Raises:
+        ValueError: If a metadata filter condition or operator is unsupported, a MetadataFilter
+            is used directly with FilterCondition.NOT, or the metadata filter type is invalid.
+    """
+    predicates:List[MetadataPredicate] = []
+
+    for metadata_filter in metadata_filters.filters:
+        if isinstance(metadata_filter, MetadataFilter):
+            if metadata_filters.condition == FilterCondition.NOT:
+                raise ValueError(f'Expected MetadataFilters for FilterCondition.NOT, but found MetadataFilter')
+            predicates.append(_compile_metadata_filter(metadata_filter))
+        elif isinstance(metadata_filter, MetadataFilters):
+            predicates.append(compile_metadata_filters(metadata_filter))
+        else:
+            raise ValueError(f'Invalid metadata filter type: {type(metadata_filter)}')
+
+    if metadata_filters.condition == FilterCondition.NOT:
+        return _NotPredicate(_AndPredicate(predicates))
+    elif metadata_filters.condition == FilterCondition.AND:
+        return predicates[0] if len(predicates) == 1 else _AndPredicate(predicates)
+    elif metadata_filters.condition == FilterCondition.OR:
+        return predicates[0] if len(predicates) == 1 else _OrPredicate(predicates)
+    else:
+        raise ValueError(f'Unsupported filters condition: {metadata_filters.condition}')
+
 
 class DictionaryFilter(BaseModel):
     """
     Filters metadata dictionaries based on specified filter criteria.
 
-    This class provides mechanisms to apply a series of hierarchical metadata
-    filters through recursive logic. It utilizes different filter operators
-    such as equality, inequality, text matching, and value checking across
-    nested metadata structures. The class is intended to be called as a function
-    to determine whether the supplied metadata satisfies the provided filters.
+    This class applies a series of hierarchical metadata filters to metadata
+    dictionaries. It supports different filter operators such as equality,
+    inequality, text matching, and value checking across nested metadata
+    filter structures. The filters are compiled into a `MetadataPredicate` the
+    first time they are applied. The class is intended to be called as a function
+    to determine whether the supplied metadata satisfies the provided filters;
+    `filter_all()` evaluates a list of metadata dictionaries in a single pass.
 
     Attributes:
         metadata_filters (MetadataFilters): The set of filters and conditions
@@ -249,6 +454,8 @@ class DictionaryFilter(BaseModel):
     """
     metadata_filters: MetadataFilters
 
+    _predicate: Optional[MetadataPredicate] = PrivateAttr(default=None)
+
     def __init__(self, metadata_filters: MetadataFilters):
         """
         Initializes an instance with metadata filters to process or filter specific
@@ -260,136 +467,19 @@ class DictionaryFilter(BaseModel):
         """
         super().__init__(metadata_filters=metadata_filters)
 
-    def _apply_filter_operator(self, operator: FilterOperator, metadata_value: Any, value: Any) -> bool:
-        """
-        Applies a filter operator to a metadata value and a given value to evaluate a condition.
-
-        This method takes a filter operator, a metadata value, and a comparison value,
-        and applies the operator to determine if the condition holds true. It supports
-        various operators such as equality, inequality, greater than, containment,
-        text matching, and more. If the metadata value is `None` or the operator is unsupported,
-        the method handles these cases appropriately by returning `False` or raising an exception,
-        respectively.
-
-        Args:
-            operator (FilterOperator): The filter operator to evaluate the condition.
-            metadata_value (Any): The metadata value to be compared against.
-            value (Any): The value to compare with the metadata value.
-
-        Returns:
-            bool: The result of applying the filter operator to the metadata value and comparison value.
-
-        Raises:
-            ValueError: If the provided filter operator is unsupported.
-        """
-        if metadata_value is None:
-            return False
-        if operator == FilterOperator.EQ:
-            return metadata_value == value
-        if operator == FilterOperator.NE:
-            return metadata_value != value
-        if operator == FilterOperator.GT:
-            return metadata_value > value
-        if operator == FilterOperator.GTE:
-            return metadata_value >= value
-        if operator == FilterOperator.LT:
-            return metadata_value < value
-        if operator == FilterOperator.LTE:
-            return metadata_value <= value
-        if operator == FilterOperator.IN:
-            return metadata_value in value
-        if operator == FilterOperator.NIN:
-            return metadata_value not in value
-        if operator == FilterOperator.CONTAINS:
-            return value in metadata_value
-        if operator == FilterOperator.TEXT_MATCH:
-            return value.lower() in metadata_value.lower()
-        if operator == FilterOperator.ALL:
-            return all(val in metadata_value for val in value)
-        if operator == FilterOperator.ANY:
-            return any(val in metadata_value for val in value)
-        raise ValueError(f'Unsupported filter operator: {operator}')
-
-    def _apply_metadata_filters_recursive(self, metadata_filters: MetadataFilters, metadata: Dict[str, Any]) -> bool:
+    @property
+    def predicate(self) -> MetadataPredicate:
         """
-        Applies a set of metadata filters recursively to determine whether the metadata
-        satisfies the specified filter conditions. This function evaluates each filter
-        based on its operator and compares the metadata values to determine whether
-        the condition (AND, OR, NOT) is satisfied. Custom formatting and type handling
-        are applied to ensure proper evaluation of metadata values.
-
-        Args:
-            metadata_filters (MetadataFilters): A container of metadata filters and
-                a filtering condition (AND, OR, or NOT) to evaluate.
-            metadata (Dict[str, Any]): A dictionary of metadata to compare against the
-                provided filters.
-
-        Returns:
-            bool: True if the metadata satisfies the specified filter conditions, or
-                False otherwise.
-
-        Raises:
-            ValueError: If a metadata filter condition is specified incorrectly, or if
-                the metadata filter type is invalid.
+        Returns the compiled predicate for this filter's metadata filters.
         """
-        results: List[bool] = []
-
-        def get_filter_result(f: MetadataFilter, metadata: Dict[str, Any]):
-            """
-            Represents a filter mechanism for applying metadata filters recursively
-            on a dictionary-like metadata structure. This class primarily focuses on
-            validating metadata against specified filtering criteria using recursive
-            approaches and type-based transformations.
-
-            Attributes:
-                No attributes are defined explicitly for this class. It functions
-                through its methods for processing metadata.
-
-            """
-            metadata_value = metadata.get(f.key, None)
-            if f.operator == FilterOperator.IS_EMPTY:
-                return (
-                        metadata_value is None
-                        or metadata_value == ''
-                        or metadata_value == []
-                )
-            else:
-                type_name = type_name_for_key_value(f.key, f.value)
-                formatter = formatter_for_type(type_name)
-                value = formatter(f.value)
-                metadata_value = formatter(metadata_value)
-                return self._apply_filter_operator(
-                    operator=f.operator,
-                    metadata_value=metadata_value,
-                    value=value  
-                )
-
-        for metadata_filter in metadata_filters.filters:
-            if isinstance(metadata_filter, MetadataFilter):
-                if metadata_filters.condition == FilterCondition.NOT:
-                    raise ValueError(f'Expected MetadataFilters for FilterCondition.NOT, but found MetadataFilter')
-                results.append(get_filter_result(metadata_filter, metadata))
-            elif isinstance(metadata_filter, MetadataFilters):
-                results.append(self._apply_metadata_filters_recursive(metadata_filter, metadata))
-            else:
-                raise ValueError(f'Invalid metadata filter type: {type(metadata_filter)}')
-            
-        if metadata_filters.condition == FilterCondition.NOT:
-            return not all(results)
-        elif metadata_filters.condition == FilterCondition.AND:
-            return all(results)
-        elif metadata_filters.condition == FilterCondition.OR:
-            return any(results)
-        else:
-            raise ValueError(f'Unsupported filters condition: {metadata_filters.condition}')
+        if self._predicate is None:
+            self._predicate = compile_metadata_filters(self.metadata_filters)
+        return self._predicate
 
     def __call__(self, metadata: Dict[str, Any]) -> bool:
         """
         Executes the metadata filters on the provided metadata.
 
-        The method applies the set of predefined metadata filters recursively
-        to determine if the provided metadata satisfies all conditions.
-
         Args:
             metadata (Dict[str, Any]): The metadata to be filtered and evaluated against
                 the predefined metadata filters.
@@ -398,7 +488,21 @@ class DictionaryFilter(BaseModel):
             bool: Returns True if the metadata satisfies all the filter conditions;
             otherwise, returns False.
         """
-        return self._apply_metadata_filters_recursive(self.metadata_filters, metadata)
+        return self.predicate(metadata)
+
+    def filter_all(self, metadata_list: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Executes the metadata filters on each of the provided metadata dictionaries.
+
+        Args:
+            metadata_list (List[Dict[str, Any]]): The metadata dictionaries to be evaluated.
+
+        Returns:
+            List[bool]: For each metadata dictionary, in order, whether it satisfies the
+            filter conditions.
+        """
+        selected = set(self.predicate.select(metadata_list, list(range(len(metadata_list)))))
+        return [i in selected for i in range(len(metadata_list))]
     
 FilterType = Union[FilterConfig, List[Dict], Dict]
 
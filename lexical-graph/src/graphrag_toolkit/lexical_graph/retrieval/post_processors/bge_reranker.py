@@ -7,6 +7,7 @@ from pydantic import ConfigDict, Field
 
 from graphrag_toolkit.lexical_graph.retrieval.post_processors.reranker_mixin import RerankerMixin
 from graphrag_toolkit.lexical_graph.retrieval.utils.statement_utils import get_top_free_gpus
+from graphrag_toolkit.lexical_graph.utils.fm_observability import traced
 from llama_index.core.bridge.pydantic import Field
 from llama_index.core.postprocessor.types import BaseNodePostprocessor
 from llama_index.core.schema import NodeWithScore, QueryBundle
@@ -122,6 +123,7 @@ class BGEReranker(BaseNodePostprocessor, RerankerMixin):
         """
         return self.batch_size_internal
     
+    @traced('reranker', lambda self, pairs, *args, **kwargs: {'model': self.model_name, 'num_values': len(pairs)})
     def rerank_pairs(
         self,
         pairs: List[Tuple[str, str]],
@@ -158,6 +160,7 @@ class BGEReranker(BaseNodePostprocessor, RerankerMixin):
             logger.error(f"Error in rerank_pairs: {str(e)}")
             raise
 
+    @traced('reranker', lambda self, nodes, *args, **kwargs: {'model': self.model_name, 'num_values': len(nodes)})
     def _postprocess_nodes(
         self,
         nodes: List[NodeWithScore],
@@ -6,6 +6,7 @@ from typing import List, Tuple, Optional, Any
 
 from graphrag_toolkit.lexical_graph.retrieval.post_processors import RerankerMixin
 from graphrag_toolkit.lexical_graph.utils.reranker_utils import to_float
+from graphrag_toolkit.lexical_graph.utils.fm_observability import traced
 
 from llama_index.core.bridge.pydantic import Field, PrivateAttr
 from llama_index.core.postprocessor import SentenceTransformerRerank
@@ -94,6 +95,7 @@ class SentenceReranker(SentenceTransformerRerank, RerankerMixin):
         """
         return self.batch_size_internal
     
+    @traced('reranker', lambda self, pairs, *args, **kwargs: {'model': self.model, 'num_values': len(pairs)})
     def rerank_pairs(
         self,
         pairs: List[Tuple[str, str]],
@@ -118,6 +120,7 @@ class SentenceReranker(SentenceTransformerRerank, RerankerMixin):
             for r in self._model.predict(sentences=pairs, batch_size=batch_size, show_progress_bar=False)
         ] 
     
+    @traced('reranker', lambda self, nodes, *args, **kwargs: {'model': self.model, 'num_values': len(nodes)})
     def _postprocess_nodes(
         self,
         nodes: List[NodeWithScore],
@@ -4,12 +4,14 @@
 import logging
 import numpy as np
 import re
+import zlib
 import spacy
-from typing import List, Optional, Any, Callable
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Optional, Any, Callable, Dict, Tuple
 from pydantic import Field
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import TfidfVectorizer, ENGLISH_STOP_WORDS
 
 from graphrag_toolkit.lexical_graph import ModelError
 from graphrag_toolkit.lexical_graph.retrieval.model import SearchResult
@@ -86,15 +88,74 @@ ALL_TEXT = _all_text
 TOPICS_AND_STATEMENTS = _topics_and_statements
 TOPICS = _topics
 
+_MINHASH_BATCH_SIZE = 256
+
+@lru_cache(maxsize=8)
+def _minhash_permutations(num_perm:int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the (a, b) coefficients of the `num_perm` multiply-shift hash functions
+    `(a * x + b) >> 32` used to compute MinHash signatures. The coefficients are
+    generated from a fixed seed, so signatures are stable across processes.
+    """
+    random_state = np.random.RandomState(seed=1)
+    a = random_state.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+    b = random_state.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return (a, b)
+
+def _lsh_bands(num_perm:int, threshold:float) -> Tuple[int, int]:
+    """
+    Returns the number of bands, and rows per band, that divide a MinHash signature of
+    length `num_perm` such that the LSH candidate threshold `(1/bands)^(1/rows)` is as
+    close as possible to the given Jaccard similarity threshold.
+    """
+    best = None
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        distance = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or distance < best[0]:
+            best = (distance, bands, rows)
+    return (best[1], best[2])
+
+def _minhash_signatures(token_sets:List[List[str]], num_perm:int) -> np.ndarray:
+    """
+    Computes a MinHash signature for each of the given (non-empty) token sets, returning
+    an array of shape (number of token sets, num_perm).
+    """
+    a, b = _minhash_permutations(num_perm)
+    token_hashes = {}
+
+    def hash_token(token):
+        h = token_hashes.get(token)
+        if h is None:
+            h = zlib.crc32(token.encode('utf-8'))
+            token_hashes[token] = h
+        return h
+
+    signatures = np.empty((len(token_sets), num_perm), dtype=np.uint32)
+
+    for start in range(0, len(token_sets), _MINHASH_BATCH_SIZE):
+        batch = token_sets[start:start + _MINHASH_BATCH_SIZE]
+        hashes = np.array([hash_token(t) for tokens in batch for t in tokens], dtype=np.uint64)
+        offsets = np.cumsum([0] + [len(tokens) for tokens in batch[:-1]])
+        permuted = ((np.outer(hashes, a) + b) >> np.uint64(32)).astype(np.uint32)
+        signatures[start:start + len(batch)] = np.minimum.reduceat(permuted, offsets, axis=0)
+
+    return signatures
+
 class StatementDiversityPostProcessor(BaseNodePostprocessor):
     """Postprocessor for ensuring diversity among statements.
 
     This class preprocesses textual data and postprocesses nodes to ensure that
     similar or duplicate entries are reduced based on a given similarity threshold.
-    Using spaCy for natural language processing and TF-IDF for text similarity
-    calculation, this postprocessor identifies and filters out redundant nodes.
-    It is intended to work with query-based document retrieval or node filtering
-    pipelines.
+    Texts are normalized (using spaCy, or a lighter-weight regex tokenizer), and the
+    TF-IDF cosine similarity between them is used to identify and filter out redundant
+    nodes. For small result sets all pairs of nodes are compared. For larger result sets,
+    MinHash locality-sensitive hashing (LSH) over the normalized tokens is used to find
+    candidate near-duplicate pairs in roughly linear time, and only those candidate pairs
+    are compared. It is intended to work with query-based document retrieval or node
+    filtering pipelines.
 
     Attributes:
         similarity_threshold (float): Threshold value for determining similarity
@@ -102,27 +163,52 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
             threshold are considered duplicates and are filtered out.
         nlp (Any): Instance of spaCy NLP object used for text preprocessing. This
             object is configured with specific components including a sentencizer.
+            None if spaCy is not used.
         text_fn (Callable[[BaseNode], str]): Callable function used to extract text
             from a given node.
+        use_spacy (bool): Whether to use spaCy to tokenize and lemmatize texts. If False,
+            texts are tokenized with a regular expression, and are not lemmatized.
+        lsh_threshold (float): Approximate Jaccard similarity of normalized tokens above
+            which two nodes are considered candidate duplicates by the LSH index.
+        num_perm (int): Number of hash functions used to compute MinHash signatures.
+        max_exact_comparison_nodes (int): Maximum number of nodes for which all pairs of
+            nodes are compared. Above this number, the LSH index is used.
     """
     
     similarity_threshold: float = Field(default=0.975)
     nlp: Any = Field(default=None)
     text_fn: Callable[[BaseNode], str] = Field(default=None)
-
-    def __init__(self, similarity_threshold: float = 0.975, text_fn = None):
+    use_spacy: bool = Field(default=True)
+    lsh_threshold: float = Field(default=0.5)
+    num_perm: int = Field(default=128)
+    max_exact_comparison_nodes: int = Field(default=250)
+
+    def __init__(self, 
+                 similarity_threshold: float = 0.975, 
+                 text_fn = None,
+                 use_spacy: bool = True,
+                 lsh_threshold: float = 0.5,
+                 num_perm: int = 128,
+                 max_exact_comparison_nodes: int = 250):
         """
         Initializes an instance of the class with the specified similarity threshold and
-        text function. Loads the spaCy language model for text processing, specifically
-        disabling named entity recognition and parsing, but adding a sentence segmenter.
-        If the required spaCy model is not found, raises a ModelError with instructions
-        to install the missing model.
+        text function. Unless `use_spacy` is False, loads the spaCy language model for text
+        processing, specifically disabling named entity recognition and parsing, but adding
+        a sentence segmenter. If the required spaCy model is not found, raises a ModelError
+        with instructions to install the missing model.
 
         Args:
             similarity_threshold (float): The threshold for similarity comparison, which should
                 be a value between 0 and 1. Defaults to 0.975.
             text_fn (optional): A function to apply to text data when processing.
                 If not provided, defaults to ALL_TEXT.
+            use_spacy (bool): Whether to use spaCy to preprocess texts. Defaults to True.
+            lsh_threshold (float): The approximate Jaccard similarity threshold used by the
+                LSH index to select candidate duplicates. Lower values find more candidates,
+                at the cost of more comparisons. Defaults to 0.5.
+            num_perm (int): The length of the MinHash signatures. Defaults to 128.
+            max_exact_comparison_nodes (int): The maximum number of nodes for which all pairs
+                are compared without using the LSH index. Defaults to 250.
 
         Raises:
             ModelError: If the required spaCy model ('en_core_web_sm') is not installed or
@@ -130,13 +216,18 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
         """
         super().__init__(
             similarity_threshold=similarity_threshold,
-            text_fn = text_fn or ALL_TEXT
+            text_fn = text_fn or ALL_TEXT,
+            use_spacy=use_spacy,
+            lsh_threshold=lsh_threshold,
+            num_perm=num_perm,
+            max_exact_comparison_nodes=max_exact_comparison_nodes
         )
-        try:
-            self.nlp = spacy.load("en_core_web_sm", disable=['ner', 'parser'])
-            self.nlp.add_pipe('sentencizer')
-        except OSError:
-            raise ModelError("Please install the spaCy model using: python -m spacy download en_core_web_sm")
+        if use_spacy:
+            try:
+                self.nlp = spacy.load("en_core_web_sm", disable=['ner', 'parser'])
+                self.nlp.add_pipe('sentencizer')
+            except OSError:
+                raise ModelError("Please install the spaCy model using: python -m spacy download en_core_web_sm")
 
     def preprocess_texts(self, texts: List[str]) -> List[str]:
         """
@@ -145,6 +236,9 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
         punctuations, converts tokens to lowercase, normalizes numbers by replacing
         them with placeholders, and generates a list of preprocessed strings.
 
+        If spaCy is not being used, texts are tokenized with a regular expression, and
+        tokens are not lemmatized.
+
         Args:
             texts (List[str]): A list of textual inputs to preprocess by tokenizing,
                 removing stopwords and punctuations, lemmatizing, and replacing numeric
@@ -155,11 +249,13 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
                 with placeholders, stopwords and punctuations are removed, and tokens
                 are converted to their lemmatized, lowercase forms.
         """
+        if not self.nlp:
+            return self._simple_preprocess_texts(texts)
+        
         preprocessed_texts = []
         float_pattern = re.compile(r'\d+\.\d+')
         
-        for text in texts:
-            doc = self.nlp(text)
+        for doc in self.nlp.pipe(texts):
             tokens = []
             for token in doc:
                 if token.like_num: 
@@ -172,6 +268,95 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
             preprocessed_texts.append(' '.join(tokens))
         return preprocessed_texts
     
+    def _simple_preprocess_texts(self, texts: List[str]) -> List[str]:
+        
+        preprocessed_texts = []
+        token_pattern = re.compile(r'\d+(?:[.,]\d+)*|\w+')
+        float_pattern = re.compile(r'\d+\.\d+')
+        
+        for text in texts:
+            tokens = []
+            for token in token_pattern.findall(text):
+                if token[0].isdigit():
+                    if float_pattern.match(token):
+                        tokens.append(f"FLOAT_{token}")
+                    else:
+                        tokens.append(f"NUM_{token}")
+                else:
+                    token = token.lower()
+                    if token not in ENGLISH_STOP_WORDS:
+                        tokens.append(token)
+            preprocessed_texts.append(' '.join(tokens))
+        return preprocessed_texts
+    
+    def _get_candidate_pairs(self, preprocessed_texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (i, j) index pairs, i < j, of candidate near-duplicate texts. Texts whose
+        MinHash signatures agree on every row of at least one LSH band are candidates.
+        """
+        token_sets = [sorted(set(text.split())) for text in preprocessed_texts]
+        indexes = [i for i, tokens in enumerate(token_sets) if tokens]
+        
+        if len(indexes) < 2:
+            return (np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+        
+        signatures = _minhash_signatures([token_sets[i] for i in indexes], self.num_perm)
+        bands, rows = _lsh_bands(self.num_perm, self.lsh_threshold)
+        
+        candidate_pairs = set()
+        
+        for band in range(bands):
+            band_signatures = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+            band_keys = band_signatures.view(np.dtype((np.void, band_signatures.dtype.itemsize * rows))).ravel()
+            _, bucket_ids, bucket_sizes = np.unique(band_keys, return_inverse=True, return_counts=True)
+            bucket_ids = bucket_ids.ravel()
+            shared = bucket_sizes[bucket_ids] > 1
+            buckets = defaultdict(list)
+            for position, bucket_id in zip(np.flatnonzero(shared).tolist(), bucket_ids[shared].tolist()):
+                buckets[bucket_id].append(indexes[position])
+            for bucket in buckets.values():
+                for x in range(0, len(bucket) - 1):
+                    for y in range(x + 1, len(bucket)):
+                        candidate_pairs.add((bucket[x], bucket[y]))
+        
+        logger.debug(f'LSH candidate pairs: {len(candidate_pairs)} [num_texts: {len(indexes)}, bands: {bands}, rows: {rows}]')
+        
+        if not candidate_pairs:
+            return (np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+        
+        pairs = np.array(sorted(candidate_pairs), dtype=np.int64)
+        return (pairs[:, 0], pairs[:, 1])
+    
+    def _get_duplicates(self, preprocessed_texts: List[str]) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Returns a dictionary mapping the index of each text to the (index, similarity) pairs
+        of the later texts whose TF-IDF cosine similarity to it exceeds the similarity threshold.
+        """
+        try:
+            vectorizer = TfidfVectorizer()
+            tfidf_matrix = vectorizer.fit_transform(preprocessed_texts)
+        except ValueError:
+            # empty vocabulary
+            return {}
+        
+        num_texts = len(preprocessed_texts)
+        
+        if num_texts <= self.max_exact_comparison_nodes:
+            cosine_sim_matrix = (tfidf_matrix @ tfidf_matrix.T).toarray()
+            left, right = np.nonzero(np.triu(cosine_sim_matrix > self.similarity_threshold, k=1))
+            similarities = cosine_sim_matrix[left, right]
+        else:
+            left, right = self._get_candidate_pairs(preprocessed_texts)
+            similarities = np.asarray(tfidf_matrix[left].multiply(tfidf_matrix[right]).sum(axis=1)).ravel()
+            is_duplicate = similarities > self.similarity_threshold
+            left, right, similarities = left[is_duplicate], right[is_duplicate], similarities[is_duplicate]
+        
+        duplicates = defaultdict(list)
+        for i, j, similarity in zip(left.tolist(), right.tolist(), similarities.tolist()):
+            duplicates[i].append((j, similarity))
+        
+        return duplicates
+    
     def _postprocess_nodes(
         self,
         nodes: List[NodeWithScore],
@@ -183,8 +368,9 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
         This method preprocesses the given list of nodes and filters out nodes that have
         a high textual similarity. It uses TF-IDF vectorization combined with cosine similarity
         to determine the similarity between nodes and removes duplicates that exceed a defined
-        similarity threshold. The method ensures that only distinct nodes are included in the
-        output.
+        similarity threshold. For larger lists of nodes, only the candidate pairs found by a
+        MinHash LSH index are compared. The method ensures that only distinct nodes are included
+        in the output.
 
         Args:
             nodes:
@@ -203,10 +389,8 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
         texts = [self.text_fn(node.node) for node in nodes]
         preprocessed_texts = self.preprocess_texts(texts)
 
-        # Calculate TF-IDF similarity
-        vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform(preprocessed_texts)
-        cosine_sim_matrix = cosine_similarity(tfidf_matrix)
+        # Find pairs of similar texts
+        duplicates = self._get_duplicates(preprocessed_texts)
 
         # Track which nodes to keep
         keep_indices = []
@@ -217,12 +401,11 @@ class StatementDiversityPostProcessor(BaseNodePostprocessor):
                 keep_indices.append(idx)
                 already_selected[idx] = True
 
-                # Find similar statements
-                similar_indices = np.where(cosine_sim_matrix[idx] > self.similarity_threshold)[0]
-                for sim_idx in similar_indices:
+                # Remove similar statements
+                for sim_idx, similarity in sorted(duplicates.get(idx, [])):
                     if not already_selected[sim_idx]:
                         logger.debug(
-                            f"Removing duplicate (similarity: {cosine_sim_matrix[idx][sim_idx]:.4f}):\n"
+                            f"Removing duplicate (similarity: {similarity:.4f}):\n"
                             f"Kept: {texts[idx]}\n"
                             f"Removed: {texts[sim_idx]}"
                         )
@@ -39,8 +39,8 @@ class FilterByMetadata(ProcessorBase):
         """
         Processes search results based on the provided query and applies filters to the search result metadata.
 
-        Filters the search results by evaluating the metadata of each result using the filter configuration.
-        Only results that satisfy the filter criteria are retained.
+        Filters the search results by evaluating the metadata of all the results in a single pass using
+        the filter configuration. Only results that satisfy the filter criteria are retained.
 
         Args:
             search_results: A collection of search results to be filtered.
@@ -49,15 +49,17 @@ class FilterByMetadata(ProcessorBase):
         Returns:
             SearchResultCollection: A collection of filtered search results.
         """
-        def filter_search_result(index:int, search_result:SearchResult):
-            
-            versioning_metadata = {
+        metadata_list = [
+            search_result.source.metadata | {
                 VALID_FROM:search_result.source.versioning.valid_from,
                 VALID_TO:search_result.source.versioning.valid_to
             }
+            for search_result in search_results.results
+        ]
 
-            metadata = search_result.source.metadata | versioning_metadata
+        filter_results = self.filter_config.filter_source_metadata_dictionaries(metadata_list)
 
-            return search_result if self.filter_config.filter_source_metadata_dictionary(metadata) else None
+        def filter_search_result(index:int, search_result:SearchResult):
+            return search_result if filter_results[index] else None
 
         return self._apply_to_search_results(search_results, filter_search_result)
\ No newline at end of file
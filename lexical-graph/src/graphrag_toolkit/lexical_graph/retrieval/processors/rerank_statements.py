@@ -5,15 +5,16 @@ import logging
 import time
 import boto3
 import json
-from typing import List, Dict
+from typing import List, Dict, Callable
 from dateutil.parser import parse
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.utils.reranker_utils import score_values_with_tfidf
+from graphrag_toolkit.lexical_graph.utils.reranker_registry import get_pair_scorer, get_bedrock_agent_runtime_client, default_rerank_score_cache
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
 from graphrag_toolkit.lexical_graph.retrieval.model import Source
 from graphrag_toolkit.lexical_graph.retrieval.processors import ProcessorBase, ProcessorArgs
-from graphrag_toolkit.lexical_graph.retrieval.post_processors import SentenceReranker
 from graphrag_toolkit.lexical_graph.retrieval.model import SearchResultCollection, SearchResult, Topic, ScoredEntity, EntityContexts
 
 from llama_index.core.schema import QueryBundle, NodeWithScore, TextNode
@@ -108,6 +109,9 @@ class RerankStatements(ProcessorBase):
         SentenceReranker model. The method processes the input values, constructs a query bundle considering the
         entities if present, and finally returns a dictionary mapping each value to its computed score.
 
+        The model is loaded once per process and shared by all requests (see `reranker_registry`);
+        pairs from concurrent requests are scored together, and scores are cached per query and value.
+
         Args:
             values (List[str]): A list of strings to be scored and reranked based on relevance.
             query (QueryBundle): The query bundle containing the query string and any metadata for ranking.
@@ -127,19 +131,48 @@ class RerankStatements(ProcessorBase):
             else QueryBundle(query_str=f'{query.query_str} (keywords: {extras})')
         )
 
-        reranker = SentenceReranker(model=self.reranking_model, top_n=self.args.max_statements or len(values))
+        model_key = self.reranking_model
 
-        reranked_values = reranker.postprocess_nodes(
-            [
-                NodeWithScore(node=TextNode(text=value), score=0.0)
-                for value in values
-            ],
-            rank_query
-        )
+        def score_pairs(rank_query_str:str, missing_values:List[str]) -> Dict[str, float]:
+            scorer = get_pair_scorer(self.reranking_model)
+            scores = scorer.score([(rank_query_str, value) for value in missing_values])
+            return dict(zip(missing_values, scores))
+
+        return self._get_top_scored_values(values, rank_query.query_str, model_key, score_pairs)
+    
+    def _get_top_scored_values(self, values:List[str], rank_query_str:str, model_key:str, score_fn:Callable[[str, List[str]], Dict[str, float]]) -> Dict[str, float]:
+        """
+        Scores values against the rank query, using the process-wide reranker score cache
+        where possible and calling `score_fn` for values whose scores are not cached, and
+        returns the `max_statements` highest scoring values with their scores.
+        """
+        cache = default_rerank_score_cache()
+
+        unique_values = list(dict.fromkeys(values))
+
+        scores = cache.get_scores(model_key, rank_query_str, unique_values) if cache else {}
+        missing_values = [value for value in unique_values if value not in scores]
+
+        logger.debug(f'Reranker score cache [hits: {len(scores)}, misses: {len(missing_values)}]')
+
+        if missing_values:
+            with trace_span('reranker', model=model_key, num_values=len(missing_values)):
+                new_scores = score_fn(rank_query_str, missing_values)
+            if cache:
+                cache.put_scores(model_key, rank_query_str, new_scores)
+            scores.update(new_scores)
+
+        top_n = min(self.args.max_statements or len(unique_values), len(unique_values))
+
+        top_values = sorted(
+            [value for value in unique_values if value in scores], 
+            key=lambda value: scores[value], 
+            reverse=True
+        )[:top_n]
 
         return {
-            reranked_value.text : reranked_value.score
-            for reranked_value in reranked_values
+            value: scores[value]
+            for value in top_values
         }
     
     def _score_values_with_bedrock(self, values:List[str], query:QueryBundle, entity_contexts:EntityContexts) -> Dict[str, float]:
@@ -155,7 +188,7 @@ class RerankStatements(ProcessorBase):
 
         region = boto3.Session().region_name
 
-        bedrock_agent_runtime = boto3.client('bedrock-agent-runtime', region_name=region)
+        bedrock_agent_runtime = get_bedrock_agent_runtime_client(region)
         
         modelId = GraphRAGConfig.bedrock_reranking_model
         model_package_arn = f"arn:aws:bedrock:{region}::foundation-model/{modelId}"
@@ -183,26 +216,27 @@ class RerankStatements(ProcessorBase):
             )
             return response['results']
         
-        text_sources = []
-        for text in values:
-            text_sources.append({
-                "type": "INLINE",
-                "inlineDocumentSource": {
-                    "type": "TEXT",
-                    "textDocument": {
-                        "text": text,
+        def score_texts(text_query:str, texts:List[str]) -> Dict[str, float]:
+            text_sources = []
+            for text in texts:
+                text_sources.append({
+                    "type": "INLINE",
+                    "inlineDocumentSource": {
+                        "type": "TEXT",
+                        "textDocument": {
+                            "text": text,
+                        }
                     }
-                }
-            })
+                })
+            # Relevance scores are independent of the other sources in the request, so
+            # score every text (for the cache) and select the top results afterwards
+            results = rerank_text(text_query, text_sources, len(texts), model_package_arn)
+            return {
+                texts[result['index']] : result['relevanceScore']
+                for result in results
+            }
             
-        num_results = min(self.args.max_statements or len(values), len(values))
-        
-        results = rerank_text(rank_query, text_sources, num_results, model_package_arn)
-                
-        return {
-            values[result['index']] : result['relevanceScore']
-            for result in results
-        }
+        return self._get_top_scored_values(values, rank_query, f'bedrock:{modelId}', score_texts)
 
     def _process_results(self, search_results:SearchResultCollection, query:QueryBundle) -> SearchResultCollection:
         """
@@ -4,7 +4,7 @@ import logging
 import time
 import statistics
 import json
-from typing import List, Dict
+from typing import List, Dict, Set, Iterable, Tuple
 
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import node_result
@@ -17,6 +17,20 @@ from llama_index.core.schema import QueryBundle
 
 logger = logging.getLogger(__name__)
 
+def _proper_prefix_keys(keys:Iterable[str]) -> Set[str]:
+    """
+    Returns the keys that are a proper (string) prefix of some other key.
+
+    In lexicographic order, all the keys that start with a given key immediately follow
+    that key, so it is sufficient to compare each key with its successor.
+    """
+    sorted_keys = sorted(set(keys))
+    return {
+        key
+        for key, next_key in zip(sorted_keys, sorted_keys[1:])
+        if next_key.startswith(key)
+    }
+
 class EntityContextProvider():
     
     def __init__(self, graph_store:GraphStore, args:ProcessorArgs):
@@ -31,72 +45,76 @@ class EntityContextProvider():
         
         excluded_entity_ids = set()
         entity_id_context_tree = {}
+
+        # The tree is built breadth-first: each level is fetched with a single query
+        # covering every entity on the frontier. Frontier entities are ordered by the rank
+        # of their root entity, then by neighbour score, and entities discovered at each
+        # level are claimed in that order.
+        frontier:List[Tuple[str, Dict]] = []
        
         for entity_id in entity_ids:
-
             if entity_id in excluded_entity_ids:
                 continue
-            else:
-                excluded_entity_ids.add(entity_id)
-
+            excluded_entity_ids.add(entity_id)
             entity_id_context = {}
             entity_id_context_tree[entity_id] = entity_id_context
-            
-            start_entity_ids = set([entity_id])
-            
-            current_entity_id_contexts = { entity_id: entity_id_context  }
-
-            for depth in range (self.args.ec_max_depth, 1, -1):
-
-                cypher = f"""
-                // get next level in tree
-                MATCH (entity:`__Entity__`)-[:`__RELATION__`]->(other)
-                      -[r:`__SUBJECT__`|`__OBJECT__`]->()
-                WHERE  {self.graph_store.node_id('entity.entityId')} IN $entityIds
-                AND NOT {self.graph_store.node_id('other.entityId')} IN $excludeEntityIds
-                AND other.class <> '__Local_Entity__'
-                WITH entity, other, count(r) AS score ORDER BY score DESC
-                WITH entity, collect(DISTINCT {self.graph_store.node_id('other.entityId')})[0..$numNeighbours] AS others
-                RETURN {{
-                    {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
-                    others: others
-                }} AS result    
-                """
-
-                params = {
-                    'entityIds': list(start_entity_ids),
-                    'excludeEntityIds': list(excluded_entity_ids),
-                    'numNeighbours': depth + 2
-                }
-
-                results = self.graph_store.execute_query(cypher, params)
-
-                new_entity_id_contexts = {}
-
-                for result in results:
-                    
-                    start_entity_id = result['result']['entity']['entityId']
-                    other_entity_ids = result['result']['others']
-
-                    for other_entity_id in other_entity_ids:
-                        if other_entity_id in excluded_entity_ids:
-                            continue
-                        else:
-                            excluded_entity_ids.add(other_entity_id)
-                        child_context = { }
-                        current_entity_id_contexts[start_entity_id][other_entity_id] = child_context
-                        new_entity_id_contexts[other_entity_id] = child_context
-
-
-                other_entity_ids = set([
-                    other_id
-                    for result in results
-                    for other_id in result['result']['others'] 
-                ])
-
-                start_entity_ids = other_entity_ids
-
-                current_entity_id_contexts = new_entity_id_contexts
+            frontier.append((entity_id, entity_id_context))
+
+        for depth in range (self.args.ec_max_depth, 1, -1):
+
+            if not frontier:
+                break
+
+            num_neighbours = depth + 2
+
+            cypher = f"""
+            // get next level in tree
+            MATCH (entity:`__Entity__`)-[:`__RELATION__`]->(other)
+                  -[r:`__SUBJECT__`|`__OBJECT__`]->()
+            WHERE  {self.graph_store.node_id('entity.entityId')} IN $entityIds
+            AND NOT {self.graph_store.node_id('other.entityId')} IN $excludeEntityIds
+            AND other.class <> '__Local_Entity__'
+            WITH entity, other, count(r) AS score ORDER BY score DESC
+            WITH entity, collect(DISTINCT {self.graph_store.node_id('other.entityId')})[0..$numNeighbours] AS others
+            RETURN {{
+                {node_result('entity', self.graph_store.node_id('entity.entityId'), properties=['value', 'class'])},
+                others: others
+            }} AS result    
+            """
+
+            # Over-fetch, so that frontier entities whose top neighbours are claimed by
+            # higher-ranked entities on the same level can still be given num_neighbours children
+            params = {
+                'entityIds': [entity_id for entity_id, _ in frontier],
+                'excludeEntityIds': list(excluded_entity_ids),
+                'numNeighbours': num_neighbours * 2
+            }
+
+            results = self.graph_store.execute_query(cypher, params)
+
+            others_by_entity_id = {
+                result['result']['entity']['entityId']: result['result']['others']
+                for result in results
+            }
+
+            new_frontier = []
+
+            for entity_id, entity_id_context in frontier:
+
+                num_children = 0
+
+                for other_entity_id in others_by_entity_id.get(entity_id, []):
+                    if num_children >= num_neighbours:
+                        break
+                    if other_entity_id in excluded_entity_ids:
+                        continue
+                    excluded_entity_ids.add(other_entity_id)
+                    child_context = { }
+                    entity_id_context[other_entity_id] = child_context
+                    new_frontier.append((other_entity_id, child_context))
+                    num_children += 1
+
+            frontier = new_frontier
 
         end = time.time()
         duration_ms = (end-start) * 1000
@@ -184,14 +202,7 @@ class EntityContextProvider():
         if type(self).__name__ in self.args.debug_results:
             logger.debug(f'all_contexts_map: {all_contexts_map}')
 
-        partial_path_keys = []
-        
-        for key in all_contexts_map.keys():
-            for other_key in all_contexts_map.keys():
-                if key != other_key and other_key.startswith(key):
-                    partial_path_keys.append(key)
-
-        for key in partial_path_keys:
+        for key in _proper_prefix_keys(all_contexts_map.keys()):
             all_contexts_map.pop(key, None)
 
         all_contexts = [context for _, context in all_contexts_map.items()]
@@ -226,18 +237,13 @@ class EntityContextProvider():
             for context in contexts
         }
 
-        context_keys = sorted(list(context_map.keys()), key=len)
+        prefix_context_keys = _proper_prefix_keys(context_map.keys())
         
-        surviving_contexts = {}
-
-        for idx, context_key in enumerate(context_keys):
-            keep = True
-            for other_context_key in context_keys[idx+1:]:
-                if other_context_key.startswith(context_key):
-                    keep = False
-                    break
-            if keep:
-                surviving_contexts[context_key] = context_map[context_key]
+        surviving_contexts = {
+            context_key:context
+            for context_key, context in context_map.items()
+            if context_key not in prefix_context_keys
+        }
                 
         deduped_contexts = []
 
@@ -2,8 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-import concurrent.futures
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Dict
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.retrieval.model import SearchResultCollection
@@ -23,7 +22,7 @@ class ChunkBasedSearch(TraversalBasedBaseRetriever):
 
     This class extends the TraversalBasedBaseRetriever to implement functionality for
     retrieving data from a graph database. The retrieval is based on chunk-oriented
-    principles, employing parallelized search techniques to enable efficient data
+    principles, employing batched graph queries to enable efficient data
     retrieval for complex queries. It processes queries through graph traversal,
     facilitates use of external vector stores, and supports custom filtering.
 
@@ -72,10 +71,8 @@ class ChunkBasedSearch(TraversalBasedBaseRetriever):
     
     def chunk_based_graph_search(self, chunk_id):
         """
-        Performs a graph search query based on a specific chunk ID. The function constructs
-        a Cypher query to search the graph database, matching relationships and nodes linked
-        to a given chunk ID. The query focuses on retrieving related statements, topics,
-        and associated chunks within defined query and statement limits.
+        Performs a graph search query based on a specific chunk ID, retrieving the statements
+        mentioned in the chunk grouped by topic and source.
 
         Args:
             chunk_id: The unique identifier of the chunk to search for in the graph database.
@@ -84,22 +81,41 @@ class ChunkBasedSearch(TraversalBasedBaseRetriever):
             List[dict]: A list of results retrieved from the graph database based on the
             provided chunk ID and query parameters.
         """
+        statement_ids = self.get_statement_ids_for_chunks([chunk_id]).get(chunk_id, [])
+        return self.get_statements_by_topic_and_source(statement_ids)
+    
+    def get_statement_ids_for_chunks(self, chunk_ids:List[str]) -> Dict[str, List[str]]:
+        """
+        Retrieves the IDs of the statements mentioned in each of the given chunks using a
+        single graph query. The number of statements per chunk is limited to `intermediate_limit`.
 
-        cypher = f'''// chunk-based graph search                                  
+        Args:
+            chunk_ids: The IDs of the chunks to search.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary mapping each chunk ID to the IDs of its statements.
+        """
+        if not chunk_ids:
+            return {}
+
+        cypher = f'''// chunk-based graph search
+        UNWIND $chunkIds AS chunkId
         MATCH (l)-[:`__BELONGS_TO__`]->()-[:`__MENTIONED_IN__`]->(c:`__Chunk__`)
-        WHERE {self.graph_store.node_id("c.chunkId")} = $chunkId
-        RETURN DISTINCT {self.graph_store.node_id("l.statementId")} AS l LIMIT $statementLimit
+        WHERE {self.graph_store.node_id("c.chunkId")} = chunkId
+        WITH chunkId, collect(DISTINCT {self.graph_store.node_id("l.statementId")})[0..$statementLimit] AS statementIds
+        RETURN chunkId, statementIds
         '''
 
         properties = {
-            'chunkId': chunk_id,
+            'chunkIds': list(dict.fromkeys(chunk_ids)),
             'statementLimit': self.args.intermediate_limit
         }
 
         results = self.graph_store.execute_query(cypher, properties)
-        statement_ids = [r['l'] for r in results]
 
-        return self.get_statements_by_topic_and_source(statement_ids)
+        return {
+            r['chunkId']: r['statementIds'] for r in results
+        }
 
 
     def get_start_node_ids(self, query_bundle: QueryBundle) -> List[str]:
@@ -134,14 +150,13 @@ class ChunkBasedSearch(TraversalBasedBaseRetriever):
         
     def do_graph_search(self, query_bundle: QueryBundle, start_node_ids:List[str]) -> SearchResultCollection:
         """
-        Performs graph search using chunk-based retrieval strategy starting from given node IDs
-        and executing concurrent search with thread pooling.
+        Performs graph search using chunk-based retrieval strategy starting from given node IDs.
 
-        This method conducts a search operation on a graph where starting points (chunks)
-        are defined, and concurrent retrieval is used to collect results from multiple
-        chunks in parallel. The search is based on the `chunk_based_graph_search` method,
-        and the retrieval results are aggregated into a `SearchResultCollection`. It also
-        logs detailed debug information when debugging is enabled.
+        The statement IDs for all the starting points (chunks) are fetched in a single graph
+        query, and the statements for every chunk are then hydrated in a single batched query
+        (see `get_statements_by_topic_and_source_for_groups`). The per-chunk results are
+        aggregated into a `SearchResultCollection`. It also logs detailed debug information
+        when debugging is enabled.
 
         Args:
             query_bundle (QueryBundle): An object containing the query parameters and
@@ -157,20 +172,18 @@ class ChunkBasedSearch(TraversalBasedBaseRetriever):
 
         logger.debug('Running chunk-based search...')
         
-        search_results = []
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.args.num_workers) as executor:
-
-            futures = [
-                executor.submit(self.chunk_based_graph_search, chunk_id)
-                for chunk_id in chunk_ids
-            ]
-            
-            executor.shutdown()
-
-            for future in futures:
-                for result in future.result():
-                    search_results.append(result)
+        statement_ids_by_chunk = self.get_statement_ids_for_chunks(chunk_ids)
+
+        grouped_results = self.get_statements_by_topic_and_source_for_groups([
+            statement_ids_by_chunk.get(chunk_id, [])
+            for chunk_id in chunk_ids
+        ])
+
+        search_results = [
+            result
+            for results in grouped_results
+            for result in results
+        ]
                     
         search_results_collection = self._to_search_results_collection(search_results) 
         
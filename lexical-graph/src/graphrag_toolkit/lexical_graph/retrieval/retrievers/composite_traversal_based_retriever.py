@@ -194,13 +194,16 @@ class CompositeTraversalBasedRetriever(TraversalBasedBaseRetriever):
         search_results = []
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.args.num_workers) as executor:
-            scored_node_batches: Iterator[List[NodeWithScore]] = executor.map(
-                lambda r, query: r.retrieve(query),
+            search_result_collections: Iterator[SearchResultCollection] = executor.map(
+                lambda r, query: r.retrieve_search_results(query),
                 retrievers,
                 repeat(query_bundle)
             )
-            scored_nodes = sum(scored_node_batches, start=cast(List[NodeWithScore], []))
-            search_results = [SearchResult.model_validate_json(scored_node.node.text) for scored_node in scored_nodes]
+            search_results = [
+                search_result 
+                for search_result_collection in search_result_collections 
+                for search_result in search_result_collection.results
+            ]
         
         return SearchResultCollection(results=search_results, entity_contexts=self.entity_contexts)
             
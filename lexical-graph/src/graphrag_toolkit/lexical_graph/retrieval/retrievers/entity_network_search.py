@@ -108,11 +108,15 @@ class EntityNetworkSearch(TraversalBasedBaseRetriever):
             
         all_start_node_ids = []
 
+        # Identical context strings share a single vector search; their embeddings
+        # are served from the process-wide query embedding cache on repeat queries
+        entity_context_strs = list(dict.fromkeys(self.entity_contexts.all_context_strs))
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.args.num_workers) as executor:
 
             futures = [
                 executor.submit(self._get_node_ids, QueryBundle(query_str=entity_context_str))
-                for entity_context_str in self.entity_contexts.all_context_strs
+                for entity_context_str in entity_context_strs
             ]
             
             executor.shutdown()
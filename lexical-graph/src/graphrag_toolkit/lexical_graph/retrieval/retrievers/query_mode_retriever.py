@@ -1,6 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import logging
 import concurrent.futures
 from itertools import repeat
@@ -66,3 +67,39 @@ class QueryModeRetriever(BaseRetriever):
                 results = sum(intermediate_results, start=cast(List[NodeWithScore], []))
 
             return results
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+
+        if self.args.enable_multipart_queries:
+            query_mode_provider = QueryModeProvider(self.args)
+            query_mode = await asyncio.to_thread(query_mode_provider.get_query_mode, query_bundle.query_str)
+        else:
+            query_mode = QueryMode.SIMPLE
+
+        if query_mode == QueryMode.SIMPLE:
+
+            logger.debug(f'Simple query, so running single retriever [enable_multipart_queries: {self.args.enable_multipart_queries}]')
+
+            sub_args = self.args.to_dict()
+            retriever = self.retriever_fn(**sub_args)
+
+            return await retriever.aretrieve(query_bundle)
+
+        else:
+
+            keyword_provider = KeywordProvider(ProcessorArgs(), mode=KeywordProviderMode.SIMPLE)
+            keywords = await asyncio.to_thread(keyword_provider.get_keywords, query_bundle)
+
+            sub_args = self.args.to_dict()
+            max_search_results = int(sub_args['max_search_results']/len(keywords)) + 1
+            sub_args['max_search_results'] = max_search_results
+            sub_args['ec_keyword_provider'] = 'passthru'
+
+            logger.debug(f'Complex query, so running multiple retrievers concurrently [num_retrievers: {len(keywords)}, search_results_per_retriever: {max_search_results}]')
+
+            intermediate_results = await asyncio.gather(*[
+                self.retriever_fn(**sub_args).aretrieve(keyword)
+                for keyword in keywords
+            ])
+
+            return sum(intermediate_results, start=cast(List[NodeWithScore], []))
@@ -2,13 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from queue import PriorityQueue
-from typing import List, Dict, Set, Tuple, Optional, Any, Union, Type
+from typing import List, Dict, Tuple, Optional, Any, Union, Type
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.vector import VectorStore
-from graphrag_toolkit.lexical_graph.retrieval.utils.statement_utils import get_statements_query
+from graphrag_toolkit.lexical_graph.retrieval.utils.statement_utils import get_statements_query, get_statement_neighbors_query, statement_beam_search
 from graphrag_toolkit.lexical_graph.retrieval.retrievers.semantic_guided_base_retriever import SemanticGuidedBaseRetriever
 from graphrag_toolkit.lexical_graph.retrieval.post_processors import RerankerMixin
 
@@ -144,21 +143,21 @@ class RerankingBeamGraphSearch(SemanticGuidedBaseRetriever):
             List[str]: A list of statement IDs representing the neighboring statements.
 
         """
-        cypher = f"""
-        // get statement neighbours (rerank beam search)
-        MATCH (e)-[:`__SUBJECT__`|`__OBJECT__`]->()-[:`__SUPPORTS__`]->(s:`__Statement__`)
-        WHERE {self.graph_store.node_id('s.statementId')} = $statementId
-        WITH s, COLLECT(DISTINCT e) AS entities
-        UNWIND entities AS entity
-        MATCH (entity)-[:`__SUBJECT__`|`__OBJECT__`]->()-[:`__SUPPORTS__`]->(e_neighbors)
-        RETURN DISTINCT {self.graph_store.node_id('e_neighbors.statementId')} as statementId
+        return self.get_frontier_neighbors([statement_id])[statement_id]
+
+    def get_frontier_neighbors(self, statement_ids: List[str]) -> Dict[str, List[str]]:
         """
-        
-        neighbors = self.graph_store.execute_query(
-            cypher, 
-            {'statementId': statement_id}
-        )
-        return [n['statementId'] for n in neighbors]
+        Retrieves the neighbors of all the statements in a beam search frontier using a
+        single graph query.
+
+        Args:
+            statement_ids (List[str]): The IDs of the statements in the frontier.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary mapping each statement ID to the IDs of its
+                neighboring statements.
+        """
+        return get_statement_neighbors_query(self.graph_store, statement_ids, 'rerank beam search')
     
     def rerank_statements(
         self,
@@ -219,10 +218,13 @@ class RerankingBeamGraphSearch(SemanticGuidedBaseRetriever):
         start_statement_ids: List[str]
     ) -> List[Tuple[str, List[str]]]:
         """
-        Executes a beam search algorithm using a priority queue to explore a network of statements,
-        starting from provided initial statement IDs. The method scores and prioritizes paths
-        according to a reranker function and keeps track of visited nodes to avoid revisits.
-        Results consist of statement IDs and their respective paths.
+        Executes a level-synchronous beam search over a network of statements, starting from
+        the provided initial statement IDs. At each level, the unvisited members of the current
+        beam are accepted into the results in descending order of reranker score; the neighbors
+        of the whole beam are then fetched with a single graph query, their details retrieved in
+        a single batch, and all candidates scored by the reranker in one pass. The highest
+        scoring `beam_width` candidates form the beam for the next level. Visited nodes are
+        tracked to avoid revisits (see `statement_beam_search()`).
 
         Args:
             query_bundle (QueryBundle): A bundle containing query details such as the query string.
@@ -233,10 +235,6 @@ class RerankingBeamGraphSearch(SemanticGuidedBaseRetriever):
             List[Tuple[str, List[str]]]: A list of tuples, where each tuple consists of a
                 statement ID and the path taken to reach it.
         """
-        visited: Set[str] = set()
-        results: List[Tuple[str, List[str]]] = []
-        queue: PriorityQueue = PriorityQueue()
-
         # Get texts for all start statements
         start_statements = self.get_statements(start_statement_ids)
         statement_texts = {
@@ -251,44 +249,26 @@ class RerankingBeamGraphSearch(SemanticGuidedBaseRetriever):
             statement_texts
         )
 
-        # Initialize queue with start statements
-        for score, statement_id in start_scores:
-            queue.put((-score, 0, statement_id, [statement_id]))
-
-        while not queue.empty() and len(results) < self.beam_width:
-            neg_score, depth, current_id, path = queue.get()
-
-            if current_id in visited:
-                continue
-
-            visited.add(current_id)
-            results.append((current_id, path))
-
-            if depth < self.max_depth:
-                # Get and score neighbors
-                neighbor_ids = self.get_neighbors(current_id)
-                if neighbor_ids:
-                    # Get texts for neighbors
-                    neighbor_statements = self.get_statements(neighbor_ids)
-                    neighbor_texts = {
-                        sid: str(statement['statement']['value']+'\n'+statement['statement']['details'])
-                        for sid, statement in neighbor_statements.items()
-                    }
-
-                    # Score neighbors using reranker
-                    scored_neighbors = self.rerank_statements(
-                        query_bundle.query_str,
-                        neighbor_ids,
-                        neighbor_texts
-                    )
-
-                    # Add top-k neighbors to queue
-                    for score, neighbor_id in scored_neighbors[:self.beam_width]:
-                        if neighbor_id not in visited:
-                            new_path = path + [neighbor_id]
-                            queue.put((-score, depth + 1, neighbor_id, new_path))
+        # Get texts for all candidates, and score them using reranker
+        def score_candidates(candidate_ids:List[str]) -> List[Tuple[float, str]]:
+            candidate_statements = self.get_statements(candidate_ids)
+            candidate_texts = {
+                sid: str(statement['statement']['value']+'\n'+statement['statement']['details'])
+                for sid, statement in candidate_statements.items()
+            }
+            return self.rerank_statements(
+                query_bundle.query_str,
+                candidate_ids,
+                candidate_texts
+            )
 
-        return results
+        return statement_beam_search(
+            start_scores,
+            self.get_frontier_neighbors,
+            score_candidates,
+            self.beam_width,
+            self.max_depth
+        )
     
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """
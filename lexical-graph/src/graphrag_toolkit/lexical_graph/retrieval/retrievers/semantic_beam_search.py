@@ -1,15 +1,14 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Set, Tuple, Optional, Any
-from queue import PriorityQueue
+from typing import List, Tuple, Optional, Any, Dict
 import numpy as np
 import logging
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.vector import VectorStore
-from graphrag_toolkit.lexical_graph.retrieval.utils.statement_utils import get_top_k, SharedEmbeddingCache
+from graphrag_toolkit.lexical_graph.retrieval.utils.statement_utils import get_top_k, get_statement_neighbors_query, statement_beam_search, SharedEmbeddingCache
 from graphrag_toolkit.lexical_graph.retrieval.retrievers.semantic_guided_base_retriever import SemanticGuidedBaseRetriever
 
 from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
@@ -86,18 +85,21 @@ class SemanticBeamGraphSearch(SemanticGuidedBaseRetriever):
         Returns:
             List[str]: A list of statement IDs that are neighbors to the given statement ID.
         """
-        cypher = f"""
-        // get statement neighbours (semantic beam search)
-        MATCH (e)-[:`__SUBJECT__`|`__OBJECT__`]->()-[:`__SUPPORTS__`]->(s:`__Statement__`)
-        WHERE {self.graph_store.node_id('s.statementId')} = $statementId
-        WITH s, COLLECT(DISTINCT e) AS entities
-        UNWIND entities AS entity
-        MATCH (entity)-[:`__SUBJECT__`|`__OBJECT__`]->()-[:`__SUPPORTS__`]->(e_neighbors)
-        RETURN DISTINCT {self.graph_store.node_id('e_neighbors.statementId')} as statementId
+        return self.get_frontier_neighbors([statement_id])[statement_id]
+    
+    def get_frontier_neighbors(self, statement_ids: List[str]) -> Dict[str, List[str]]:
         """
-        
-        neighbors = self.graph_store.execute_query(cypher, {'statementId': statement_id})
-        return [n['statementId'] for n in neighbors]
+        Fetches the neighboring statement IDs for all the statements in a beam search frontier
+        using a single graph query.
+
+        Args:
+            statement_ids: The IDs of the statements in the frontier.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary mapping each statement ID to the IDs of its
+            neighboring statements.
+        """
+        return get_statement_neighbors_query(self.graph_store, statement_ids, 'semantic beam search')
 
     def beam_search(
         self, 
@@ -105,12 +107,17 @@ class SemanticBeamGraphSearch(SemanticGuidedBaseRetriever):
         start_statement_ids: List[str]
     ) -> List[Tuple[str, List[str]]]:  # [(statement_id, path), ...]
         """
-        Performs a beam search to find the most relevant paths based on the provided query embedding.
-
-        The search starts from given initial statement IDs and explores their neighbors up to a maximum
-        depth. It uses a priority queue to ensure that the paths with the highest similarity scores
-        are evaluated first. The method stops when the beam width (the maximum number of results)
-        is reached or when no more relevant neighbors are found.
+        Performs a level-synchronous beam search to find the most relevant paths based on the
+        provided query embedding.
+
+        The search starts from the given initial statement IDs. At each level, the unvisited
+        members of the current beam are accepted into the results in descending order of
+        similarity; the neighbors of the whole beam are then fetched in a single graph query,
+        their embeddings retrieved in a single batch, and all candidates scored in one
+        vectorized pass. The highest scoring `beam_width` candidates form the beam for the
+        next level. The search stops when the beam width (the maximum number of results) is
+        reached, the maximum depth is reached, or no more neighbors are found (see
+        `statement_beam_search()`).
 
         Args:
             query_embedding (np.ndarray): The embedding vector representing the query for
@@ -122,10 +129,6 @@ class SemanticBeamGraphSearch(SemanticGuidedBaseRetriever):
             and its corresponding path of IDs that led to it. The length of the returned list does
             not exceed the beam width.
         """
-        visited: Set[str] = set()
-        results: List[Tuple[str, List[str]]] = []
-        queue: PriorityQueue = PriorityQueue()
-
         # Get initial embeddings and scores
         start_embeddings = self.embedding_cache.get_embeddings(start_statement_ids)
         start_scores = get_top_k(
@@ -134,42 +137,21 @@ class SemanticBeamGraphSearch(SemanticGuidedBaseRetriever):
             len(start_statement_ids)
         )
 
-        # Initialize queue with start statements
-        for similarity, statement_id in start_scores:
-            queue.put((-similarity, 0, statement_id, [statement_id]))
-
-        while not queue.empty() and len(results) < self.beam_width:
-            neg_score, depth, current_id, path = queue.get()
-
-            if current_id in visited:
-                continue
-
-            visited.add(current_id)
-            results.append((current_id, path))
-
-            if depth < self.max_depth:
-                neighbor_ids = self.get_neighbors(current_id)
-                
-                if neighbor_ids:
-                    # Get embeddings for neighbors using shared cache
-                    neighbor_embeddings = self.embedding_cache.get_embeddings(neighbor_ids)
-                    
-                    # Score neighbors
-                    scored_neighbors = get_top_k(
-                        query_embedding,
-                        neighbor_embeddings,
-                        self.beam_width
-                    )
-
-                    # Add neighbors to queue
-                    for similarity, neighbor_id in scored_neighbors:
-                        if neighbor_id not in visited:
-                            new_path = path + [neighbor_id]
-                            queue.put(
-                                (-similarity, depth + 1, neighbor_id, new_path)
-                            )
-
-        return results
+        # Get embeddings for all candidates using shared cache, and score them in one pass
+        def score_candidates(candidate_ids:List[str]) -> List[Tuple[float, str]]:
+            return get_top_k(
+                query_embedding,
+                self.embedding_cache.get_embeddings(candidate_ids),
+                len(candidate_ids)
+            )
+
+        return statement_beam_search(
+            start_scores,
+            self.get_frontier_neighbors,
+            score_candidates,
+            self.beam_width,
+            self.max_depth
+        )
 
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """
@@ -9,13 +9,14 @@ from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.vector.vector_store import VectorStore
 from graphrag_toolkit.lexical_graph.storage.vector.dummy_vector_index import DummyVectorIndex
+from graphrag_toolkit.lexical_graph.retrieval.retrievers.threaded_retriever_mixin import ThreadedRetrieverMixin
 
 from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.schema import NodeWithScore, QueryBundle
 
 logger = logging.getLogger(__name__)
 
-class SemanticGuidedBaseChunkRetriever(BaseRetriever):
+class SemanticGuidedBaseChunkRetriever(ThreadedRetrieverMixin, BaseRetriever):
 
     def __init__(self, 
                 vector_store:VectorStore,
@@ -33,4 +34,4 @@ class SemanticGuidedBaseChunkRetriever(BaseRetriever):
 
     @abstractmethod
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
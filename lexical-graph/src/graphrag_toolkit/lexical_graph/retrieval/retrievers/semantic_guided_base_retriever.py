@@ -9,13 +9,14 @@ from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
 from graphrag_toolkit.lexical_graph.storage.vector.vector_store import VectorStore
 from graphrag_toolkit.lexical_graph.storage.vector.dummy_vector_index import DummyVectorIndex
+from graphrag_toolkit.lexical_graph.retrieval.retrievers.threaded_retriever_mixin import ThreadedRetrieverMixin
 
 from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.schema import NodeWithScore, QueryBundle
 
 logger = logging.getLogger(__name__)
 
-class SemanticGuidedBaseRetriever(BaseRetriever):
+class SemanticGuidedBaseRetriever(ThreadedRetrieverMixin, BaseRetriever):
     """
     Base class for semantic-guided retrievers.
 
@@ -88,4 +89,4 @@ class SemanticGuidedBaseRetriever(BaseRetriever):
             NotImplementedError: This method must be implemented by any subclass. A call
                 to the method in the base class will raise this exception.
         """
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
@@ -0,0 +1,23 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from typing import List
+
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+class ThreadedRetrieverMixin():
+    """
+    Provides an `_aretrieve()` for retrievers whose `_retrieve()` uses the synchronous
+    graph and vector store clients.
+
+    Mix in ahead of `BaseRetriever`, so that this `_aretrieve()` overrides the default
+    implementation, which calls `_retrieve()` directly on the event loop.
+    """
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """
+        Asynchronous version of `_retrieve()`. The graph and vector store clients are
+        synchronous, so retrieval runs on a worker thread, leaving the event loop free to
+        serve other queries.
+        """
+        return await asyncio.to_thread(self._retrieve, query_bundle)
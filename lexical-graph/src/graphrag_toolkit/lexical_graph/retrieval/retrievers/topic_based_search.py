@@ -2,8 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-import concurrent.futures
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Dict
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.retrieval.model import SearchResultCollection
@@ -76,42 +75,62 @@ class TopicBasedSearch(TraversalBasedBaseRetriever):
     
     def topic_based_graph_search(self, topic_id):
         """
-        Performs a graph search based on a specific topic ID. The method uses a Cypher
-        query to traverse a graph database, retrieving relevant `__Fact__` and associated
-        `__Statement__` nodes connected to a specific topic.
-
-        The query traverses relationships such as `__NEXT__`, `__SUPPORTS__`, and
-        `__BELONGS_TO__` to ensure that all relevant nodes and their connections are
-        retrieved based on the provided topic ID and query limits.
+        Performs a graph search based on a specific topic ID, retrieving the statements
+        connected to the topic grouped by topic and source.
 
         Args:
             topic_id (str): The ID of the topic for which the graph search will be performed.
 
         Returns:
             Any: Results from the graph database query represented in the format returned
-            by the `execute_query` method of the `graph_store`.
+            by the `get_statements_by_topic_and_source` method.
 
         Raises:
             Any error or exception raised by the `self.graph_store.execute_query` method.
         """
+        statement_ids = self.get_statement_ids_for_topics([topic_id]).get(topic_id, [])
+        return self.get_statements_by_topic_and_source(statement_ids)
+    
+    def get_statement_ids_for_topics(self, topic_ids:List[str]) -> Dict[str, List[str]]:
+        """
+        Retrieves the IDs of the statements connected to each of the given topics using a
+        single graph query.
+
+        The query traverses relationships such as `__NEXT__`, `__SUPPORTS__`, and
+        `__BELONGS_TO__` from the facts that support the topic's statements to the
+        statements supported by those facts and their neighbours. The number of facts and
+        statements per topic is limited to `intermediate_limit`.
+
+        Args:
+            topic_ids: The IDs of the topics to search.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary mapping each topic ID to the IDs of its statements.
+        """
+        if not topic_ids:
+            return {}
 
-        cypher = f'''// topic-based graph search                                  
+        cypher = f'''// topic-based graph search
+        UNWIND $topicIds AS topicId
         MATCH (f)-[:`__SUPPORTS__`]->()-[:`__BELONGS_TO__`]->(tt:`__Topic__`)
-        WHERE {self.graph_store.node_id("tt.topicId")} = $topicId
-        WITH f LIMIT $statementLimit
+        WHERE {self.graph_store.node_id("tt.topicId")} = topicId
+        WITH topicId, collect(f)[0..$statementLimit] AS facts
+        UNWIND facts AS f
         MATCH (f)-[:`__NEXT__`*0..1]-()-[:`__SUPPORTS__`]->(l)
-        RETURN DISTINCT {self.graph_store.node_id("l.statementId")} AS l LIMIT $statementLimit
+        WITH topicId, collect(DISTINCT {self.graph_store.node_id("l.statementId")})[0..$statementLimit] AS statementIds
+        RETURN topicId, statementIds
         '''
                             
         properties = {
-            'topicId': topic_id,
+            'topicIds': list(dict.fromkeys(topic_ids)),
             'statementLimit': self.args.intermediate_limit
         }
 
         results = self.graph_store.execute_query(cypher, properties)
-        statement_ids = [r['l'] for r in results]
 
-        return self.get_statements_by_topic_and_source(statement_ids)
+        return {
+            r['topicId']: r['statementIds'] for r in results
+        }
         
 
     def get_start_node_ids(self, query_bundle: QueryBundle) -> List[str]:
@@ -145,9 +164,10 @@ class TopicBasedSearch(TraversalBasedBaseRetriever):
     
     def do_graph_search(self, query_bundle: QueryBundle, start_node_ids:List[str]) -> SearchResultCollection:
         """
-        Executes a graph-based search leveraging a multi-threaded approach to perform
-        topic-based searches starting from a given set of node IDs and consolidates
-        the results into a unified collection.
+        Executes a topic-based graph search starting from a given set of node IDs and
+        consolidates the results into a unified collection. The statement IDs for all the
+        topics are fetched in a single graph query, and the statements for every topic are
+        then hydrated in a single batched query.
 
         Args:
             query_bundle: Encapsulates information about the search query, including
@@ -165,20 +185,18 @@ class TopicBasedSearch(TraversalBasedBaseRetriever):
 
         logger.debug('Running topic-based search...')
         
-        search_results = []
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.args.num_workers) as executor:
-
-            futures = [
-                executor.submit(self.topic_based_graph_search, topic_id)
-                for topic_id in topic_ids
-            ]
-            
-            executor.shutdown()
-
-            for future in futures:
-                for result in future.result():
-                    search_results.append(result)
+        statement_ids_by_topic = self.get_statement_ids_for_topics(topic_ids)
+
+        grouped_results = self.get_statements_by_topic_and_source_for_groups([
+            statement_ids_by_topic.get(topic_id, [])
+            for topic_id in topic_ids
+        ])
+
+        search_results = [
+            result
+            for results in grouped_results
+            for result in results
+        ]
                     
         search_results_collection = self._to_search_results_collection(search_results) 
         
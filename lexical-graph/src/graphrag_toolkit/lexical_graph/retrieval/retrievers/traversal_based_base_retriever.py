@@ -4,7 +4,8 @@
 import logging
 import abc
 import time
-from typing import List, Any, Type, Optional
+from collections import defaultdict
+from typing import List, Any, Type, Optional, Dict
 from importlib.metadata import version, PackageNotFoundError
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
@@ -15,6 +16,7 @@ from graphrag_toolkit.lexical_graph.retrieval.query_context import KeywordProvid
 from graphrag_toolkit.lexical_graph.retrieval.query_context import EntityProvider, EntityVSSProvider, EntityContextProvider
 from graphrag_toolkit.lexical_graph.retrieval.model import SearchResultCollection, SearchResult, EntityContexts
 from graphrag_toolkit.lexical_graph.retrieval.processors import *
+from graphrag_toolkit.lexical_graph.retrieval.retrievers.threaded_retriever_mixin import ThreadedRetrieverMixin
 
 from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
@@ -44,7 +46,7 @@ DEFAULT_FORMATTING_PROCESSORS = [
     TruncateResults
 ]
 
-class TraversalBasedBaseRetriever(BaseRetriever):
+class TraversalBasedBaseRetriever(ThreadedRetrieverMixin, BaseRetriever):
     """
     Base class for retrieval using traversal-based methods combining a graph store and a
     vector store for querying and search.
@@ -125,20 +127,62 @@ class TraversalBasedBaseRetriever(BaseRetriever):
         self.filter_config = filter_config or FilterConfig()
         
     def get_statements_by_topic_and_source(self, statement_ids):
+        """
+        Retrieves the given statements, together with their facts, grouped by topic and
+        source. Results are ordered by descending score and limited to `query_limit` sources.
 
-        statements_params = {
-            'statementLimit': self.args.intermediate_limit,
-            'limit': self.args.query_limit,
-            'statementIds': statement_ids
-        }
+        Args:
+            statement_ids: The IDs of the statements to retrieve.
+
+        Returns:
+            List[Dict[str, Any]]: A list of `{'result': {'score', 'source', 'topics'}}` dictionaries.
+        """
+        return self.get_statements_by_topic_and_source_for_groups([statement_ids])[0]
+
+    def get_statements_by_topic_and_source_for_groups(self, statement_id_groups:List[List[str]]) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieves several groups of statements, together with their facts, topics and sources,
+        using a single graph query over the union of all the statement ids. The query returns
+        one row per source; the rows are then regrouped client-side so that each group of
+        statement ids yields the same results `get_statements_by_topic_and_source()` would
+        return for that group on its own.
+
+        Args:
+            statement_id_groups: A list of groups of statement IDs – typically one group per
+                start node (chunk, topic, etc) of a graph search.
+
+        Returns:
+            List[List[Dict[str, Any]]]: A list, in the same order as `statement_id_groups`,
+            of lists of `{'result': {'score', 'source', 'topics'}}` dictionaries.
+        """
+        all_statement_ids = list({
+            statement_id
+            for statement_ids in statement_id_groups
+            for statement_id in statement_ids
+        })
+
+        if not all_statement_ids:
+            return [[] for _ in statement_id_groups]
 
         statements_cypher = f'''
-        // get statements grouped by topic and source
+        // get statements, facts, topics and sources
         MATCH (t)<-[:`__BELONGS_TO__`]-(l:`__Statement__`)   
               -[:`__MENTIONED_IN__`]->(c)
               -[:`__EXTRACTED_FROM__`]->(s)
         WHERE {self.graph_store.node_id("l.statementId")} in $statementIds
-        WITH {{ 
+        OPTIONAL MATCH (f)-[:`__SUPPORTS__`]->(l)
+        WITH s, t, l, c, collect(distinct f.value) AS facts
+        WITH s, collect({{
+                topic: t.value,
+                topicId: {self.graph_store.node_id("t.topicId")},
+                chunkId: {self.graph_store.node_id("c.chunkId")},
+                statementId: {self.graph_store.node_id("l.statementId")},
+                statement: l.value,
+                details: l.details,
+                facts: facts
+            }}) AS statements
+        RETURN {{ 
+            source: {{ 
                 sourceId: {self.graph_store.node_id("s.sourceId")}, 
                 metadata: properties(s), 
                 versioning: {{
@@ -148,55 +192,83 @@ class TraversalBasedBaseRetriever(BaseRetriever):
                     build_timestamp: coalesce(s.{BUILD_TIMESTAMP}, {TIMESTAMP_LOWER_BOUND}),
                     id_fields: split(coalesce(s.{VERSION_INDEPENDENT_ID_FIELDS}, ""), ";")
                 }}  
-            }} AS source,
-            t, l, c,
-            {{ chunkId: {self.graph_store.node_id("c.chunkId")}, value: NULL }} AS cc, 
-            {{ statementId: {self.graph_store.node_id("l.statementId")}, statement: l.value, facts: [], details: l.details, chunkId: {self.graph_store.node_id("c.chunkId")}, score: 0 }} as ll
-        WITH source, 
-            t, 
-            collect(distinct cc) as chunks, 
-            collect(ll) as statements
-        WITH source,
-            {{ 
-                topic: t.value, 
-                topicId: {self.graph_store.node_id("t.topicId")},
-                chunks: chunks,
-                statements: statements
-            }} as topic
-        WITH sum(size(topic.statements)/size(topic.chunks)) AS score, source, collect(topic) AS topics
-        RETURN {{
-            score: score, 
-            source: source,
-            topics: topics
-        }} as result ORDER BY result.score DESC LIMIT $limit'''
-        
-        statements_results =  self.graph_store.execute_query(statements_cypher, statements_params)
-    
-        statement_facts_cypher = f'''// get facts for statements
-        MATCH (f)-[:`__SUPPORTS__`]->(l:`__Statement__`)
-        WHERE {self.graph_store.node_id("l.statementId")} in $statementIds
-        RETURN {self.graph_store.node_id("l.statementId")} AS statementId, collect(distinct f.value) AS facts'''
+            }},
+            statements: statements
+        }} AS result'''
 
-        statement_facts_params = {
-            'statementIds': statement_ids
+        statements_params = {
+            'statementIds': all_statement_ids
         }
 
-        statement_facts_results = self.graph_store.execute_query(statement_facts_cypher, statement_facts_params)
+        statements_results = self.graph_store.execute_query(statements_cypher, statements_params)
 
-        statement_facts = {
-            r['statementId']:r['facts'] for r in statement_facts_results
-        }
+        sources = {}
+        statement_rows = defaultdict(list)
 
         for statements_result in statements_results:
             result = statements_result['result']
-            for topic in result['topics']:
-                for statement in topic['statements']:
-                    facts = statement_facts.get(statement['statementId'], [])
-                    if facts:
-                        statement['facts'] = facts
-                        statement['score'] = len(facts)
-
-        return statements_results
+            source_id = result['source']['sourceId']
+            sources[source_id] = result['source']
+            for statement in result['statements']:
+                statement_rows[statement['statementId']].append((source_id, statement))
+
+        return [
+            self._group_statements_by_topic_and_source(statement_ids, sources, statement_rows)
+            for statement_ids in statement_id_groups
+        ]
+
+    def _group_statements_by_topic_and_source(self, statement_ids, sources, statement_rows):
+
+        topics_by_source = {}
+
+        for statement_id in dict.fromkeys(statement_ids):
+            for source_id, row in statement_rows.get(statement_id, []):
+                topics = topics_by_source.setdefault(source_id, {})
+                topic = topics.get(row['topicId'])
+                if topic is None:
+                    topic = {
+                        'topic': row['topic'],
+                        'topicId': row['topicId'],
+                        'chunks': {},
+                        'statements': []
+                    }
+                    topics[row['topicId']] = topic
+                topic['chunks'].setdefault(row['chunkId'], {'chunkId': row['chunkId'], 'value': None})
+                facts = row['facts'] or []
+                topic['statements'].append({
+                    'statementId': row['statementId'],
+                    'statement': row['statement'],
+                    'facts': list(facts),
+                    'details': row['details'],
+                    'chunkId': row['chunkId'],
+                    'score': len(facts)
+                })
+
+        results = []
+
+        for source_id, topics in topics_by_source.items():
+            topic_list = [
+                {
+                    'topic': topic['topic'],
+                    'topicId': topic['topicId'],
+                    'chunks': list(topic['chunks'].values()),
+                    'statements': topic['statements']
+                }
+                for topic in topics.values()
+            ]
+            # Matches the integer arithmetic of the original Cypher scoring: sum(size(statements)/size(chunks))
+            score = sum(len(topic['statements']) // len(topic['chunks']) for topic in topic_list)
+            results.append({
+                'result': {
+                    'score': score,
+                    'source': sources[source_id],
+                    'topics': topic_list
+                }
+            })
+
+        results.sort(key=lambda r: r['result']['score'], reverse=True)
+
+        return results[:self.args.query_limit]
     
     def _init(self, query_bundle: QueryBundle) -> List[str]:
 
@@ -238,20 +310,21 @@ class TraversalBasedBaseRetriever(BaseRetriever):
             self.entity_contexts.contexts.extend(entity_contexts.contexts)
             self.entity_contexts.keywords.extend(keywords)
 
-    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+    def retrieve_search_results(self, query_bundle: QueryBundle) -> SearchResultCollection:
         """
-        Retrieves nodes with associated scores by performing a graph search and applying processing routines.
+        Performs the graph search for the given query and applies the (non-formatting)
+        processors, returning the results as a `SearchResultCollection`.
 
-        This function performs a search operation starting from the relevant node IDs determined by
-        the provided query. It then applies a series of processing steps to refine the search results and
-        format them accordingly. The retrieval and processing durations are logged for performance analysis.
+        Unlike `retrieve()`, the results are not serialized into nodes. Retrievers that
+        compose other traversal-based retrievers in-process use this method to consume
+        their results directly, so that results are serialized only once, by the outermost
+        retriever.
 
         Args:
             query_bundle (QueryBundle): The query input containing necessary parameters for performing the graph search.
 
         Returns:
-            List[NodeWithScore]: A list of nodes with their associated scores, ready for further processing or display.
-
+            SearchResultCollection: The processed search results.
         """
         logger.debug(f'[{type(self).__name__}] Begin retrieve [query: {query_bundle.query_str}, args: {self.args.to_dict()}]')
         
@@ -267,11 +340,6 @@ class TraversalBasedBaseRetriever(BaseRetriever):
         for processor in self.processors:
             search_results = processor(self.args, self.filter_config).process_results(search_results, query_bundle, type(self).__name__)
 
-        formatted_search_results = search_results.model_copy(deep=True)
-        
-        for processor in self.formatting_processors:
-            formatted_search_results = processor(self.args, self.filter_config).process_results(formatted_search_results, query_bundle, type(self).__name__)
-        
         end_processing = time.time()
 
         retrieval_ms = (end_retrieve-start_retrieve) * 1000
@@ -280,6 +348,33 @@ class TraversalBasedBaseRetriever(BaseRetriever):
         logger.debug(f'[{type(self).__name__}] Retrieval: {retrieval_ms:.2f}ms')
         logger.debug(f'[{type(self).__name__}] Processing: {processing_ms:.2f}ms')
 
+        return search_results
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """
+        Retrieves nodes with associated scores by performing a graph search and applying processing routines.
+
+        This function performs a search operation starting from the relevant node IDs determined by
+        the provided query (see `retrieve_search_results()`). It then applies the formatting processors
+        to a copy of the results, and serializes the results into nodes.
+
+        Args:
+            query_bundle (QueryBundle): The query input containing necessary parameters for performing the graph search.
+
+        Returns:
+            List[NodeWithScore]: A list of nodes with their associated scores, ready for further processing or display.
+
+        """
+        search_results = self.retrieve_search_results(query_bundle)
+
+        if self.formatting_processors:
+            # Formatting processors modify results, so are applied to a copy
+            formatted_search_results = search_results.model_copy(deep=True)
+            for processor in self.formatting_processors:
+                formatted_search_results = processor(self.args, self.filter_config).process_results(formatted_search_results, query_bundle, type(self).__name__)
+        else:
+            formatted_search_results = search_results
+
         entity_contexts = formatted_search_results.entity_contexts.model_dump()
 
         return [
@@ -4,9 +4,12 @@
 import numpy as np
 import threading
 import logging
-from typing import Dict, List
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Iterator, Optional, Sequence, Set, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import node_result
 from graphrag_toolkit.lexical_graph.storage.vector import VectorStore
 
@@ -28,7 +31,8 @@ def cosine_similarity(query_embedding, statement_embeddings):
             embedding of the query.
         statement_embeddings: A dictionary where keys are statement IDs and
             values are 1D array-like structures representing the vector embeddings
-            of the corresponding statements.
+            of the corresponding statements, or a `StatementEmbeddings` batch, whose
+            contiguous embedding matrix and precomputed norms are used directly.
 
     Returns:
         tuple: A tuple containing:
@@ -46,6 +50,13 @@ def cosine_similarity(query_embedding, statement_embeddings):
     if not statement_embeddings:
         return np.array([]), []
 
+    if isinstance(statement_embeddings, StatementEmbeddings):
+        query_embedding = np.asarray(query_embedding, dtype=np.float32)
+        statement_ids = statement_embeddings.ids
+        dot_product = statement_embeddings.matrix @ query_embedding
+        norms = statement_embeddings.norms * np.linalg.norm(query_embedding)
+        return dot_product / norms, statement_ids
+
     query_embedding = np.array(query_embedding)
     statement_ids, statement_embeddings = zip(*statement_embeddings.items())
     statement_embeddings = np.array(statement_embeddings)
@@ -64,9 +75,9 @@ def get_top_k(query_embedding, statement_embeddings, top_k):
     Args:
         query_embedding: A vector that represents the query to compare against
             statement embeddings.
-        statement_embeddings: A list of vectors where each vector represents a
-            statement for similarity comparison. If an empty list is provided,
-            the function returns an empty result.
+        statement_embeddings: A dictionary of statement IDs to embeddings, or a
+            `StatementEmbeddings` batch, for similarity comparison. If it is
+            empty, the function returns an empty result.
         top_k: The number of top statements to retrieve based on cosine similarity.
 
     Returns:
@@ -75,20 +86,25 @@ def get_top_k(query_embedding, statement_embeddings, top_k):
         similarity scores. An empty list is returned if no similarities are
         calculated or if statement_embeddings is empty.
     """
-    logger.debug(f'statement_embeddings: {statement_embeddings}')
+    logger.debug(f'num statement_embeddings: {len(statement_embeddings)}')
 
     if not statement_embeddings:
         return []  
     
     similarities, statement_ids = cosine_similarity(query_embedding, statement_embeddings)
 
-    logger.debug(f'similarities: {similarities}')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f'similarities: {similarities}')
     
     if len(similarities) == 0:
         return []
 
     top_k = min(top_k, len(similarities))
-    top_indices = np.argsort(similarities)[::-1][:top_k]
+    if top_k < len(similarities):
+        top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices], kind='stable')]
+    else:
+        top_indices = np.argsort(-similarities, kind='stable')
 
     top_statement_ids = [statement_ids[idx] for idx in top_indices]
     top_similarities = similarities[top_indices]
@@ -133,6 +149,133 @@ def get_statements_query(graph_store, statement_ids):
                         results.append(statement)
     return results
 
+def get_statement_neighbors_query(graph_store, statement_ids, search_type='beam search'):
+    """
+    Fetches the neighbours of a set of statements in a single query. Neighbouring
+    statements are statements supported by any of the entities connected to a statement.
+
+    Args:
+        graph_store: An instance of a graph database store that provides methods
+            to handle node IDs and execute queries.
+        statement_ids: A list of statement IDs whose neighbours are to be retrieved.
+        search_type: A description of the search issuing the query, included in the
+            query comment.
+
+    Returns:
+        Dict[str, List[str]]: A dictionary mapping each of the given statement IDs to
+            the IDs of its neighbouring statements. Statements with no neighbours are
+            mapped to an empty list.
+    """
+    results = {statement_id: [] for statement_id in statement_ids}
+
+    if not statement_ids:
+        return results
+
+    cypher = f"""
+    // get statement neighbours ({search_type})
+    MATCH (e)-[:`__SUBJECT__`|`__OBJECT__`]->()-[:`__SUPPORTS__`]->(s:`__Statement__`)
+    WHERE {graph_store.node_id('s.statementId')} IN $statementIds
+    WITH s, COLLECT(DISTINCT e) AS entities
+    UNWIND entities AS entity
+    MATCH (entity)-[:`__SUBJECT__`|`__OBJECT__`]->()-[:`__SUPPORTS__`]->(e_neighbors)
+    RETURN {graph_store.node_id('s.statementId')} AS statementId, COLLECT(DISTINCT {graph_store.node_id('e_neighbors.statementId')}) AS neighborIds
+    """
+
+    neighbors = graph_store.execute_query(cypher, {'statementIds': list(statement_ids)})
+
+    for n in neighbors:
+        results[n['statementId']] = n['neighborIds']
+
+    return results
+
+def statement_beam_search(
+    start_scores:List[Tuple[float, str]],
+    get_frontier_neighbors:Callable[[List[str]], Dict[str, List[str]]],
+    score_candidates:Callable[[List[str]], List[Tuple[float, str]]],
+    beam_width:int,
+    max_depth:int
+) -> List[Tuple[str, List[str]]]:
+    """
+    Performs a level-synchronous beam search over the statement graph.
+
+    At each level, the unvisited members of the current beam are accepted into the results
+    in descending order of score; the neighbors of the whole beam are then fetched with a
+    single call to `get_frontier_neighbors`, and all the unvisited candidates scored with a
+    single call to `score_candidates`. The highest scoring `beam_width` candidates form the
+    beam for the next level, each reached via the highest scoring frontier member that
+    links to it. The search stops when `beam_width` results have been accepted, the maximum
+    depth is reached, or no more neighbors are found.
+
+    Args:
+        start_scores: The scored start statements, as (score, statement_id) tuples.
+        get_frontier_neighbors: Returns a dictionary mapping each of the given statement
+            IDs to the IDs of its neighbouring statements.
+        score_candidates: Scores the given statement IDs, returning (score, statement_id)
+            tuples.
+        beam_width: The beam width, and the maximum number of results.
+        max_depth: The maximum number of levels to expand.
+
+    Returns:
+        List[Tuple[str, List[str]]]: The accepted statement IDs, each with the path of
+            statement IDs that led to it.
+    """
+    visited: Set[str] = set()
+    results: List[Tuple[str, List[str]]] = []
+
+    # Initial beam comprises the start statements: [(score, statement_id, path), ...]
+    beam = [
+        (score, statement_id, [statement_id])
+        for score, statement_id in sorted(start_scores, key=lambda s: s[0], reverse=True)
+    ]
+    depth = 0
+
+    while beam and len(results) < beam_width:
+
+        # Accept beam members in descending order of score
+        frontier: List[Tuple[str, List[str]]] = []
+        for _, current_id, path in beam:
+            if current_id in visited:
+                continue
+            visited.add(current_id)
+            results.append((current_id, path))
+            frontier.append((current_id, path))
+            if len(results) >= beam_width:
+                break
+
+        if depth >= max_depth or len(results) >= beam_width or not frontier:
+            break
+
+        # Expand the whole frontier with a single neighbors query
+        frontier_neighbors = get_frontier_neighbors([current_id for current_id, _ in frontier])
+
+        candidate_ids = list({
+            neighbor_id
+            for neighbor_ids in frontier_neighbors.values()
+            for neighbor_id in neighbor_ids
+            if neighbor_id not in visited
+        })
+
+        if not candidate_ids:
+            break
+
+        # Score all candidates in one pass
+        candidate_scores = {
+            neighbor_id: score
+            for score, neighbor_id in score_candidates(candidate_ids)
+        }
+
+        # Each candidate is reached via the highest scoring frontier member that links to it
+        next_beam = {}
+        for current_id, path in frontier:
+            for neighbor_id in frontier_neighbors.get(current_id, []):
+                if neighbor_id in candidate_scores and neighbor_id not in next_beam:
+                    next_beam[neighbor_id] = (candidate_scores[neighbor_id], neighbor_id, path + [neighbor_id])
+
+        beam = sorted(next_beam.values(), key=lambda c: c[0], reverse=True)[:beam_width]
+        depth += 1
+
+    return results
+
 def get_free_memory(gpu_index):
     """
     Retrieves the amount of free memory on a specific GPU device in megabytes (MB).
@@ -193,6 +336,102 @@ def get_top_free_gpus(n=2):
                 "torch package not found, install with 'pip install torch'"
             ) from e
 
+class StatementEmbeddings(Mapping):
+    """
+    A read-only mapping of statement IDs to embeddings, backed by a contiguous float32
+    matrix (one row per statement) and the precomputed L2 norm of each row.
+
+    Attributes:
+        ids (List[str]): The statement IDs, in row order.
+        matrix (np.ndarray): A (number of statements x embedding dimensions) float32 array.
+        norms (np.ndarray): The L2 norm of each row of the matrix.
+    """
+    def __init__(self, ids:Sequence[str], matrix:np.ndarray, norms:np.ndarray):
+        self.ids = list(ids)
+        self.matrix = matrix
+        self.norms = norms
+        self._positions = {statement_id: i for i, statement_id in enumerate(self.ids)}
+
+    def __getitem__(self, statement_id:str) -> np.ndarray:
+        return self.matrix[self._positions[statement_id]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, statement_id) -> bool:
+        return statement_id in self._positions
+
+
+class _EmbeddingStripe:
+    """
+    One lock-protected partition of a `SharedEmbeddingCache`. Embeddings are stored as
+    rows of a float32 array that grows on demand up to the stripe's capacity; when the
+    stripe is full, the row of the least-recently-used embedding is reused.
+    """
+    def __init__(self, capacity:int):
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.slots:OrderedDict = OrderedDict()
+        self.embeddings:Optional[np.ndarray] = None
+        self.norms:Optional[np.ndarray] = None
+
+    def _allocate_slot(self, dimensions:int) -> int:
+
+        if self.embeddings is None:
+            num_rows = min(self.capacity, 64)
+            self.embeddings = np.empty((num_rows, dimensions), dtype=np.float32)
+            self.norms = np.empty(num_rows, dtype=np.float32)
+
+        if len(self.slots) < self.capacity:
+            slot = len(self.slots)
+            if slot >= len(self.embeddings):
+                num_rows = min(self.capacity, len(self.embeddings) * 2)
+                embeddings = np.empty((num_rows, dimensions), dtype=np.float32)
+                embeddings[:slot] = self.embeddings[:slot]
+                norms = np.empty(num_rows, dtype=np.float32)
+                norms[:slot] = self.norms[:slot]
+                self.embeddings, self.norms = embeddings, norms
+            return slot
+        
+        _, slot = self.slots.popitem(last=False)
+        return slot
+
+    def get(self, statement_ids:List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        with self.lock:
+            found_ids = []
+            found_slots = []
+            for statement_id in statement_ids:
+                slot = self.slots.get(statement_id)
+                if slot is not None:
+                    self.slots.move_to_end(statement_id)
+                    found_ids.append(statement_id)
+                    found_slots.append(slot)
+            if not found_ids:
+                return ([], None, None)
+            return (found_ids, self.embeddings[found_slots], self.norms[found_slots])
+
+    def put(self, statement_ids:List[str], embeddings:np.ndarray, norms:np.ndarray):
+        with self.lock:
+            dimensions = embeddings.shape[1]
+            if self.embeddings is not None and self.embeddings.shape[1] != dimensions:
+                logger.warning(f'Not caching embeddings with {dimensions} dimensions (expected {self.embeddings.shape[1]})')
+                return
+            for i, statement_id in enumerate(statement_ids):
+                slot = self.slots.get(statement_id)
+                if slot is None:
+                    slot = self._allocate_slot(dimensions)
+                self.slots[statement_id] = slot
+                self.slots.move_to_end(statement_id)
+                self.embeddings[slot] = embeddings[i]
+                self.norms[slot] = norms[i]
+
+    def __len__(self):
+        return len(self.slots)
+
+
 class SharedEmbeddingCache:
     """
     SharedEmbeddingCache manages a cache for embeddings, which are fetched from a
@@ -204,45 +443,102 @@ class SharedEmbeddingCache:
     are missing, these are fetched and cached for future use. The class includes
     retry logic to handle transient failures during fetching operations.
 
+    The cache is bounded: when it is full, least-recently-used embeddings are evicted.
+    Embeddings are held as rows of contiguous float32 arrays, together with their L2
+    norms. To reduce contention between concurrent queries, the cache is divided into
+    a number of stripes, each with its own lock and its own share of the capacity;
+    each statement ID is assigned to a stripe by hash.
+
     Attributes:
         vector_store (VectorStore): The vector store containing statement indexes
             and embeddings.
-        _cache (Dict[str, np.ndarray]): A dictionary acting as an internal cache
-            to store embeddings by their statement IDs.
-        _lock (threading.Lock): A lock to ensure thread-safe access to the cache or
-            updates.
+        max_entries (int): The maximum number of embeddings held in the cache.
+            Defaults to `GraphRAGConfig.statement_embedding_cache_size`.
+        num_stripes (int): The number of independently locked partitions of the cache.
     """
-    def __init__(self, vector_store:VectorStore):
-        self._cache: Dict[str, np.ndarray] = {}
-        self._lock = threading.Lock()
+    def __init__(self, vector_store:VectorStore, max_entries:Optional[int]=None, num_stripes:int=16):
         self.vector_store = vector_store
+        self.max_entries = max(1, max_entries or GraphRAGConfig.statement_embedding_cache_size)
+        self.num_stripes = max(1, min(num_stripes, self.max_entries))
+        stripe_capacity, remainder = divmod(self.max_entries, self.num_stripes)
+        self._stripes = [
+            _EmbeddingStripe(stripe_capacity + (1 if i < remainder else 0)) 
+            for i in range(self.num_stripes)
+        ]
+
+    def __len__(self):
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def _group_by_stripe(self, statement_ids:Sequence[str]) -> Dict[int, List[int]]:
+        positions_by_stripe = {}
+        for position, statement_id in enumerate(statement_ids):
+            positions_by_stripe.setdefault(hash(statement_id) % self.num_stripes, []).append(position)
+        return positions_by_stripe
+
+    def get_cached_embeddings(self, statement_ids:Sequence[str]) -> StatementEmbeddings:
+        """
+        Returns those of the given statements' embeddings that are in the cache, without
+        fetching missing embeddings from the vector store. Statements are returned in the
+        order in which they were requested.
+        """
+        statement_ids = list(dict.fromkeys(statement_ids))
+        
+        found = {}
+        for stripe_index, positions in self._group_by_stripe(statement_ids).items():
+            found_ids, embeddings, norms = self._stripes[stripe_index].get([statement_ids[p] for p in positions])
+            for i, statement_id in enumerate(found_ids):
+                found[statement_id] = (embeddings[i], norms[i])
+
+        found_ids = [statement_id for statement_id in statement_ids if statement_id in found]
+        
+        if not found_ids:
+            return StatementEmbeddings([], np.empty((0, 0), dtype=np.float32), np.empty(0, dtype=np.float32))
+        
+        return StatementEmbeddings(
+            found_ids,
+            np.stack([found[statement_id][0] for statement_id in found_ids]),
+            np.array([found[statement_id][1] for statement_id in found_ids], dtype=np.float32)
+        )
+
+    def put_embeddings(self, statement_ids:Sequence[str], embeddings:np.ndarray):
+        """
+        Adds the given embeddings (a 2D array with one row per statement) to the cache,
+        evicting least-recently-used embeddings if necessary.
+        """
+        if not len(statement_ids):
+            return
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1)
+        for stripe_index, positions in self._group_by_stripe(statement_ids).items():
+            self._stripes[stripe_index].put([statement_ids[p] for p in positions], embeddings[positions], norms[positions])
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10),retry=retry_if_exception_type(Exception))
-    def _fetch_embeddings(self, statement_ids: List[str]) -> Dict[str, np.ndarray]:
+    def _fetch_embeddings(self, statement_ids: List[str]) -> Tuple[List[str], np.ndarray]:
         """
         Fetches embeddings for the specified statement IDs from the vector store.
 
         Utilizes an exponential backoff retry mechanism to handle transient errors.
         This method interacts with a vector store backend to retrieve embeddings
-        associated with given statement IDs. The returned embeddings are transformed
-        and formatted into a dictionary mapping each statement ID to a corresponding
-        NumPy array.
+        associated with given statement IDs.
 
         Args:
             statement_ids (List[str]): A list of statement IDs for which to fetch
                 embeddings.
 
         Returns:
-            Dict[str, np.ndarray]: A dictionary where keys are statement IDs and
-                values are NumPy arrays of the corresponding embeddings.
+            Tuple[List[str], np.ndarray]: The IDs of the statements for which embeddings
+                were found, and a float32 array containing their embeddings, one row per
+                statement.
         """
         embeddings = self.vector_store.get_index('statement').get_embeddings(statement_ids)
-        return {
-            e['statement']['statementId']: np.array(e['embedding']) 
-            for e in embeddings
-        }
-
-    def get_embeddings(self, statement_ids: List[str]) -> Dict[str, np.ndarray]:
+        if not embeddings:
+            return ([], np.empty((0, 0), dtype=np.float32))
+        return (
+            [e['statement']['statementId'] for e in embeddings],
+            np.array([e['embedding'] for e in embeddings], dtype=np.float32)
+        )
+
+    def get_embeddings(self, statement_ids: List[str]) -> StatementEmbeddings:
         """
         Retrieves the embeddings for the provided statement identifiers. The method first attempts
         to fetch embeddings from the internal cache. If any requested embeddings are not found in
@@ -254,33 +550,46 @@ class SharedEmbeddingCache:
             statement_ids (List[str]): A list of statement identifiers for which embeddings are needed.
 
         Returns:
-            Dict[str, np.ndarray]: A dictionary mapping each statement identifier to its
-            corresponding embedding as a NumPy array.
+            StatementEmbeddings: A mapping of each statement identifier to its corresponding
+            embedding, backed by a contiguous float32 matrix, in the order in which the
+            statements were requested.
         """
-        missing_ids = []
-        cached_embeddings = {}
+        statement_ids = list(dict.fromkeys(statement_ids))
 
-        logger.debug(f'statement_ids: {statement_ids}')
+        logger.debug(f'num statement_ids: {len(statement_ids)}')
 
         # Check cache first
-        for sid in statement_ids:
-            if sid in self._cache:
-                cached_embeddings[sid] = self._cache[sid]
-            else:
-                missing_ids.append(sid)
+        cached_embeddings = self.get_cached_embeddings(statement_ids)
+        missing_ids = [sid for sid in statement_ids if sid not in cached_embeddings]
+
+        logger.debug(f'num missing_ids: {len(missing_ids)}')
 
-        logger.debug(f'missing_ids: {missing_ids}')
+        if not missing_ids:
+            return cached_embeddings
 
         # Fetch missing embeddings with retry
-        if missing_ids:
-            try:
-                new_embeddings = self._fetch_embeddings(missing_ids)
-                with self._lock:
-                    self._cache.update(new_embeddings)
-                    cached_embeddings.update(new_embeddings)
-            except Exception as e:
-                logger.error(f"Failed to fetch embeddings after retries: {e}")
-                # Return what we have from cache
-                logger.warning(f"Returning {len(cached_embeddings)} cached embeddings out of {len(statement_ids)} requested")
-
-        return cached_embeddings
\ No newline at end of file
+        try:
+            fetched_ids, fetched_embeddings = self._fetch_embeddings(missing_ids)
+            self.put_embeddings(fetched_ids, fetched_embeddings)
+        except Exception as e:
+            logger.error(f"Failed to fetch embeddings after retries: {e}")
+            # Return what we have from cache
+            logger.warning(f"Returning {len(cached_embeddings)} cached embeddings out of {len(statement_ids)} requested")
+            return cached_embeddings
+
+        if not fetched_ids:
+            return cached_embeddings
+        
+        if not cached_embeddings:
+            return StatementEmbeddings(fetched_ids, fetched_embeddings, np.linalg.norm(fetched_embeddings, axis=1))
+
+        positions = {statement_id: ('cached', i) for i, statement_id in enumerate(cached_embeddings.ids)}
+        positions.update({statement_id: ('fetched', i) for i, statement_id in enumerate(fetched_ids)})
+        
+        ids = [statement_id for statement_id in statement_ids if statement_id in positions]
+        matrix = np.stack([
+            cached_embeddings.matrix[i] if source == 'cached' else fetched_embeddings[i]
+            for (source, i) in (positions[statement_id] for statement_id in ids)
+        ])
+
+        return StatementEmbeddings(ids, matrix, np.linalg.norm(matrix, axis=1))
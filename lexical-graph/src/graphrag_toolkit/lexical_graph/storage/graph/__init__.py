@@ -5,4 +5,5 @@ from .graph_store import GraphStore, RedactedGraphQueryLogFormatting, NonRedacte
 from .graph_store_factory_method import GraphStoreFactoryMethod
 from .multi_tenant_graph_store import MultiTenantGraphStore
 from .dummy_graph_store import DummyGraphStore
-from .query_tree import Query, QueryTree
\ No newline at end of file
+from .query_tree import Query, QueryTree
+from .query_template_registry import QueryTemplate, QueryTemplateRegistry, normalize_query, default_query_template_registry
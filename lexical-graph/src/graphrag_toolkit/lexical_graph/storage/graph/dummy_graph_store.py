@@ -4,6 +4,9 @@
 import logging
 
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStoreFactoryMethod, GraphStore, get_log_formatting
+from graphrag_toolkit.lexical_graph.storage.graph.query_template_registry import QueryTemplateRegistry
+
+from llama_index.core.bridge.pydantic import PrivateAttr
 
 DUMMY = 'dummy://'
 
@@ -58,7 +61,18 @@ class DummyGraphStore(GraphStore):
         log_formatting (LogFormatter): An instance of LogFormatter used for formatting log entries.
         _logging_prefix (callable): A callable function or method responsible for generating the
             logging prefix based on the provided correlation ID.
+        _query_template_registry (QueryTemplateRegistry): Records the template of every query
+            executed against this store, so that tests can check which queries are parameterized.
     """
+    _query_template_registry: QueryTemplateRegistry = PrivateAttr(default_factory=QueryTemplateRegistry)
+
+    @property
+    def query_template_registry(self) -> QueryTemplateRegistry:
+        """
+        The registry of templates of the queries executed against this store.
+        """
+        return self._query_template_registry
+
     def _execute_query(self, cypher, parameters={}, correlation_id=None):
         """
         Executes the given Cypher query with specified parameters and logs the operation.
@@ -77,8 +91,10 @@ class DummyGraphStore(GraphStore):
             A list as a placeholder for query execution results. Currently, it does
             not retrieve any actual results.
         """
+        query_template = self._query_template_registry.register(cypher)
+        self._query_template_registry.record_execution(query_template, 0.0)
         log_entry_parameters = self.log_formatting.format_log_entry(self._logging_prefix(correlation_id), cypher,
                                                                     parameters)
         logger.debug(
-            f'[{log_entry_parameters.query_ref}] query: {log_entry_parameters.query}, parameters: {log_entry_parameters.parameters}')
+            f'[{log_entry_parameters.query_ref}] template_id: {query_template.template_id}, query: {log_entry_parameters.query}, parameters: {log_entry_parameters.parameters}')
         return []
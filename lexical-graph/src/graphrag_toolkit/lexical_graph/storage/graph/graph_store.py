@@ -11,6 +11,7 @@ from typing import Callable, List, Dict, Any, Optional, Union
 
 from graphrag_toolkit.lexical_graph import TenantId, GraphQueryError
 from graphrag_toolkit.lexical_graph.storage.graph.query_tree import QueryTree
+from graphrag_toolkit.lexical_graph.utils.fm_observability import trace_span
 
 from llama_index.core.bridge.pydantic import BaseModel, Field
 
@@ -431,7 +432,8 @@ class GraphStore(BaseModel):
                     attempt_number += 1
                     attempt.retry_state.attempt_number
                     if isinstance(query, str):
-                        return self._execute_query(query, parameters, **kwargs)
+                        with trace_span('graph.query', attempt=attempt_number):
+                            return self._execute_query(query, parameters, **kwargs)
                     elif isinstance(query, QueryTree):
                         return query.run(parameters, self.execute_query_with_retry)
                     else:
@@ -1,12 +1,20 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import re
+import threading
 from typing import List, Dict, Any, Optional, Callable
 
+from llama_index.core.bridge.pydantic import PrivateAttr
+
 from graphrag_toolkit.lexical_graph import TenantId
 from graphrag_toolkit.lexical_graph.storage.constants import LEXICAL_GRAPH_LABELS
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore, NodeId
 
+MAX_REWRITTEN_QUERIES = 4096
+
+_rewrite_lock = threading.Lock()
+
 class MultiTenantGraphStore(GraphStore):
     """
     Represents a multi-tenant graph store.
@@ -16,6 +24,10 @@ class MultiTenantGraphStore(GraphStore):
     class ensures that graph operations are isolated and specific to the tenant, providing
     effective multi-tenant handling for graph data.
 
+    Rewritten queries are cached, keyed by the original query text, so that each distinct
+    query is only rewritten once. The tenant ID and labels should therefore not be changed
+    once the store has been created.
+
     Attributes:
         inner (GraphStore): The underlying graph store being wrapped to enable multi-tenancy.
         labels (List[str]): A list of graph labels that might be rewritten for the tenant.
@@ -47,6 +59,10 @@ class MultiTenantGraphStore(GraphStore):
     inner:GraphStore
     labels:List[str]=[]
 
+    _label_pattern:Optional[re.Pattern] = PrivateAttr(default=None)
+    _label_replacements:Dict[str, str] = PrivateAttr(default_factory=dict)
+    _rewritten_queries:Dict[str, str] = PrivateAttr(default_factory=dict)
+
     def execute_query_with_retry(self, query:str, parameters:Dict[str, Any], max_attempts=3, max_wait=5, **kwargs):
         """
         Executes a query with retry logic, ensuring the query is attempted multiple
@@ -143,7 +159,9 @@ class MultiTenantGraphStore(GraphStore):
     def _rewrite_query(self, cypher:str):
         """
         Rewrites the given Cypher query to replace instance-specific labels with their tenant-specific
-        versions based on the tenant ID. The method processes all labels and updates the query accordingly.
+        versions based on the tenant ID. All labels are replaced in a single pass of a compiled
+        regular expression, and the rewritten query is cached, so that subsequent rewrites of the
+        same query are a dictionary lookup.
 
         Args:
             cypher (str): The original Cypher query to be rewritten.
@@ -153,11 +171,31 @@ class MultiTenantGraphStore(GraphStore):
         """
         if self.tenant_id.is_default_tenant():
             return cypher
-        for label in self.labels:
-            original_label = f'`{label}`'
-            new_label = self.tenant_id.format_label(label)
-            cypher = cypher.replace(original_label, new_label)
-        return cypher
+        
+        rewritten = self._rewritten_queries.get(cypher)
+        if rewritten is not None:
+            return rewritten
+        
+        if self._label_pattern is None:
+            self._label_replacements = {
+                f'`{label}`': self.tenant_id.format_label(label)
+                for label in self.labels
+            }
+            self._label_pattern = re.compile('|'.join(
+                re.escape(original_label) 
+                for original_label in sorted(self._label_replacements, key=len, reverse=True)
+            ))
+        
+        replacements = self._label_replacements
+        rewritten = self._label_pattern.sub(lambda m: replacements[m.group(0)], cypher) if replacements else cypher
+        
+        with _rewrite_lock:
+            if len(self._rewritten_queries) >= MAX_REWRITTEN_QUERIES:
+                # evict the oldest entry
+                self._rewritten_queries.pop(next(iter(self._rewritten_queries)), None)
+            self._rewritten_queries[cypher] = rewritten
+            
+        return rewritten
     
     def init(self, graph_store=None):
         self.inner.init(graph_store or self)
@@ -15,6 +15,7 @@ from importlib.metadata import version, PackageNotFoundError
 from dateutil.parser import parse
 
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStoreFactoryMethod, GraphStore, NodeId, get_log_formatting
+from graphrag_toolkit.lexical_graph.storage.graph.query_template_registry import default_query_template_registry
 from graphrag_toolkit.lexical_graph.metadata import format_datetime, is_datetime_key
 from graphrag_toolkit.lexical_graph import GraphRAGConfig
 from llama_index.core.bridge.pydantic import PrivateAttr
@@ -363,20 +364,38 @@ class NeptuneAnalyticsClient(GraphStore):
             parameters
         )
 
-        logger.debug(f'[{request_log_entry_parameters.query_ref}] Query: [query: {request_log_entry_parameters.query}, parameters: {request_log_entry_parameters.parameters}]')
+        query_template_registry = default_query_template_registry()
+        query_template = query_template_registry.register(cypher)
+
+        # A cached plan is only reused if the query text is identical, so plan-cacheable
+        # queries carry the stable template id rather than the per-request query ref
+        if GraphRAGConfig.neptune_plan_cache_enabled and query_template_registry.is_plan_cacheable(query_template):
+            plan_cache = 'ENABLED'
+            query_string = f'//template: {query_template.template_id}\n{cypher}'
+        else:
+            plan_cache = 'DISABLED'
+            query_string = request_log_entry_parameters.format_query_with_query_ref(cypher)
+
+        logger.debug(f'[{request_log_entry_parameters.query_ref}] Query: [template_id: {query_template.template_id}, plan_cache: {plan_cache}, query: {request_log_entry_parameters.query}, parameters: {request_log_entry_parameters.parameters}]')
 
         start = time.time()
         
-        response =  self.client.execute_query(
-            graphIdentifier=self.graph_id,
-            queryString=request_log_entry_parameters.format_query_with_query_ref(cypher),
-            parameters=parameters,
-            language='OPEN_CYPHER',
-            planCache='DISABLED'
-        )
+        try:
+            response =  self.client.execute_query(
+                graphIdentifier=self.graph_id,
+                queryString=query_string,
+                parameters=parameters,
+                language='OPEN_CYPHER',
+                planCache=plan_cache
+            )
+        except Exception:
+            query_template_registry.record_execution(query_template, (time.time() - start) * 1000, error=True)
+            raise
 
         end = time.time()
 
+        query_template_registry.record_execution(query_template, (end - start) * 1000)
+
         results = json.loads(response['payload'].read())['results']
 
         if logger.isEnabledFor(logging.DEBUG):
@@ -496,17 +515,26 @@ class NeptuneDatabaseClient(GraphStore):
             parameters
         )
 
-        logger.debug(f'[{request_log_entry_parameters.query_ref}] Query: [query: {request_log_entry_parameters.query}, parameters: {request_log_entry_parameters.parameters}]')
+        query_template_registry = default_query_template_registry()
+        query_template = query_template_registry.register(cypher)
+
+        logger.debug(f'[{request_log_entry_parameters.query_ref}] Query: [template_id: {query_template.template_id}, query: {request_log_entry_parameters.query}, parameters: {request_log_entry_parameters.parameters}]')
 
         start = time.time()
 
-        response =  self.client.execute_open_cypher_query(
-            openCypherQuery=request_log_entry_parameters.format_query_with_query_ref(cypher),
-            parameters=json.dumps(parameters)
-        )
+        try:
+            response =  self.client.execute_open_cypher_query(
+                openCypherQuery=request_log_entry_parameters.format_query_with_query_ref(cypher),
+                parameters=json.dumps(parameters)
+            )
+        except Exception:
+            query_template_registry.record_execution(query_template, (time.time() - start) * 1000, error=True)
+            raise
         
         end = time.time()
 
+        query_template_registry.record_execution(query_template, (end - start) * 1000)
+
         results = response['results']
 
         if logger.isEnabledFor(logging.DEBUG):
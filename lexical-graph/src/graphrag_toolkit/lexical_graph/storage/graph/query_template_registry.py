@@ -0,0 +1,270 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+MAX_TEMPLATES = 1000
+MAX_REGISTERED_QUERIES = 4096
+MAX_TEXT_VARIANTS = 4
+
+LITERAL_PLACEHOLDER = '?'
+
+_CYPHER_TOKENS = re.compile(r"""
+      (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<identifier>`[^`]*`|\$?[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<whitespace>\s+)
+    | (?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+
+_LITERAL_LISTS = re.compile(r'\[\s*\?(?:\s*,\s*\?)*\s*\]')
+
+@dataclass
+class QueryTemplate:
+    """
+    The parameterized template of an openCypher query.
+
+    Attributes:
+        template_id (str): A short, stable identifier derived from the normalized query.
+        normalized_query (str): The query with comments removed, whitespace collapsed,
+            and inlined string and numeric literals replaced with `?` placeholders. Lists
+            of literals, such as inlined embeddings, are collapsed to a single `[?]`.
+        num_literals (int): The number of literal values inlined in the query text. A
+            query with no inlined literals passes all of its values as parameters.
+        parameter_names (List[str]): The names of the parameters referenced by the query.
+    """
+    template_id:str
+    normalized_query:str
+    num_literals:int
+    parameter_names:List[str]
+
+    @property
+    def is_parameterized(self) -> bool:
+        return self.num_literals == 0
+
+
+def normalize_query(cypher:str) -> QueryTemplate:
+    """
+    Returns the parameterized template of the given openCypher query.
+
+    Structurally identical queries that differ only in their inlined literal values, or
+    in their comments and whitespace, share the same template.
+    """
+    parts = []
+    parameter_names = []
+    num_literals = 0
+
+    for match in _CYPHER_TOKENS.finditer(cypher):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == 'comment':
+            continue
+        elif kind == 'whitespace':
+            parts.append(' ')
+        elif kind in ['string', 'number']:
+            if kind == 'number' and token.startswith('-') and parts and parts[-1] not in ['', ' ', '(', '[', ',', ':']:
+                # binary minus (e.g. 'x-1'), not a negative literal
+                parts.append('-')
+                token = token[1:]
+            num_literals += 1
+            parts.append(LITERAL_PLACEHOLDER)
+        elif kind == 'identifier' and token.startswith('$'):
+            if token[1:] not in parameter_names:
+                parameter_names.append(token[1:])
+            parts.append(token)
+        else:
+            parts.append(token)
+
+    normalized_query = ''.join(parts).strip()
+    normalized_query = _LITERAL_LISTS.sub(f'[{LITERAL_PLACEHOLDER}]', normalized_query)
+
+    template_id = hashlib.sha1(normalized_query.encode('utf-8')).hexdigest()[:12]
+
+    return QueryTemplate(
+        template_id=template_id,
+        normalized_query=normalized_query,
+        num_literals=num_literals,
+        parameter_names=parameter_names
+    )
+
+
+class QueryTemplateStats:
+    """
+    Execution statistics for a single query template.
+
+    Attributes:
+        template (QueryTemplate): The template.
+        executions (int): The number of successful executions.
+        errors (int): The number of failed executions.
+        total_ms (float): The total latency of successful executions, in milliseconds.
+        max_ms (float): The maximum latency of a successful execution, in milliseconds.
+        plan_cacheable (bool): Whether queries with this template can use the query plan cache.
+    """
+    def __init__(self, template:QueryTemplate):
+        self.template = template
+        self.executions = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.plan_cacheable = True
+        self._text_variants:Set[int] = set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'template_id': self.template.template_id,
+            'query': self.template.normalized_query,
+            'num_literals': self.template.num_literals,
+            'num_text_variants': len(self._text_variants),
+            'plan_cacheable': self.plan_cacheable,
+            'executions': self.executions,
+            'errors': self.errors,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.executions, 3) if self.executions else 0.0,
+            'max_ms': round(self.max_ms, 3)
+        }
+
+
+class QueryTemplateRegistry:
+    """
+    A thread-safe registry of the query templates executed by graph stores.
+
+    The registry normalizes each query into a parameterized template (see
+    `normalize_query()`), decides whether the query is safe to execute with the server's
+    query plan cache, and tracks per-template execution counts and latency.
+
+    A query whose values are all passed as parameters always has the same text, and can
+    always reuse a cached plan. A query that inlines literals can reuse a cached plan
+    only if those literals do not vary from one execution to the next (for example, a
+    fixed `LIMIT 10`): once more than `max_text_variants` different texts have been seen
+    for the same template, the template is flagged as not plan-cacheable, so that queries
+    with varying inlined values do not fill the server's plan cache with single-use plans.
+
+    Attributes:
+        max_templates (int): Maximum number of templates tracked; the oldest templates are
+            evicted first.
+        max_text_variants (int): Maximum number of different query texts per template
+            before the template is flagged as not plan-cacheable.
+    """
+    def __init__(self, max_templates:int=MAX_TEMPLATES, max_text_variants:int=MAX_TEXT_VARIANTS):
+        self.max_templates = max_templates
+        self.max_text_variants = max_text_variants
+        self._templates:OrderedDict = OrderedDict()
+        self._registered_queries:OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def register(self, cypher:str) -> QueryTemplate:
+        """
+        Returns the template for the given query, registering the query text against it.
+        """
+        template = self._registered_queries.get(cypher)
+        if template is None:
+            template = normalize_query(cypher)
+
+        with self._lock:
+            if cypher not in self._registered_queries:
+                self._registered_queries[cypher] = template
+                while len(self._registered_queries) > MAX_REGISTERED_QUERIES:
+                    self._registered_queries.popitem(last=False)
+            stats = self._get_stats(template)
+            if stats.plan_cacheable and not template.is_parameterized:
+                stats._text_variants.add(hash(cypher))
+                if len(stats._text_variants) > self.max_text_variants:
+                    stats.plan_cacheable = False
+                    logger.debug(f'Query template inlines varying literal values, disabling plan cache [template_id: {template.template_id}, query: {template.normalized_query}]')
+
+        return template
+
+    def _get_stats(self, template:QueryTemplate) -> QueryTemplateStats:
+        stats = self._templates.get(template.template_id)
+        if stats is None:
+            stats = QueryTemplateStats(template)
+            self._templates[template.template_id] = stats
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return stats
+
+    def is_plan_cacheable(self, template:QueryTemplate) -> bool:
+        """
+        Returns True if queries with the given template can use the query plan cache.
+        """
+        with self._lock:
+            stats = self._templates.get(template.template_id)
+            return stats.plan_cacheable if stats is not None else template.is_parameterized
+
+    def record_execution(self, template:QueryTemplate, elapsed_ms:float, error:bool=False):
+        """
+        Records the latency, or failure, of an execution of a query with the given template.
+        """
+        with self._lock:
+            stats = self._get_stats(template)
+            if error:
+                stats.errors += 1
+            else:
+                stats.executions += 1
+                stats.total_ms += elapsed_ms
+                stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    def get_template_stats(self, template_id:str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the statistics for the template with the given id, or None if the template
+        is not registered.
+        """
+        with self._lock:
+            stats = self._templates.get(template_id)
+            return stats.to_dict() if stats is not None else None
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the statistics for all registered templates, ordered by descending total latency.
+        """
+        with self._lock:
+            all_stats = [stats.to_dict() for stats in self._templates.values()]
+        return sorted(all_stats, key=lambda s: s['total_ms'], reverse=True)
+
+    def unparameterized_templates(self) -> List[Dict[str, Any]]:
+        """
+        Returns the statistics for those registered templates whose queries inline
+        literal values rather than passing them as parameters.
+        """
+        return [s for s in self.stats() if s['num_literals'] > 0]
+
+    def clear(self):
+        """
+        Removes all registered templates and statistics.
+        """
+        with self._lock:
+            self._templates.clear()
+            self._registered_queries.clear()
+
+
+_default_registry:Optional[QueryTemplateRegistry] = None
+_default_registry_lock = threading.Lock()
+
+def default_query_template_registry() -> QueryTemplateRegistry:
+    """
+    Returns the process-wide query template registry.
+    """
+    global _default_registry
+
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = QueryTemplateRegistry()
+        return _default_registry
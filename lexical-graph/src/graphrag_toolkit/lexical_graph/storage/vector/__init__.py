@@ -1,7 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from .vector_index import VectorIndex, to_embedded_query
+from .vector_index import VectorIndex, to_embedded_query, to_embedded_query_async
 from .vector_index_factory_method import VectorIndexFactoryMethod
 from .vector_store import VectorStore
 from .multi_tenant_vector_store import MultiTenantVectorStore
@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import string
+import time
 import logging
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Dict, Tuple
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
@@ -15,10 +17,12 @@ from graphrag_toolkit.lexical_graph.storage.vector import VectorIndex, VectorInd
 
 from llama_index.core.indices.utils import embed_nodes
 from llama_index.core.schema import QueryBundle
+from llama_index.core.bridge.pydantic import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
 NEPTUNE_ANALYTICS = 'neptune-graph://'
+MAX_UPSERT_ATTEMPTS = 3
     
 class NeptuneAnalyticsVectorIndexFactory(VectorIndexFactoryMethod):
     def try_create(self, index_names:List[str], vector_index_info:str, **kwargs) -> List[VectorIndex]:
@@ -66,6 +70,8 @@ class NeptuneIndex(VectorIndex):
         path (str): The traversal path defined for the index queries.
         return_fields (str): The fields to return when executing queries related to the
             index.
+        upsert_batch_size (int): The maximum number of embeddings upserted per query.
+        upsert_concurrency (int): The maximum number of upsert queries run concurrently.
     """
     @staticmethod
     def for_index(index_name, graph_id, embed_model=None, dimensions=None, **kwargs):
@@ -134,6 +140,10 @@ class NeptuneIndex(VectorIndex):
     label: str
     path: str
     return_fields: str
+    upsert_batch_size: int = 50
+    upsert_concurrency: int = 4
+
+    _multi_tenant_client: Optional[MultiTenantGraphStore] = PrivateAttr(default=None)
 
     def _neptune_client(self):
         """
@@ -150,8 +160,13 @@ class NeptuneIndex(VectorIndex):
         """
         if self.tenant_id.is_default_tenant():
             return self.neptune_client
-        else:
-            return MultiTenantGraphStore.wrap(self.neptune_client, tenant_id=self.tenant_id)
+        
+        # reuse the wrapper, so that its rewritten queries are cached across calls
+        client = self._multi_tenant_client
+        if client is None or client.tenant_id != self.tenant_id:
+            client = MultiTenantGraphStore.wrap(self.neptune_client, tenant_id=self.tenant_id)
+            self._multi_tenant_client = client
+        return client
 
     
     def add_embeddings(self, nodes):
@@ -160,8 +175,10 @@ class NeptuneIndex(VectorIndex):
         and updates these embeddings in Neptune using the appropriate queries.
 
         This function takes a list of nodes, computes their embeddings using the associated
-        embedding model, and updates these embeddings in the Neptune database. It also ensures
-        that temporary metadata added to the nodes is removed after processing.
+        embedding model, and updates these embeddings in the Neptune database. Embeddings are
+        upserted in batches of up to `upsert_batch_size` nodes per query, with the embeddings
+        passed as query parameters, and up to `upsert_concurrency` batches are sent
+        concurrently. Batches that fail, and nodes whose upsert is unsuccessful, are retried.
 
         Args:
             nodes (list): A list of node objects. Each node should have a `metadata` dictionary
@@ -177,27 +194,87 @@ class NeptuneIndex(VectorIndex):
         id_to_embed_map = embed_nodes(
             nodes, self.embed_model
         )
-        
-        for node in nodes:
-        
-            statement = f"MATCH (n:`{self.label}`) WHERE {self.neptune_client.node_id('n.{self.id_name}')} = $nodeId"
-            
-            embedding = id_to_embed_map[node.node_id]
-            
-            query = '\n'.join([
-                statement,
-                f'WITH n CALL neptune.algo.vectors.upsert(n, {embedding}) YIELD success RETURN success'
-            ])
-            
-            properties = {
-                'nodeId': node.node_id,
-                'embedding': embedding
+
+        pending = {
+            node.node_id: id_to_embed_map[node.node_id]
+            for node in nodes
+        }
+
+        num_attempts = 0
+        last_error = None
+
+        while pending and num_attempts < MAX_UPSERT_ATTEMPTS:
+
+            num_attempts += 1
+
+            items = list(pending.items())
+            batches = [
+                items[x:x+self.upsert_batch_size] 
+                for x in range(0, len(items), self.upsert_batch_size)
+            ]
+
+            with ThreadPoolExecutor(max_workers=max(1, min(self.upsert_concurrency, len(batches)))) as executor:
+                results = list(executor.map(self._upsert_batch, batches))
+
+            retriable_ids = set()
+            for (failed_ids, error) in results:
+                retriable_ids.update(failed_ids)
+                last_error = error or last_error
+
+            pending = {
+                node_id: embedding
+                for node_id, embedding in pending.items()
+                if node_id in retriable_ids
             }
 
-            self._neptune_client().execute_query_with_retry(query, properties)
+            if pending and num_attempts < MAX_UPSERT_ATTEMPTS:
+                logger.warning(f'[{self.label}] Failed to upsert {len(pending)} embeddings, retrying after {num_attempts} seconds')
+                time.sleep(num_attempts)
+
+        if pending:
+            logger.error(f'[{self.label}] Failed to upsert {len(pending)} embeddings after {num_attempts} attempts: {list(pending.keys())}')
+            if last_error:
+                raise last_error
         
         return nodes
     
+    def _upsert_batch(self, batch:List[Tuple[str, List[float]]]) -> Tuple[List[str], Optional[Exception]]:
+        """
+        Upserts a batch of (node ID, embedding) pairs in a single parameterized query.
+
+        Returns:
+            Tuple[List[str], Optional[Exception]]: The IDs of the nodes whose upsert failed
+            and should be retried, and the error raised by the query, if any.
+        """
+        cypher = f"""
+        // upsert embeddings
+        UNWIND $embeddings AS e
+        MATCH (n:`{self.label}`) WHERE {self.neptune_client.node_id(f'n.{self.id_name}')} = e.nodeId
+        CALL neptune.algo.vectors.upsert(n, e.embedding) YIELD success
+        RETURN e.nodeId AS nodeId, success
+        """
+
+        params = {
+            'embeddings': [
+                {'nodeId': node_id, 'embedding': embedding}
+                for node_id, embedding in batch
+            ]
+        }
+
+        try:
+            results = self._neptune_client().execute_query_with_retry(cypher, params)
+        except Exception as e:
+            logger.warning(f'[{self.label}] Error while upserting batch of {len(batch)} embeddings: {e}')
+            return ([node_id for node_id, _ in batch], e)
+
+        upserted = {r['nodeId']: r['success'] for r in results}
+
+        unmatched_ids = [node_id for node_id, _ in batch if node_id not in upserted]
+        if unmatched_ids:
+            logger.warning(f'[{self.label}] No nodes found for {len(unmatched_ids)} embeddings: {unmatched_ids}')
+
+        return ([node_id for node_id, success in upserted.items() if not success], None)
+    
     def top_k(self, query_bundle:QueryBundle, top_k:int=5, filter_config:Optional[FilterConfig]=None):
         """
         Fetches the top-k records ranked by similarity score based on query embeddings
@@ -3,10 +3,11 @@
 
 
 import json
+import asyncio
 import logging
 import time
-import uuid
-from typing import List, Any, Optional, Iterable, Dict
+import threading
+from typing import List, Any, Optional, Dict, Tuple, Callable, Awaitable
 from dataclasses import dataclass
 
 from llama_index.core.bridge.pydantic import PrivateAttr
@@ -14,6 +15,8 @@ from llama_index.core.schema import BaseNode, NodeWithScore, QueryBundle
 from llama_index.core.vector_stores.types import  VectorStoreQueryResult, VectorStoreQueryMode, MetadataFilters, MetadataFilter
 from llama_index.core.indices.utils import embed_nodes
 from llama_index.core.vector_stores.types import MetadataFilters
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
+from llama_index.core.schema import MetadataMode
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig, is_datetime_key, format_datetime
 from graphrag_toolkit.lexical_graph.versioning import  VALID_FROM, VALID_TO, TIMESTAMP_LOWER_BOUND, TIMESTAMP_UPPER_BOUND
@@ -24,10 +27,15 @@ from graphrag_toolkit.lexical_graph.storage.constants import INDEX_KEY
 logger = logging.getLogger(__name__)
 
 MAX_ID_BATCH_SIZE = 50000
+MAX_BULK_REQUEST_BYTES = 5 * 1024 * 1024
+MIN_BULK_REQUEST_BYTES = 64 * 1024
+MAX_BULK_REQUEST_DOCS = 1000
+MAX_CONCURRENT_BULK_REQUESTS = 4
+MAX_BULK_ATTEMPTS = 6
 
 try:
     from llama_index.vector_stores.opensearch import OpensearchVectorClient
-    from opensearchpy.exceptions import NotFoundError, RequestError
+    from opensearchpy.exceptions import NotFoundError, RequestError, TransportError, ConnectionError as OpenSearchConnectionError
     from opensearchpy import AWSV4SignerAsyncAuth, AsyncHttpConnection
     from opensearchpy import Urllib3AWSV4SignerAuth, Urllib3HttpConnection
     from opensearchpy import OpenSearch, AsyncOpenSearch
@@ -41,61 +49,95 @@ def _get_opensearch_version(self) -> str:
     #info = asyncio_run(self._os_async_client.info())
     return '2.0.9'
 
-def _bulk_ingest_embeddings(
-        self,
-        client: Any,
-        index_name: str,
-        embeddings: List[List[float]],
-        texts: Iterable[str],
-        metadatas: Optional[List[dict]] = None,
-        ids: Optional[List[str]] = None,
-        vector_field: str = "embedding",
-        text_field: str = "content",
-        mapping: Optional[Dict] = None,
-        max_chunk_bytes: Optional[int] = 1 * 1024 * 1024,
-        is_aoss: bool = False,
-    ) -> List[str]:
-        """Bulk Ingest Embeddings into given index."""
-        if not mapping:
-            mapping = {}
-
-        bulk = self._import_bulk()
-        not_found_error = self._import_not_found_error()
-        requests = []
-        return_ids = []
+import llama_index.vector_stores.opensearch 
+llama_index.vector_stores.opensearch.OpensearchVectorClient._get_opensearch_version = _get_opensearch_version
 
-        try:
-            client.indices.get(index=index_name)
-        except not_found_error:
-            client.indices.create(index=index_name, body=mapping)
-
-        for i, text in enumerate(texts):
-            metadata = metadatas[i] if metadatas else {}
-            _id = ids[i] if ids else str(uuid.uuid4())
-            request = {
-                "_op_type": "index",
-                "_index": index_name,
-                vector_field: embeddings[i],
-                text_field: text,
-                "metadata": metadata,
-            }
-            if is_aoss:
-                request["id"] = _id
-            else:
-                request["_id"] = _id
-            requests.append(request)
-            return_ids.append(_id)
+class AsyncBulkClient():
+    """
+    An asynchronous OpenSearch client for bulk requests, together with the event loop
+    that it is bound to.
 
-        (_, errors) = bulk(client, requests, max_chunk_bytes=max_chunk_bytes, max_retries=3, initial_backoff=5)
-        
-        if not is_aoss:
-            client.indices.refresh(index=index_name)
+    AsyncOpenSearch binds its HTTP session to the event loop on which it is first used,
+    so the client is created on, and only ever used from, a dedicated event loop running
+    on a background thread. Bulk updates submitted from any thread – including threads
+    that are themselves running an event loop, e.g. in a notebook – are run on this loop,
+    so that a single client and its connection pool are reused across bulk updates.
 
-        return errors
+    Attributes:
+        endpoint (str): The endpoint URL of the OpenSearch cluster.
+    """
+    def __init__(self, endpoint:str):
+        self.endpoint = endpoint
+        self.client = None
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='opensearch-bulk', daemon=True)
+        self.thread.start()
+
+    def run(self, fn:Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Runs `fn(client)` on the client's event loop, and waits for the result.
+        """
+        async def call():
+            if self.client is None:
+                self.client = create_os_async_client(self.endpoint)
+            return await fn(self.client)
+        return asyncio.run_coroutine_threadsafe(call(), self.loop).result()
+
+    def close(self):
+        """
+        Closes the client, and stops its event loop.
+        """
+        if self.client is not None:
+            asyncio.run_coroutine_threadsafe(self.client.close(), self.loop).result()
+            self.client = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+_ASYNC_BULK_CLIENT_LOCK = threading.Lock()
+
+class BulkRequestSizer:
+    """
+    Adapts the size of bulk requests to the throughput the cluster can sustain.
+
+    Requests start at the maximum size. Each time a request is rejected as too large
+    or throttled, the size is halved (down to a minimum); each successful request
+    grows the size again by a quarter (up to the maximum).
+
+    Attributes:
+        max_bytes (int): The current maximum size, in bytes, of a bulk request body.
+    """
+    def __init__(self, max_bytes:int=MAX_BULK_REQUEST_BYTES, min_bytes:int=MIN_BULK_REQUEST_BYTES):
+        self.max_bytes = max_bytes
+        self._upper_bound = max_bytes
+        self._lower_bound = min_bytes
+
+    def shrink(self):
+        self.max_bytes = max(self._lower_bound, self.max_bytes // 2)
+
+    def grow(self):
+        self.max_bytes = min(self._upper_bound, self.max_bytes + self.max_bytes // 4)
+
+    def chunk(self, requests:Dict[str, List[str]]) -> List[List[Tuple[str, List[str]]]]:
+        """
+        Divides the given bulk requests (action and optional source lines, keyed by
+        document) into chunks no larger than the current maximum size.
+        """
+        chunks = []
+        chunk = []
+        chunk_bytes = 0
+        for key, lines in requests.items():
+            request_bytes = sum(len(line) + 1 for line in lines)
+            if chunk and (chunk_bytes + request_bytes > self.max_bytes or len(chunk) >= MAX_BULK_REQUEST_DOCS):
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append((key, lines))
+            chunk_bytes += request_bytes
+        if chunk:
+            chunks.append(chunk)
+        return chunks
 
-import llama_index.vector_stores.opensearch 
-llama_index.vector_stores.opensearch.OpensearchVectorClient._get_opensearch_version = _get_opensearch_version
-llama_index.vector_stores.opensearch.OpensearchVectorClient._bulk_ingest_embeddings = _bulk_ingest_embeddings
 
 @dataclass
 class DummyAuth:
@@ -503,6 +545,7 @@ class OpenSearchIndex(VectorIndex):
     embed_model:EmbeddingType
 
     _client: OpensearchVectorClient = PrivateAttr(default=None)
+    _async_bulk_client: Optional[AsyncBulkClient] = PrivateAttr(default=None)
 
     def __getstate__(self):
         """
@@ -518,6 +561,7 @@ class OpenSearchIndex(VectorIndex):
         if self._client and self._client._os_client:
             self._client._os_client.close()
         self._client = None
+        self._close_async_bulk_client()
         return super().__getstate__()
         
     @property
@@ -541,6 +585,7 @@ class OpenSearchIndex(VectorIndex):
                 if self._client._os_client:
                     self._client._os_client.close()
                 self._client = None
+                self._close_async_bulk_client()
 
         if not self._client:
             if index_exists(self.endpoint, self.underlying_index_name(), self.dimensions, self.writeable):
@@ -662,7 +707,7 @@ class OpenSearchIndex(VectorIndex):
         if not self.writeable:
             raise IndexError(f'Index {self.index_name} is read-only')
             
-        nodes_to_embed_map = self._remove_existing_nodes([node.node_id for node in nodes])
+        (nodes_to_embed_map, requests) = self._get_nodes_to_embed([node.node_id for node in nodes])
         
         nodes_to_embed = [
             node
@@ -677,13 +722,40 @@ class OpenSearchIndex(VectorIndex):
         for node in nodes_to_embed:
             node.embedding = id_to_embed_map[node.node_id]
 
-        if nodes_to_embed:
-            errors = self.client.index_results(nodes_to_embed)
-            if errors:
-                logger.error(f'Errors while adding embeddings: {errors}')
+        if isinstance(self.client, DummyOpensearchVectorClient):
+            return nodes_to_embed
+
+        is_aoss = getattr(self.client, 'is_aoss', True)
+        
+        for node in nodes_to_embed:
+            requests[node.node_id] = self._to_index_request(node, is_aoss)
+
+        if requests:
+            failed_ids = self._try_bulk_update(requests, 'index')
+            if failed_ids:
+                logger.error(f'Errors while adding embeddings: [failed_ids: {failed_ids}]')
         
         return nodes_to_embed 
     
+    def _to_index_request(self, node:BaseNode, is_aoss:bool) -> List[str]:
+        """
+        Returns the bulk action and source lines that index the given (embedded) node.
+
+        The document is given the node ID as its `id` field. Where the collection supports
+        custom document IDs (i.e. not Amazon OpenSearch Serverless), the node ID is also
+        used as the document `_id`, which makes the request an idempotent upsert.
+        """
+        action = {'_index': self.underlying_index_name()}
+        if not is_aoss:
+            action['_id'] = node.node_id
+        source = {
+            'id': node.node_id,
+            'embedding': node.get_embedding(),
+            'value': node.get_content(metadata_mode=MetadataMode.NONE),
+            'metadata': node_to_metadata_dict(node, remove_text=True)
+        }
+        return [json.dumps({'index': action}), json.dumps(source)]
+    
     def _update_filters_recursive(self, filters:MetadataFilters):
         """
         Recursively updates metadata filters to convert keys to a consistent format and updates
@@ -929,8 +1001,13 @@ class OpenSearchIndex(VectorIndex):
         
         return results
     
-    def _remove_existing_nodes(self, node_ids) -> Dict[str, Any]:
-        
+    def _get_nodes_to_embed(self, node_ids) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """
+        Returns the IDs of the given nodes that are not yet in the index, together with
+        bulk delete requests for any duplicate documents of the nodes that are already
+        indexed. The delete requests are sent in the same bulk request stream as the
+        new documents.
+        """
         existing_doc_ids_map = self._get_existing_doc_ids_for_ids(node_ids)
         
         node_ids_to_embed_map = {
@@ -950,12 +1027,7 @@ class OpenSearchIndex(VectorIndex):
         for doc_id_to_delete in doc_ids_to_delete:  
             requests[doc_id_to_delete] = [f'{{ "delete" : {{"_id" : "{doc_id_to_delete}", "_index" : "{self.underlying_index_name()}" }} }}']     
 
-        if requests:
-            self._try_bulk_update(requests, 'delete')
-        else:
-            logger.debug(f'[{self.underlying_index_name()}] Delete bulk update request is empty')
-
-        return node_ids_to_embed_map
+        return (node_ids_to_embed_map, requests)
     
     def update_versioning(self, versioning_timestamp:int, ids:List[str]=[]) -> List[str]:
 
@@ -1084,56 +1156,128 @@ class OpenSearchIndex(VectorIndex):
         return [reverse_doc_id_map[doc_id] for doc_id in doc_ids]
 
     def _try_bulk_update(self, requests:Dict[str, List[str]], operation:Optional[str]='update'):
+        """
+        Sends the given bulk requests (keyed by document or node ID) to the index, and
+        returns the keys of the requests that failed.
+
+        Requests are divided into chunks sized by a `BulkRequestSizer`, and the chunks are
+        sent concurrently (up to `MAX_CONCURRENT_BULK_REQUESTS` at a time) using the
+        index's `AsyncBulkClient`, which is created on first use and reused by subsequent
+        bulk updates. Requests that are throttled, or whose chunk is rejected as
+        too large, are retried in smaller chunks. Not-found errors for deletes are ignored.
+        The index is not explicitly refreshed.
+        """
+        with _ASYNC_BULK_CLIENT_LOCK:
+            if self._async_bulk_client is None:
+                self._async_bulk_client = AsyncBulkClient(self.endpoint)
+            async_bulk_client = self._async_bulk_client
 
-        def is_transient(item:Dict):
-            return item.get(operation, {}).get('status', 0) in [429, 503]
-        
-        def is_non_ignoreable_error(item:Dict):
-            if operation == 'delete' and item.get(operation, {}).get('status', 0) in [404]:
-                logger.warning(f"[{self.underlying_index_name()}] Ignoring delete for doc {item[operation]['_id']} because doc not found")
-                return False
-            else:
-                return item.get('error', None) is not None
+        return async_bulk_client.run(lambda client: self._atry_bulk_update(client, requests, operation))
+
+    def _close_async_bulk_client(self):
+        with _ASYNC_BULK_CLIENT_LOCK:
+            async_bulk_client = self._async_bulk_client
+            self._async_bulk_client = None
+        if async_bulk_client is not None:
+            async_bulk_client.close()
+
+    async def _atry_bulk_update(self, client, requests:Dict[str, List[str]], operation:str) -> List[str]:
 
+        sizer = BulkRequestSizer()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BULK_REQUESTS)
         retriable_requests = requests.copy()
         num_attempts = 0
         failed_docs = {}
 
-        while retriable_requests and num_attempts < 6:
-            
+        while retriable_requests and num_attempts < MAX_BULK_ATTEMPTS:
+
             num_attempts += 1
-            
-            body = '\n'.join([
-                doc_request
-                for doc_requests in retriable_requests.values()
-                for doc_request in doc_requests
-            ])
 
-            response = self.client._os_client.bulk(body=body)
+            chunks = sizer.chunk(retriable_requests)
+
+            tasks = [
+                asyncio.ensure_future(self._asend_bulk_chunk(client, chunk, sizer, semaphore))
+                for chunk in chunks
+            ]
+
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # Don't leave sibling chunks writing to the index after the update has failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
             retriable_requests = {}
 
-            if response['errors']:
-                for item in response.get('items', []):
-                    doc_id = item[operation]['_id']
-                    if is_transient(item):
-                        retriable_requests[doc_id] = requests[doc_id]
-                    elif is_non_ignoreable_error(item):
-                        if doc_id not in failed_docs:
-                            failed_docs[doc_id] = []
-                        failed_docs[doc_id].append(item.get('error', None))
+            for (retriable_keys, chunk_failed_docs) in results:
+                retriable_requests.update({key: requests[key] for key in retriable_keys})
+                for key, errors in chunk_failed_docs.items():
+                    failed_docs.setdefault(key, []).extend(errors)
 
             if retriable_requests:
-                logger.warning(f'[{self.underlying_index_name()}] Transient error during bulk {operation}, retrying {len(retriable_requests.keys())} docs after {6 - num_attempts} seconds')
-                time.sleep(6 - num_attempts)
+                logger.warning(f'[{self.underlying_index_name()}] Transient error during bulk {operation}, retrying {len(retriable_requests.keys())} docs after {MAX_BULK_ATTEMPTS - num_attempts} seconds [max_request_bytes: {sizer.max_bytes}]')
+                await asyncio.sleep(MAX_BULK_ATTEMPTS - num_attempts)
+
+        for key in retriable_requests:
+            failed_docs.setdefault(key, []).append('Exceeded maximum number of attempts')
 
         if failed_docs:
             logger.error(f'[{self.underlying_index_name()}] {len(failed_docs.keys())} docs failed during bulk {operation}: {failed_docs}')
         
-        logger.debug(f'[{self.underlying_index_name()}] Bulk {operation} completed [succeeded: {len(requests.keys()) - len(failed_docs.keys())}, failed: {len(failed_docs.keys())}, attempts: {num_attempts}] {len(failed_docs.keys())}')
+        logger.debug(f'[{self.underlying_index_name()}] Bulk {operation} completed [succeeded: {len(requests.keys()) - len(failed_docs.keys())}, failed: {len(failed_docs.keys())}, attempts: {num_attempts}]')
         
         return list(failed_docs.keys())
     
+    async def _asend_bulk_chunk(self, client, chunk:List[Tuple[str, List[str]]], sizer:BulkRequestSizer, semaphore:asyncio.Semaphore) -> Tuple[List[str], Dict[str, List[Any]]]:
+
+        def is_transient(status:int):
+            return status in [429, 503]
+
+        def is_ignoreable_error(op:str, status:int, item:Dict):
+            if op == 'delete' and status == 404:
+                logger.warning(f"[{self.underlying_index_name()}] Ignoring delete for doc {item.get('_id')} because doc not found")
+                return True
+            return False
+
+        body = '\n'.join(line for (_, lines) in chunk for line in lines) + '\n'
+
+        async with semaphore:
+            try:
+                response = await client.bulk(body=body)
+            except OpenSearchConnectionError as e:
+                logger.warning(f'[{self.underlying_index_name()}] Connection error during bulk request: {e}')
+                return ([key for (key, _) in chunk], {})
+            except TransportError as e:
+                if e.status_code == 413 or is_transient(e.status_code):
+                    sizer.shrink()
+                    return ([key for (key, _) in chunk], {})
+                raise
+
+        retriable_keys = []
+        failed_docs = {}
+
+        if response.get('errors'):
+            throttled = False
+            # items are returned in request order
+            for (key, _), item in zip(chunk, response.get('items', [])):
+                (op, result) = next(iter(item.items()))
+                status = result.get('status', 0)
+                if is_transient(status):
+                    throttled = True
+                    retriable_keys.append(key)
+                elif result.get('error', None) is not None and not is_ignoreable_error(op, status, result):
+                    failed_docs.setdefault(key, []).append(result.get('error'))
+            if throttled:
+                sizer.shrink()
+            else:
+                sizer.grow()
+        else:
+            sizer.grow()
+
+        return (retriable_keys, failed_docs)
+    
     def delete_embeddings(self, ids:List[str]=[]):
 
         allow_refresh = True
@@ -1,13 +1,18 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import csv
+import io
 import json
 import logging
+import os
+import threading
+import time
 import numpy as np
 
 from pgvector.psycopg2 import register_vector
-from typing import List, Sequence, Dict, Any, Optional, Callable
-from urllib.parse import urlparse
+from typing import List, Sequence, Dict, Any, Optional, Callable, Tuple
+from urllib.parse import urlparse, parse_qs
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig, type_name_for_key_value, format_datetime
 from graphrag_toolkit.lexical_graph.versioning import VALID_FROM, VALID_TO, TIMESTAMP_LOWER_BOUND, TIMESTAMP_UPPER_BOUND
@@ -25,10 +30,63 @@ try:
     import psycopg2
     from pgvector.psycopg2 import register_vector
     from psycopg2.errors import UniqueViolation, UndefinedTable
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE
 except ImportError as e:
     raise ImportError(
         "psycopg2 and/or pgvector packages not found, install with 'pip install psycopg2-binary pgvector'"
     ) from e
+
+DEFAULT_MAX_CONNECTIONS = 10
+MAX_IDLE_SECONDS = 300
+
+class PGConnectionPool():
+    """
+    A thread-safe pool of psycopg2 connections.
+
+    Connections are created on demand using `connect_fn` (so that IAM auth tokens are
+    generated afresh for each new connection), up to `max_connections` connections in use
+    at once; callers block until a connection becomes available. Connections that have
+    been closed, that are left in a transaction, or that have been idle for longer than
+    `MAX_IDLE_SECONDS` are discarded rather than reused.
+    """
+    def __init__(self, connect_fn:Callable[[], Any], max_connections:int=DEFAULT_MAX_CONNECTIONS):
+        self.connect_fn = connect_fn
+        self.idle_connections:List[Tuple[Any, float]] = []
+        self.semaphore = threading.BoundedSemaphore(max(1, max_connections))
+        self.lock = threading.Lock()
+
+    def get_connection(self):
+        self.semaphore.acquire()
+        try:
+            while True:
+                with self.lock:
+                    (dbconn, released_at) = self.idle_connections.pop() if self.idle_connections else (None, None)
+                if dbconn is None:
+                    return self.connect_fn()
+                if dbconn.closed:
+                    continue
+                if time.time() - released_at > MAX_IDLE_SECONDS:
+                    dbconn.close()
+                    continue
+                return dbconn
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    def release_connection(self, dbconn):
+        try:
+            if dbconn.closed:
+                return
+            if dbconn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                dbconn.close()
+                return
+            with self.lock:
+                self.idle_connections.append((dbconn, time.time()))
+        finally:
+            self.semaphore.release()
+
+_connection_pools:Dict[tuple, PGConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
     
 def _type_name_for_key_value(key: str, value: Any) -> str:
     type_name = type_name_for_key_value(key, value)
@@ -236,7 +294,8 @@ class PGIndex(VectorIndex):
                   password:str=None,
                   embed_model:EmbeddingType=None,
                   dimensions:int=None,
-                  enable_iam_db_auth=False):
+                  enable_iam_db_auth=False,
+                  max_connections:int=DEFAULT_MAX_CONNECTIONS):
         """
         Creates an instance of the `PGIndex` class based on the provided database connection
         information, index name, and embedding configuration. It parses the `connection_string`
@@ -257,6 +316,9 @@ class PGIndex(VectorIndex):
             dimensions (int, optional): The dimensionality of the embeddings. Defaults to None.
             enable_iam_db_auth (bool, optional): A flag indicating whether to enable IAM
             database authentication. Defaults to False.
+            max_connections (int, optional): The maximum number of pooled connections each
+            process opens to the database. Can be overridden with a `max_connections`
+            connection string query parameter. Defaults to 10.
 
         Returns:
             PGIndex: An instance of the `PGIndex` class properly configured with the provided
@@ -282,6 +344,7 @@ class PGIndex(VectorIndex):
         username = parsed.username or username
         password = parsed.password or password
         enable_iam_db_auth = compute_enable_iam_db_auth(parsed.query, enable_iam_db_auth)
+        max_connections = int(parse_qs(parsed.query).get('max_connections', [max_connections])[0])
         
         embed_model = embed_model or GraphRAGConfig.embed_model
         dimensions = dimensions or GraphRAGConfig.embed_dimensions
@@ -295,7 +358,8 @@ class PGIndex(VectorIndex):
                        password=password, 
                        dimensions=dimensions, 
                        embed_model=embed_model, 
-                       enable_iam_db_auth=enable_iam_db_auth)
+                       enable_iam_db_auth=enable_iam_db_auth,
+                       max_connections=max_connections)
 
     index_name:str
     database:str
@@ -307,35 +371,10 @@ class PGIndex(VectorIndex):
     dimensions:int
     embed_model:EmbeddingType
     enable_iam_db_auth:bool=False
+    max_connections:int=DEFAULT_MAX_CONNECTIONS
     initialized:bool=False
 
-    def _get_connection(self):
-        """
-        Establishes a connection to the database, configures it, and optionally initializes the schema and
-        indexes required for the application. The method supports IAM-based authentication for Amazon RDS if
-        enabled. It also ensures that the schema is initialized exactly once during the lifecycle of the object,
-        creating necessary tables and indexes if they do not exist. Logs warnings for existing database objects.
-
-        Raises:
-            psycopg2.Error: Raised if there is an issue with establishing the database connection or executing
-            queries to initialize the schema and indexes.
-            Exception: Raised if there are other unforeseen errors during the schema initialization or database
-            interactions.
-
-        Attributes:
-            enable_iam_db_auth (bool): Indicates whether IAM-based authentication for AWS RDS is enabled.
-            host (str): The hostname of the database server.
-            username (str): The username for the database connection.
-            password (Optional[str]): The static password for connecting to the database if IAM is disabled.
-            port (int): The port number on which the database listens for connections.
-            database (str): The name of the database to connect to.
-            initialized (bool): Tracks whether the schema and indexes have already been initialized.
-            writeable (bool): Specifies whether the database connection should handle schema initialization and
-            updates.
-            schema_name (str): The schema name where the table resides.
-            index_name (str): Identifier used for managing and initializing the table and its related indexes.
-            dimensions (int): Dimensionality of the vector column used in the table for embeddings.
-        """
+    def _connect(self):
         token = None
 
         if self.enable_iam_db_auth:
@@ -363,6 +402,51 @@ class PGIndex(VectorIndex):
 
         register_vector(dbconn)
 
+        return dbconn
+    
+    def _connection_pool(self) -> PGConnectionPool:
+        # Pools are per-process: connections must not be shared with forked worker processes
+        pool_key = (os.getpid(), self.host, self.port, self.database, self.username, self.enable_iam_db_auth)
+        with _connection_pools_lock:
+            if pool_key not in _connection_pools:
+                _connection_pools[pool_key] = PGConnectionPool(self._connect, self.max_connections)
+            return _connection_pools[pool_key]
+        
+    def _release_connection(self, dbconn):
+        """
+        Returns a connection obtained from `_get_connection()` to the connection pool.
+        """
+        self._connection_pool().release_connection(dbconn)
+
+    def _get_connection(self):
+        """
+        Gets a connection from the per-process connection pool, and optionally initializes the schema and
+        indexes required for the application. New connections support IAM-based authentication for Amazon RDS
+        if enabled. Callers must return the connection using `_release_connection()`. It also ensures that the schema is initialized exactly once during the lifecycle of the object,
+        creating necessary tables and indexes if they do not exist. Logs warnings for existing database objects.
+
+        Raises:
+            psycopg2.Error: Raised if there is an issue with establishing the database connection or executing
+            queries to initialize the schema and indexes.
+            Exception: Raised if there are other unforeseen errors during the schema initialization or database
+            interactions.
+
+        Attributes:
+            enable_iam_db_auth (bool): Indicates whether IAM-based authentication for AWS RDS is enabled.
+            host (str): The hostname of the database server.
+            username (str): The username for the database connection.
+            password (Optional[str]): The static password for connecting to the database if IAM is disabled.
+            port (int): The port number on which the database listens for connections.
+            database (str): The name of the database to connect to.
+            initialized (bool): Tracks whether the schema and indexes have already been initialized.
+            writeable (bool): Specifies whether the database connection should handle schema initialization and
+            updates.
+            schema_name (str): The schema name where the table resides.
+            index_name (str): Identifier used for managing and initializing the table and its related indexes.
+            dimensions (int): Dimensionality of the vector column used in the table for embeddings.
+        """
+        dbconn = self._connection_pool().get_connection()
+
         if not self.initialized:
 
             cur = dbconn.cursor()
@@ -404,8 +488,12 @@ class PGIndex(VectorIndex):
                     except UniqueViolation:
                         logger.warning(f"Index already exists, so ignoring CREATE: {index_name}")
 
-            finally:
+            except BaseException:
                 cur.close()
+                self._release_connection(dbconn)
+                raise
+
+            cur.close()
 
             self.initialized = True
 
@@ -414,9 +502,10 @@ class PGIndex(VectorIndex):
 
     def add_embeddings(self, nodes:Sequence[BaseNode]) -> Sequence[BaseNode]:
         """
-        Adds embeddings for a sequence of nodes into the database. This method processes
-        each node by generating embeddings using the specified embedding model and
-        inserts or updates these nodes in the underlying indexed database table. The method
+        Adds embeddings for a sequence of nodes into the database. This method generates
+        embeddings for the nodes using the specified embedding model, bulk loads them into a
+        temporary staging table using `COPY`, and then inserts them into the underlying indexed
+        database table in a single statement, ignoring nodes that already exist. The method
         ensures write authorization before proceeding and handles exceptions related to
         undefined tables. Nodes for a specific tenant that references non-existent tables
         are logged as warnings without causing the entire operation to fail.
@@ -433,33 +522,78 @@ class PGIndex(VectorIndex):
         if not self.writeable:
             raise IndexError(f'Index {self.index_name} is read-only')
 
+        if not nodes:
+            return nodes
+
+        id_to_embed_map = embed_nodes(
+            nodes, self.embed_model
+        )
+
+        rows = io.StringIO()
+        writer = csv.writer(rows, quoting=csv.QUOTE_ALL)
+
+        for node in nodes:
+            valid_from = node.metadata.get('source', {}).get('versioning', {}).get('valid_from', TIMESTAMP_LOWER_BOUND) 
+            embedding = id_to_embed_map[node.id_]
+            writer.writerow([
+                node.id_, 
+                node.text, 
+                json.dumps(node.metadata), 
+                f"[{','.join(str(float(v)) for v in embedding)}]", 
+                valid_from
+            ])
+
+        rows.seek(0)
+
+        staging_table = f'{self.index_name}_staging'
+
         dbconn = self._get_connection()
         cur = dbconn.cursor()
 
         try:
 
-            id_to_embed_map = embed_nodes(
-                nodes, self.embed_model
+            # COPY rows into a transaction-scoped staging table, then merge into the index
+            # table in a single statement
+            dbconn.autocommit = False
+
+            cur.execute(f'''CREATE TEMP TABLE {staging_table}(
+                {self.index_name}Id VARCHAR(255),
+                value text,
+                metadata jsonb,
+                embedding vector({self.dimensions}),
+                valid_from BIGINT
+                ) ON COMMIT DROP;'''
             )
-            for node in nodes:
 
-                valid_from = node.metadata.get('source', {}).get('versioning', {}).get('valid_from', TIMESTAMP_LOWER_BOUND) 
+            cur.copy_expert(f'COPY {staging_table} FROM STDIN WITH (FORMAT csv)', rows)
 
-                cur.execute(
-                    f'INSERT INTO {self.schema_name}.{self.underlying_index_name()} ({self.index_name}Id, value, metadata, embedding, valid_from) SELECT %s, %s, %s, %s, %s WHERE NOT EXISTS (SELECT * FROM {self.schema_name}.{self.underlying_index_name()} c WHERE c.{self.index_name}Id = %s);',
-                    (node.id_, node.text,  json.dumps(node.metadata), id_to_embed_map[node.id_], valid_from, node.id_)
-                )
+            cur.execute(f'''INSERT INTO {self.schema_name}.{self.underlying_index_name()} ({self.index_name}Id, value, metadata, embedding, valid_from)
+                SELECT {self.index_name}Id, value, metadata, embedding, valid_from FROM {staging_table}
+                ON CONFLICT ({self.index_name}Id) DO NOTHING;'''
+            )
+
+            dbconn.commit()
+
+            logger.debug(f'Added embeddings [index: {self.underlying_index_name()}, num_nodes: {len(nodes)}, num_inserted: {cur.rowcount}]')
 
         except UndefinedTable as e:
+            dbconn.rollback()
             if self.tenant_id.is_default_tenant():
                 raise e
             else:
                 logger.warning(f'Multi-tenant index {self.underlying_index_name()} does not exist')
 
+        except BaseException:
+            if not dbconn.closed:
+                dbconn.rollback()
+            raise
+
         finally:
 
             cur.close()
-            dbconn.close()
+            if not dbconn.closed:
+                dbconn.autocommit = True
+            self._release_connection(dbconn)
 
         return nodes
     
@@ -617,7 +751,7 @@ class PGIndex(VectorIndex):
 
         finally:
             cur.close()
-            dbconn.close()
+            self._release_connection(dbconn)
 
         return top_k_results
 
@@ -668,7 +802,7 @@ class PGIndex(VectorIndex):
 
         finally:
             cur.close()
-            dbconn.close()
+            self._release_connection(dbconn)
 
         return get_embeddings_results
     
@@ -692,7 +826,7 @@ class PGIndex(VectorIndex):
 
         finally:
             cur.close()
-            dbconn.close()
+            self._release_connection(dbconn)
 
         return []
 
@@ -711,7 +845,7 @@ class PGIndex(VectorIndex):
 
         finally:
             cur.close()
-            dbconn.close()
+            self._release_connection(dbconn)
 
         return []
     
@@ -734,6 +868,6 @@ class PGIndex(VectorIndex):
 
         finally:
             cur.close()
-            dbconn.close()
+            self._release_connection(dbconn)
 
         return ids
@@ -0,0 +1,119 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+QueryEmbeddingKey = Tuple[str, Tuple[str, ...]]
+
+def _embed_model_key(embed_model:Any) -> str:
+    try:
+        settings = embed_model.to_json()
+    except Exception:
+        settings = json.dumps({
+            'model_name': getattr(embed_model, 'model_name', None),
+            'dimensions': getattr(embed_model, 'dimensions', None),
+            'additional_kwargs': getattr(embed_model, 'additional_kwargs', None),
+            'query_instruction': getattr(embed_model, 'query_instruction', None)
+        }, sort_keys=True, default=str)
+    return f'{type(embed_model).__name__}:{hashlib.sha1(settings.encode("utf-8")).hexdigest()}'
+
+def query_embedding_key(embed_model:Any, embedding_strs:Sequence[str]) -> QueryEmbeddingKey:
+    """
+    Returns the cache key for the embedding of the given query strings by the given model.
+
+    The model is identified by a digest of all of its settings (not just its name), so
+    that models of the same type and name configured differently – for example, with
+    different output dimensions, request arguments or query instructions – do not share
+    cached embeddings.
+    """
+    return (_embed_model_key(embed_model), tuple(embedding_strs))
+
+
+class QueryEmbeddingCache:
+    """
+    A bounded, thread-safe, in-memory LRU cache of query embeddings.
+
+    Entries are keyed by embedding model settings and query text (see
+    `query_embedding_key()`). When the cache is full, the least-recently-used embedding
+    is evicted.
+
+    Attributes:
+        max_entries (int): Maximum number of embeddings retained.
+    """
+    def __init__(self, max_entries:int):
+        self.max_entries = max_entries
+        self._embeddings:OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key:QueryEmbeddingKey) -> Optional[List[float]]:
+        """
+        Returns a copy of the cached embedding for the given key, or None if the key is not cached.
+        """
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is None:
+                self._stats['misses'] += 1
+                return None
+            self._embeddings.move_to_end(key)
+            self._stats['hits'] += 1
+        return list(embedding)
+
+    def put(self, key:QueryEmbeddingKey, embedding:List[float]):
+        """
+        Caches an embedding under the given key, evicting the least-recently-used entry if necessary.
+        """
+        with self._lock:
+            self._embeddings[key] = tuple(embedding)
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit, miss and eviction counts for this cache, together with its current size.
+        """
+        with self._lock:
+            return {**self._stats, 'size': len(self._embeddings)}
+
+
+_default_cache:Optional[QueryEmbeddingCache] = None
+_default_cache_lock = threading.Lock()
+
+def default_query_embedding_cache() -> Optional[QueryEmbeddingCache]:
+    """
+    Returns the process-wide query embedding cache, sized according to
+    `GraphRAGConfig.query_embedding_cache_size`, or None if query embedding caching is
+    disabled (size 0).
+    """
+    global _default_cache
+
+    from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+
+    max_entries = GraphRAGConfig.query_embedding_cache_size
+
+    if not max_entries or max_entries < 1:
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.max_entries != max_entries:
+            logger.debug(f'Creating query embedding cache [max_entries: {max_entries}]')
+            _default_cache = QueryEmbeddingCache(max_entries)
+        return _default_cache
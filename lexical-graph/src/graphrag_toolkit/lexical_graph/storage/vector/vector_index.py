@@ -13,6 +13,8 @@ from llama_index.core.vector_stores.types import MetadataFilters
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph import EmbeddingType, TenantId
 from graphrag_toolkit.lexical_graph.storage.constants import ALL_EMBEDDING_INDEXES
+from graphrag_toolkit.lexical_graph.storage.vector.query_embedding_cache import default_query_embedding_cache, query_embedding_key
+from graphrag_toolkit.lexical_graph.utils.fm_observability import traced
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,10 @@ def to_embedded_query(query_bundle:QueryBundle, embed_model:EmbeddingType) -> Qu
     it computes the embedding using the provided embedding model and updates the
     query bundle accordingly. Finally, it returns the embedded query bundle.
 
+    Computed embeddings are held in the process-wide query embedding cache (see
+    `GraphRAGConfig.query_embedding_cache_size`), so repeated queries against the same
+    model are embedded only once.
+
     Args:
         query_bundle (QueryBundle): The query bundle to be converted into an
             embedded query. It may or may not already contain an embedding.
@@ -39,13 +45,53 @@ def to_embedded_query(query_bundle:QueryBundle, embed_model:EmbeddingType) -> Qu
     if query_bundle.embedding:
         return query_bundle
     
-    query_bundle.embedding = (
-        embed_model.get_agg_embedding_from_queries(
+    cache = default_query_embedding_cache()
+    key = query_embedding_key(embed_model, query_bundle.embedding_strs)
+
+    embedding = cache.get(key) if cache else None
+
+    if embedding is None:
+        embedding = embed_model.get_agg_embedding_from_queries(
             query_bundle.embedding_strs
         )
-    ) 
+        if cache:
+            cache.put(key, embedding)
+
+    query_bundle.embedding = embedding
     return query_bundle   
 
+async def to_embedded_query_async(query_bundle:QueryBundle, embed_model:EmbeddingType) -> QueryBundle:
+    """
+    Asynchronous version of `to_embedded_query()`, which computes the query embedding
+    (if not already present) using the embedding model's async API.
+
+    Args:
+        query_bundle (QueryBundle): The query bundle to be converted into an
+            embedded query. It may or may not already contain an embedding.
+        embed_model (EmbeddingType): The embedding model used to compute the
+            embeddings for the given query bundle.
+
+    Returns:
+        QueryBundle: The input query bundle with the embedding attached.
+    """
+    if query_bundle.embedding:
+        return query_bundle
+    
+    cache = default_query_embedding_cache()
+    key = query_embedding_key(embed_model, query_bundle.embedding_strs)
+
+    embedding = cache.get(key) if cache else None
+
+    if embedding is None:
+        embedding = await embed_model.aget_agg_embedding_from_queries(
+            query_bundle.embedding_strs
+        )
+        if cache:
+            cache.put(key, embedding)
+
+    query_bundle.embedding = embedding
+    return query_bundle
+
 class VectorIndex(BaseModel):
     """Represents a vector-based index for storing and retrieving embeddings.
 
@@ -66,6 +112,18 @@ class VectorIndex(BaseModel):
     tenant_id:TenantId = Field(default_factory=lambda: TenantId())
     writeable:bool = True
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """
+        Wraps each implementation's query methods so that their latencies are recorded
+        as 'vector.query' and 'vector.get_embeddings' spans.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        for method_name, span_name in [('top_k', 'vector.query'), ('get_embeddings', 'vector.get_embeddings')]:
+            method = cls.__dict__.get(method_name)
+            if method is not None and not getattr(method, '__traced__', False) and not getattr(method, '__isabstractmethod__', False):
+                setattr(cls, method_name, traced(span_name, lambda self, *args, **kwargs: {'index': self.index_name})(method))
+
     @field_validator('index_name')
     def validate_option(cls, v):
         """
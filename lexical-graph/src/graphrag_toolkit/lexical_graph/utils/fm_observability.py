@@ -2,13 +2,19 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
+import os
+import math
 import time
+import uuid
 import logging
+import functools
 import threading
 import queue
+from contextlib import contextmanager
+from contextvars import ContextVar
 from multiprocessing import Queue
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, List, Callable, cast
+from typing import Dict, Optional, Any, List, Callable, Generator, cast
 
 from llama_index.core import Settings
 from llama_index.core.callbacks.base_handler import BaseCallbackHandler
@@ -22,6 +28,328 @@ logger = logging.getLogger(__name__)
 
 _fm_observability_queue = None
 
+MIN_HISTOGRAM_MILLIS = 0.1
+HISTOGRAM_BUCKETS_PER_DOUBLING = 4
+MAX_HISTOGRAM_BUCKETS = 100
+MAX_SPANS_PER_INTERVAL = 10000
+
+def get_fm_observability_queue() -> Optional[Queue]:
+    """
+    Returns the queue to which observability events are published, or None if no
+    `FMObservabilityPublisher` has been created in (or passed to) this process.
+    """
+    return _fm_observability_queue
+
+def set_fm_observability_queue(observability_queue:Optional[Queue]):
+    """
+    Sets the queue to which observability events are published. Worker processes use
+    this to publish events to the queue polled by the parent process.
+    """
+    global _fm_observability_queue
+    _fm_observability_queue = observability_queue
+
+
+class LatencyHistogram:
+    """
+    A mergeable latency histogram with logarithmically sized buckets.
+
+    Bucket upper bounds start at `MIN_HISTOGRAM_MILLIS` and grow by a factor of
+    2^(1/`HISTOGRAM_BUCKETS_PER_DOUBLING`), so percentiles are accurate to within
+    roughly 10%, however long the operation. Only non-empty buckets are stored.
+    Histograms recorded in different processes or intervals can be combined with
+    `merge()`.
+
+    Attributes:
+        count (int): The number of successful operations recorded.
+        errors (int): The number of failed operations recorded.
+        total_millis (float): The total duration of successful operations.
+        min_millis (float): The shortest successful operation.
+        max_millis (float): The longest successful operation.
+    """
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_millis = 0.0
+        self.min_millis = math.inf
+        self.max_millis = 0.0
+        self._buckets:Dict[int, int] = {}
+
+    @staticmethod
+    def _bucket_index(millis:float) -> int:
+        if millis <= MIN_HISTOGRAM_MILLIS:
+            return 0
+        index = math.ceil(math.log2(millis / MIN_HISTOGRAM_MILLIS) * HISTOGRAM_BUCKETS_PER_DOUBLING)
+        return min(index, MAX_HISTOGRAM_BUCKETS - 1)
+
+    @staticmethod
+    def _bucket_upper_bound(index:int) -> float:
+        return MIN_HISTOGRAM_MILLIS * 2 ** (index / HISTOGRAM_BUCKETS_PER_DOUBLING)
+
+    def record(self, millis:float, error:bool=False):
+        """
+        Records the duration of an operation, or its failure.
+        """
+        if error:
+            self.errors += 1
+            return
+        self.count += 1
+        self.total_millis += millis
+        self.min_millis = min(self.min_millis, millis)
+        self.max_millis = max(self.max_millis, millis)
+        index = self._bucket_index(millis)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def merge(self, other:'LatencyHistogram'):
+        """
+        Adds the recorded durations of another histogram to this histogram.
+        """
+        self.count += other.count
+        self.errors += other.errors
+        self.total_millis += other.total_millis
+        self.min_millis = min(self.min_millis, other.min_millis)
+        self.max_millis = max(self.max_millis, other.max_millis)
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+
+    @property
+    def average_millis(self) -> float:
+        return self.total_millis / self.count if self.count else 0.0
+
+    def percentile(self, p:float) -> float:
+        """
+        Returns the estimated duration below which p percent (0-100) of operations completed.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index in sorted(self._buckets):
+            bucket_count = self._buckets[index]
+            if seen + bucket_count >= rank:
+                lower = self._bucket_upper_bound(index - 1) if index > 0 else 0.0
+                upper = self._bucket_upper_bound(index)
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min_millis), self.max_millis)
+            seen += bucket_count
+        return self.max_millis
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'average_millis': self.average_millis,
+            'p50_millis': self.percentile(50),
+            'p90_millis': self.percentile(90),
+            'p99_millis': self.percentile(99),
+            'max_millis': self.max_millis
+        }
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """
+    Identifies a span. A span context can be passed to another thread or process, and
+    used as the parent of spans created there, so that those spans belong to the same trace.
+
+    Attributes:
+        trace_id (str): The id of the trace to which the span belongs.
+        span_id (str): The id of the span.
+        name (str): The name of the operation the span measures.
+    """
+    trace_id:str
+    span_id:str
+    name:str
+
+
+@dataclass
+class SpanEvent:
+    """
+    A completed span, published to the observability queue.
+
+    Attributes:
+        name (str): The name of the operation (e.g. 'graph.query', 'vector.query').
+        trace_id (str): The id of the trace to which the span belongs.
+        span_id (str): The id of the span.
+        parent_span_id (Optional[str]): The id of the parent span, if any.
+        start_millis (float): The start time of the span, in milliseconds since the epoch.
+        duration_millis (float): The duration of the span, in milliseconds.
+        error (Optional[str]): The type of the exception raised by the operation, if any.
+        attributes (Dict[str, Any]): Additional attributes of the operation.
+        pid (int): The id of the process in which the span was recorded.
+    """
+    name:str
+    trace_id:str
+    span_id:str
+    parent_span_id:Optional[str]
+    start_millis:float
+    duration_millis:float
+    error:Optional[str] = None
+    attributes:Dict[str, Any] = field(default_factory=dict)
+    pid:int = 0
+
+
+_current_span:ContextVar[Optional[SpanContext]] = ContextVar('fm_observability_current_span', default=None)
+_current_span_attributes:ContextVar[Optional[Dict[str, Any]]] = ContextVar('fm_observability_current_span_attributes', default=None)
+
+def current_span_context() -> Optional[SpanContext]:
+    """
+    Returns the context of the span currently active in this thread or task, or None.
+    """
+    return _current_span.get()
+
+def add_span_attributes(**attributes:Any):
+    """
+    Adds attributes, e.g. measurements that are only known once the work is done, to the
+    span currently active in this thread or task (see `trace_span()`). Has no effect if
+    no span is active.
+    """
+    span_attributes = _current_span_attributes.get()
+    if span_attributes is not None:
+        span_attributes.update(attributes)
+
+class Span:
+    """
+    A span that has been started but not yet ended. Unlike `trace_span()`, a span
+    started with `start_span()` is not made the current span, and so can be held open
+    across a `yield` in a generator without leaking into the caller's context. Pass its
+    `context` explicitly as the parent of any child spans.
+
+    Attributes:
+        name (str): The name of the operation.
+        context (Optional[SpanContext]): The context of the span, or None if no span is
+            recorded.
+        parent (Optional[SpanContext]): The context of the parent span, if any.
+        attributes (Dict[str, Any]): Additional attributes recorded with the span.
+    """
+    def __init__(self, name:str, context:Optional[SpanContext], parent:Optional[SpanContext], attributes:Dict[str, Any], observability_queue:Any):
+        self.name = name
+        self.context = context
+        self.parent = parent
+        self.attributes = attributes
+        self._observability_queue = observability_queue
+        self._start_ns = time.time_ns()
+        self._ended = False
+
+    def end(self, error:Optional[str]=None):
+        """
+        Ends the span, and publishes it to the observability queue. Subsequent calls
+        have no effect.
+        """
+        if self._ended or self.context is None:
+            self._ended = True
+            return
+        self._ended = True
+        end_ns = time.time_ns()
+        try:
+            self._observability_queue.put(SpanEvent(
+                name=self.name,
+                trace_id=self.context.trace_id,
+                span_id=self.context.span_id,
+                parent_span_id=self.parent.span_id if self.parent else None,
+                start_millis=self._start_ns / 1_000_000,
+                duration_millis=(end_ns - self._start_ns) / 1_000_000,
+                error=error,
+                attributes=self.attributes,
+                pid=os.getpid()
+            ))
+        except Exception as e:
+            logger.debug(f'Unable to publish span [name: {self.name}, error: {e}]')
+
+
+def start_span(name:str, parent:Optional[SpanContext]=None, **attributes:Any) -> Span:
+    """
+    Starts a span with the given name, which is published to the observability queue
+    when `Span.end()` is called.
+
+    The span is a child of the given parent span context or, if no parent is given, of
+    the span currently active in this thread or task. A span started directly inside a
+    span of the same name is merged into the enclosing span. If no
+    `FMObservabilityPublisher` is active, no span is recorded.
+    """
+    observability_queue = _fm_observability_queue
+    parent = parent or _current_span.get()
+
+    context = None
+    if observability_queue is not None and not (parent is not None and parent.name == name):
+        context = SpanContext(
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex[:16],
+            span_id=uuid.uuid4().hex[:8],
+            name=name
+        )
+
+    return Span(name, context, parent, attributes, observability_queue)
+
+@contextmanager
+def trace_span(name:str, parent:Optional[SpanContext]=None, **attributes:Any) -> Generator[Optional[SpanContext], None, None]:
+    """
+    Measures the enclosed block as a span with the given name, and publishes it to the
+    observability queue, where its duration is added to the latency histogram for the
+    operation.
+
+    The span is a child of the given parent span context or, if no parent is given, of
+    the span currently active in this thread or task. A span nested directly inside a
+    span of the same name (for example, a wrapper delegating to the store it wraps) is
+    merged into the enclosing span. If no `FMObservabilityPublisher` is active, no span
+    is recorded.
+
+    The span is made the current span for the duration of the block, so it must not be
+    held open across a `yield` in a generator; use `start_span()` instead.
+
+    Args:
+        name (str): The name of the operation.
+        parent (Optional[SpanContext]): The parent span context, typically passed from
+            another process.
+        **attributes (Any): Additional attributes recorded with the span.
+
+    Yields:
+        Optional[SpanContext]: The context of the new span, or None if no span is recorded.
+    """
+    span = start_span(name, parent, **attributes)
+
+    if span.context is None:
+        yield None
+        return
+
+    token = _current_span.set(span.context)
+    attributes_token = _current_span_attributes.set(span.attributes)
+    error = None
+
+    try:
+        yield span.context
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        try:
+            _current_span.reset(token)
+            _current_span_attributes.reset(attributes_token)
+        except ValueError:
+            # exited in a different context (e.g. from another task)
+            pass
+        span.end(error=error)
+
+def traced(name:str, attributes_fn:Optional[Callable[..., Dict[str, Any]]]=None):
+    """
+    Returns a decorator that measures each call of the decorated function as a span
+    with the given name (see `trace_span()`).
+
+    Args:
+        name (str): The name of the operation.
+        attributes_fn (Optional[Callable[..., Dict[str, Any]]]): Optional function, called
+            with the decorated function's arguments, that returns the span attributes.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _fm_observability_queue is None:
+                return fn(*args, **kwargs)
+            attributes = attributes_fn(*args, **kwargs) if attributes_fn else {}
+            with trace_span(name, **attributes):
+                return fn(*args, **kwargs)
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
 class FMObservabilityQueuePoller(threading.Thread):
     """
     FMObservabilityQueuePoller is a thread-based queue polling class.
@@ -113,6 +441,12 @@ class FMObservabilityStats:
         total_embedding_count (int): Total count of embedding calls.
         total_embedding_tokens (float): Total number of embedding tokens across all embedding
             calls.
+        latencies (Dict[str, LatencyHistogram]): Latency histograms, keyed by operation name
+            (e.g. 'llm', 'embedding', 'graph.query', 'vector.query', 'reranker').
+        spans (List[SpanEvent]): The spans received in the current interval, up to
+            `MAX_SPANS_PER_INTERVAL`. Spans are not carried over by `update()`.
+        dropped_spans (int): The number of spans received in the current interval beyond
+            `MAX_SPANS_PER_INTERVAL`.
     """
     total_llm_duration_millis: float = 0
     total_llm_count: int = 0
@@ -121,6 +455,9 @@ class FMObservabilityStats:
     total_embedding_duration_millis: float = 0
     total_embedding_count: int = 0
     total_embedding_tokens: float = 0
+    latencies: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    spans: List[SpanEvent] = field(default_factory=list)
+    dropped_spans: int = 0
 
     def update(self, stats: Any):
         """
@@ -142,9 +479,11 @@ class FMObservabilityStats:
                          - total_embedding_count (int)
                          - total_embedding_tokens (int)
 
+        Latency histograms are merged into this object's histograms; spans are not copied.
+
         Returns:
             bool: True if the combined total_llm_count and total_embedding_count from the stats object is
-                  greater than zero; otherwise, False.
+                  greater than zero, or if the stats object recorded any operation latencies; otherwise, False.
         """
         self.total_llm_duration_millis += stats.total_llm_duration_millis
         self.total_llm_count += stats.total_llm_count
@@ -153,21 +492,49 @@ class FMObservabilityStats:
         self.total_embedding_duration_millis += stats.total_embedding_duration_millis
         self.total_embedding_count += stats.total_embedding_count
         self.total_embedding_tokens += stats.total_embedding_tokens
-        return (stats.total_llm_count + stats.total_embedding_count) > 0
+        latencies = getattr(stats, 'latencies', {})
+        for name, histogram in latencies.items():
+            self._histogram(name).merge(histogram)
+        return (stats.total_llm_count + stats.total_embedding_count) > 0 or any(h.count or h.errors for h in latencies.values())
+
+    def _histogram(self, name:str) -> LatencyHistogram:
+        histogram = self.latencies.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.latencies[name] = histogram
+        return histogram
+
+    def latency_percentiles(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the count, error count, average, p50, p90, p99 and maximum latency of each
+        operation, keyed by operation name.
+        """
+        return {
+            name: histogram.to_dict()
+            for name, histogram in sorted(self.latencies.items())
+        }
 
     def on_event(self, event: CBEvent):
         """
         Handles the processing of different types of events and updates related statistics
-        based on the event type and payload data. Supports events of type LLM and EMBEDDING.
+        based on the event type and payload data. Supports events of type LLM and EMBEDDING,
+        and span events.
 
         Args:
             event (CBEvent): The event object containing the event type and associated
                 payload data used to update relevant statistics.
         """
-        if event.event_type == CBEventType.LLM:
+        if isinstance(event, SpanEvent):
+            self._histogram(event.name).record(event.duration_millis, error=event.error is not None)
+            if len(self.spans) < MAX_SPANS_PER_INTERVAL:
+                self.spans.append(event)
+            else:
+                self.dropped_spans += 1
+        elif event.event_type == CBEventType.LLM:
             if 'model' in event.payload:
                 self.total_llm_duration_millis += event.payload['duration_millis']
                 self.total_llm_count += 1
+                self._histogram('llm').record(event.payload['duration_millis'])
             elif 'llm_prompt_token_count' in event.payload:
                 self.total_llm_prompt_tokens += event.payload['llm_prompt_token_count']
                 self.total_llm_completion_tokens += event.payload['llm_completion_token_count']
@@ -175,6 +542,7 @@ class FMObservabilityStats:
             if 'model' in event.payload:
                 self.total_embedding_duration_millis += event.payload['duration_millis']
                 self.total_embedding_count += 1
+                self._histogram('embedding').record(event.payload['duration_millis'])
             elif 'embedding_token_count' in event.payload:
                 self.total_embedding_tokens += event.payload['embedding_token_count']
     
@@ -325,6 +693,13 @@ class FMObservabilitySubscriber(ABC):
         """
         pass
 
+    def on_new_spans(self, spans: List[SpanEvent]):
+        """
+        Called with the spans recorded in each publishing interval. Subscribers that export
+        traces override this method; by default, spans are ignored.
+        """
+        pass
+
 class ConsoleFMObservabilitySubscriber(FMObservabilitySubscriber):
     """
     A subscriber class for observing FM (Foundation Model) observability statistics.
@@ -359,6 +734,32 @@ class ConsoleFMObservabilitySubscriber(FMObservabilitySubscriber):
         if updated:
             print(f'LLM: count: {self.all_stats.total_llm_count}, total_prompt_tokens: {self.all_stats.total_llm_prompt_tokens}, total_completion_tokens: {self.all_stats.total_llm_completion_tokens}')
             print(f'Embeddings: count: {self.all_stats.total_embedding_count}, total_tokens: {self.all_stats.total_embedding_tokens}')
+            for name, latency in self.all_stats.latency_percentiles().items():
+                print(f'{name}: count: {latency["count"]}, errors: {latency["errors"]}, p50: {latency["p50_millis"]:.1f}ms, p90: {latency["p90_millis"]:.1f}ms, p99: {latency["p99_millis"]:.1f}ms, max: {latency["max_millis"]:.1f}ms')
+
+class LoggingSpanSubscriber(FMObservabilitySubscriber):
+    """
+    A subscriber that writes every span to a logger, one line per span, so that traces
+    can be exported by any log shipping pipeline.
+
+    Attributes:
+        span_logger (logging.Logger): The logger to which spans are written.
+        level (int): The level at which spans are logged.
+    """
+    def __init__(self, span_logger:Optional[logging.Logger]=None, level:int=logging.INFO):
+        self.span_logger = span_logger or logger
+        self.level = level
+
+    def on_new_stats(self, stats: FMObservabilityStats):
+        if stats.dropped_spans:
+            self.span_logger.warning(f'Dropped spans [count: {stats.dropped_spans}]')
+
+    def on_new_spans(self, spans: List[SpanEvent]):
+        for span in spans:
+            self.span_logger.log(
+                self.level,
+                f'[trace: {span.trace_id}, span: {span.span_id}, parent: {span.parent_span_id}] {span.name} {span.duration_millis:.1f}ms [pid: {span.pid}, error: {span.error}, attributes: {span.attributes}]'
+            )
 
 class StatPrintingSubscriber(FMObservabilitySubscriber):
     """Represents a subscriber that collects and processes observability statistics
@@ -462,6 +863,8 @@ class StatPrintingSubscriber(FMObservabilitySubscriber):
                 - 'average_embedding_duration_millis': Average duration of embedding operations in
                   milliseconds.
                 - 'total_llm_cost': Estimated total monetary cost associated with LLM usage.
+                - 'latencies': Count, errors, average, p50, p90, p99 and maximum latency in
+                  milliseconds of each operation, keyed by operation name.
         """
         stats_dict = {}
         stats_dict['total_llm_count'] = self.all_stats.total_llm_count
@@ -477,6 +880,8 @@ class StatPrintingSubscriber(FMObservabilitySubscriber):
         stats_dict["average_embedding_duration_millis"] = self.all_stats.average_embedding_duration_millis
         # Now  costs
         stats_dict['total_llm_cost'] = self.estimate_costs()
+        # Now latencies
+        stats_dict['latencies'] = self.all_stats.latency_percentiles()
         return stats_dict
         
 
@@ -515,8 +920,7 @@ class FMObservabilityPublisher():
             interval_seconds (float, optional): The interval in seconds for publishing
                 statistics to the subscribers. Defaults to 15.0.
         """
-        global _fm_observability_queue
-        _fm_observability_queue = Queue()
+        set_fm_observability_queue(Queue())
 
         Settings.callback_manager.add_handler(BedrockEnabledTokenCountingHandler())
         Settings.callback_manager.add_handler(FMObservabilityHandler())
@@ -585,6 +989,8 @@ class FMObservabilityPublisher():
             logging.debug('Shutting down publisher')
         for subscriber in self.subscribers:
             subscriber.on_new_stats(stats)
+            if stats.spans:
+                subscriber.on_new_spans(stats.spans)
 
 
 def get_patched_llm_token_counts(
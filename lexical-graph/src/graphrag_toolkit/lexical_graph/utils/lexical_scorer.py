@@ -0,0 +1,195 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import logging
+import numpy as np
+import scipy.sparse as sp
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+TFIDF_WEIGHTING = 'tfidf'
+BM25_WEIGHTING = 'bm25'
+
+_REMOVE_CHARS = re.compile(r'[)(.|\[\]{}\']')
+_SEPARATOR_CHARS = re.compile(r'[,\-/]')
+_MULTIPLE_SPACES = re.compile(r' +')
+
+def char_ngrams(text:str, ngram_length:int=3) -> List[str]:
+    """
+    Returns the character n-grams of the given text.
+
+    The text is lower-cased, stripped of brackets, quotes and full stops, and has commas,
+    hyphens and slashes replaced with spaces, before being padded with a single space at
+    either end, so that n-grams at word boundaries carry more weight.
+    """
+    text = str(text).lower()
+    text = _REMOVE_CHARS.sub('', text)
+    text = text.replace('&', 'and')
+    text = _SEPARATOR_CHARS.sub(' ', text)
+    text = _MULTIPLE_SPACES.sub(' ', text).strip()
+    text = f' {text} '
+    return [text[i:i+ngram_length] for i in range(0, len(text) - ngram_length + 1)]
+
+
+class LexicalScorer:
+    """
+    Scores query strings against a fixed corpus of documents using character n-gram
+    TF-IDF or BM25 weighting.
+
+    The vocabulary, document frequencies and weighted document-term matrix are built once,
+    when the scorer is created, and are then reused for every subsequent `score()` or
+    `top_k()` call. Documents and queries are held as scipy sparse (CSR) matrices, and
+    scores for all queries are computed with a single sparse matrix multiplication.
+    Query n-grams that do not appear in the corpus are ignored. A scorer is not modified
+    after it has been created, and can be shared between threads.
+
+    With TF-IDF weighting, scores are the cosine similarities (0.0 to 1.0) between the
+    L2-normalized TF-IDF vectors of the queries and documents. With BM25 weighting, scores
+    are unbounded BM25 relevance scores.
+
+    Attributes:
+        ngram_length (int): Length of the character n-grams used as terms.
+        weighting (str): Term weighting scheme, either 'tfidf' or 'bm25'.
+        k1 (float): BM25 term frequency saturation parameter.
+        b (float): BM25 document length normalization parameter.
+        vocabulary (Dict[str, int]): Mapping of n-grams to term (column) indexes.
+        idf (np.ndarray): Inverse document frequency of each term.
+        num_documents (int): Number of documents in the corpus.
+    """
+    def __init__(self,
+                 documents:Sequence[str],
+                 ngram_length:int=3,
+                 weighting:str=TFIDF_WEIGHTING,
+                 k1:float=1.2,
+                 b:float=0.75):
+
+        if weighting not in [TFIDF_WEIGHTING, BM25_WEIGHTING]:
+            raise ValueError(f'Invalid weighting: {weighting} (expected one of {[TFIDF_WEIGHTING, BM25_WEIGHTING]})')
+
+        self.ngram_length = ngram_length
+        self.weighting = weighting
+        self.k1 = k1
+        self.b = b
+        self.vocabulary:Dict[str, int] = {}
+        self.num_documents = len(documents)
+
+        counts = self._to_count_matrix(documents, add_terms=True)
+
+        num_terms = len(self.vocabulary)
+        document_frequencies = np.bincount(counts.indices, minlength=num_terms)
+
+        if weighting == BM25_WEIGHTING:
+            self.idf = np.log1p((self.num_documents - document_frequencies + 0.5) / (document_frequencies + 0.5))
+            self._document_matrix = self._to_bm25_matrix(counts)
+        else:
+            self.idf = np.log((1 + self.num_documents) / (1 + document_frequencies)) + 1.0
+            self._document_matrix = self._to_tfidf_matrix(counts)
+
+        self._document_matrix_t = self._document_matrix.T.tocsr()
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self.vocabulary)
+
+    def _to_count_matrix(self, texts:Sequence[str], add_terms:bool=False) -> sp.csr_matrix:
+
+        vocabulary = self.vocabulary
+        rows = []
+        cols = []
+
+        for row, text in enumerate(texts):
+            for ngram in char_ngrams(text, self.ngram_length):
+                col = vocabulary.get(ngram)
+                if col is None:
+                    if not add_terms:
+                        continue
+                    col = len(vocabulary)
+                    vocabulary[ngram] = col
+                rows.append(row)
+                cols.append(col)
+
+        counts = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (np.array(rows, dtype=np.int32), np.array(cols, dtype=np.int32))),
+            shape=(len(texts), len(vocabulary)),
+            dtype=np.float32
+        )
+        counts.sum_duplicates()
+
+        return counts
+
+    def _to_tfidf_matrix(self, counts:sp.csr_matrix) -> sp.csr_matrix:
+
+        matrix = counts.copy()
+        matrix.data *= self.idf[matrix.indices].astype(np.float32)
+
+        row_norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        row_norms[row_norms == 0.0] = 1.0
+        matrix.data /= np.repeat(row_norms, np.diff(matrix.indptr)).astype(np.float32)
+
+        return matrix
+
+    def _to_bm25_matrix(self, counts:sp.csr_matrix) -> sp.csr_matrix:
+
+        matrix = counts.copy()
+
+        document_lengths = np.asarray(counts.sum(axis=1)).ravel()
+        average_document_length = document_lengths.mean() if self.num_documents else 0.0
+        if average_document_length == 0.0:
+            average_document_length = 1.0
+
+        length_norms = self.k1 * (1.0 - self.b + self.b * document_lengths / average_document_length)
+        tf = matrix.data
+        matrix.data = (
+            self.idf[matrix.indices] * tf * (self.k1 + 1.0) / (tf + np.repeat(length_norms, np.diff(matrix.indptr)))
+        ).astype(np.float32)
+
+        return matrix
+
+    def transform(self, queries:Sequence[str]) -> sp.csr_matrix:
+        """
+        Returns the sparse query-term matrix for the given queries, weighted for this scorer.
+        """
+        counts = self._to_count_matrix(queries)
+        if self.weighting == BM25_WEIGHTING:
+            return counts
+        return self._to_tfidf_matrix(counts)
+
+    def score(self, queries:Sequence[str]) -> np.ndarray:
+        """
+        Returns a dense (number of queries x number of documents) array of scores.
+        """
+        if not queries or not self.num_documents:
+            return np.zeros((len(queries), self.num_documents), dtype=np.float32)
+        return (self.transform(queries) @ self._document_matrix_t).toarray()
+
+    def top_k(self, queries:Sequence[str], k:Optional[int]=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the indexes and scores of the top k documents for each query.
+
+        Both of the returned arrays have shape (number of queries, k), with each row
+        ordered by descending score. If k is None, or is greater than the number of
+        documents, all documents are returned for each query.
+        """
+        scores = self.score(queries)
+        return top_k_indexes(scores, k)
+
+
+def top_k_indexes(scores:np.ndarray, k:Optional[int]=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the column indexes and values of the k highest values in each row of a 2D
+    array of scores, ordered by descending score.
+    """
+    num_rows, num_cols = scores.shape
+    k = num_cols if k is None else max(0, min(k, num_cols))
+
+    if k < num_cols:
+        indexes = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k else np.zeros((num_rows, 0), dtype=np.intp)
+    else:
+        indexes = np.tile(np.arange(num_cols), (num_rows, 1))
+
+    top_scores = np.take_along_axis(scores, indexes, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+
+    return (np.take_along_axis(indexes, order, axis=1), np.take_along_axis(top_scores, order, axis=1))
@@ -1,16 +1,20 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import contextlib
 import logging
-import os
+import threading
+from concurrent.futures import Future
 
 from botocore.config import Config
 from hashlib import sha256
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, Dict, Tuple, Callable
 
 from graphrag_toolkit.lexical_graph import ModelError
 from graphrag_toolkit.lexical_graph.utils.bedrock_utils import *
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+from graphrag_toolkit.lexical_graph.utils.llm_cache_backends import LLMCacheBackend, default_llm_cache_backend
 
 from llama_index.core.llms.llm import LLM
 from llama_index.llms.bedrock_converse import BedrockConverse
@@ -26,12 +30,84 @@ c_red, c_blue, c_green, c_cyan, c_norm = "\x1b[31m",'\033[94m','\033[92m', '\033
 MAX_ATTEMPTS = 2
 TIMEOUT = 60.0
 
+_in_flight_requests:Dict[str, Future] = {}
+_in_flight_requests_lock = threading.Lock()
+
+_model_limiters:Dict[str, threading.BoundedSemaphore] = {}
+_model_limiters_lock = threading.Lock()
+
+def _join_in_flight_request(request_key:str) -> Tuple[Future, bool]:
+    """
+    Returns the future for the in-flight request with the given key, and a flag
+    indicating whether the caller owns the request (and must therefore complete the
+    future) or is joining a request already issued by another caller.
+    """
+    with _in_flight_requests_lock:
+        future = _in_flight_requests.get(request_key)
+        if future is not None:
+            return (future, False)
+        future = Future()
+        _in_flight_requests[request_key] = future
+        return (future, True)
+
+def _complete_in_flight_request(request_key:str, future:Future, fn:Callable[[], str]) -> str:
+    try:
+        response = fn()
+        future.set_result(response)
+        return response
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_requests_lock:
+            _in_flight_requests.pop(request_key, None)
+
+def _model_limiter(llm:LLM):
+    """
+    Returns a semaphore bounding the number of concurrent requests this process issues
+    to the given model, or a null context if `GraphRAGConfig.llm_max_concurrent_requests`
+    is 0 (unbounded).
+    """
+    max_concurrent_requests = GraphRAGConfig.llm_max_concurrent_requests
+    if not max_concurrent_requests:
+        return contextlib.nullcontext()
+    model = getattr(llm, 'model', None) or type(llm).__name__
+    with _model_limiters_lock:
+        if model not in _model_limiters:
+            _model_limiters[model] = threading.BoundedSemaphore(max_concurrent_requests)
+        return _model_limiters[model]
+
 class LLMCache(BaseModel):
 
     llm:LLM = Field(desc='LLM whose responses may be cached')
     enable_cache:Optional[bool] = Field(desc='Whether the cache is enabled or disabled', default=False)
     verbose_prompt:Optional[bool] = Field(default=False)
     verbose_response:Optional[bool] = Field(default=False)
+    cache_backend:Optional[Any] = Field(desc='LLMCacheBackend used to store responses (defaults to the backend configured in GraphRAGConfig)', default=None)
+
+    def _init_client(self):
+        if isinstance(self.llm, BedrockConverse):
+            if not hasattr(self.llm, '_client'):
+                config = Config(
+                    retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
+                    connect_timeout=TIMEOUT,
+                    read_timeout=TIMEOUT,
+                )
+                
+                session = GraphRAGConfig.session
+                self.llm._client = session.client('bedrock-runtime', config=config)
+
+    def _get_cache_backend(self) -> LLMCacheBackend:
+        if self.cache_backend is None:
+            self.cache_backend = default_llm_cache_backend()
+        return self.cache_backend
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Returns the hit, miss, put and eviction counts recorded in this process by the
+        cache backend used by this LLMCache.
+        """
+        return self._get_cache_backend().stats()
 
     def stream(
          self,
@@ -44,16 +120,7 @@ class LLMCache(BaseModel):
             logger.info('%s%s%s', c_blue, prompt.format(**prompt_args), c_norm)
 
         try:
-            if isinstance(self.llm, BedrockConverse):
-                if not hasattr(self.llm, '_client'):
-                    config = Config(
-                        retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
-                        connect_timeout=TIMEOUT,
-                        read_timeout=TIMEOUT,
-                    )
-                    
-                    session = GraphRAGConfig.session
-                    self.llm._client = session.client('bedrock-runtime', config=config)
+            self._init_client()
             response = self.llm.stream(prompt, **prompt_args)
         except Exception as e:
             raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
@@ -73,7 +140,8 @@ class LLMCache(BaseModel):
         The function dynamically adapts caching behavior depending on the configuration. If caching
         is disabled, responses are generated directly using the LLM. If caching is enabled, it calculates
         a unique cache key based on the prompt and LLM configuration, then fetches responses from the
-        cache, if available, or generates and stores them for future use.
+        cache, if available, or generates and stores them for future use. Concurrent identical
+        requests within the process share a single model invocation (see `apredict()`).
 
         The function ensures proper handling of potential errors during model execution and writes
         extensive logs when verbosity options are enabled, aiding in thorough tracking during execution.
@@ -91,62 +159,108 @@ class LLMCache(BaseModel):
             ModelError: If there is any exception while interacting with the LLM, detailed
                 configuration information is included to aid debugging.
         """
-        response = None
+        if self.verbose_prompt:
+            logger.info('%s%s%s', c_blue, prompt.format(**prompt_args), c_norm)
+
+        request_key = self._request_key(prompt, prompt_args)
+        (future, is_owner) = _join_in_flight_request(request_key)
+
+        if is_owner:
+            response = _complete_in_flight_request(
+                request_key,
+                future,
+                lambda: self._predict(request_key, prompt, prompt_args)
+            )
+        else:
+            logger.debug('%sJoining in-flight request %s%s', c_blue, request_key, c_norm)
+            response = future.result()
+
+        if self.verbose_response:
+            logger.info('%s%s%s', c_green, response, c_norm)
+            
+        return response
+
+    async def apredict(
+        self,
+        prompt: BasePromptTemplate,
+        **prompt_args: Any
+    ) -> str:
+        """
+        Asynchronous version of `predict()`.
+
+        Concurrent requests with the same prompt and model configuration – whether issued by
+        `predict()` or `apredict()`, from any thread or event loop in this process – are
+        coalesced, so that only one of them invokes the model (or reads the cache); the
+        others await its response. The model invocation itself runs on a worker thread so
+        as not to block the event loop, and is subject to the per-model concurrency limit
+        set by `GraphRAGConfig.llm_max_concurrent_requests`.
+
+        Args:
+            prompt: A BasePromptTemplate instance containing the template definition
+                to generate the LLM response.
+            **prompt_args: Arbitrary keyword arguments that provide dynamic content to fill
+                in the placeholders of the given prompt template.
+
+        Returns:
+            str: The generated or cached response from the LLM.
 
+        Raises:
+            ModelError: If there is any exception while interacting with the LLM.
+        """
         if self.verbose_prompt:
             logger.info('%s%s%s', c_blue, prompt.format(**prompt_args), c_norm)
 
-        if not self.enable_cache:
-            try:
-                if isinstance(self.llm, BedrockConverse):
-                    if not hasattr(self.llm, '_client'):
-                        config = Config(
-                            retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
-                            connect_timeout=TIMEOUT,
-                            read_timeout=TIMEOUT,
-                        )
-                        
-                        session = GraphRAGConfig.session
-                        self.llm._client = session.client('bedrock-runtime', config=config)
-                response = self.llm.predict(prompt, **prompt_args)
-            except Exception as e:
-                raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
+        request_key = self._request_key(prompt, prompt_args)
+        (future, is_owner) = _join_in_flight_request(request_key)
+
+        if is_owner:
+            response = await asyncio.to_thread(
+                _complete_in_flight_request,
+                request_key,
+                future,
+                lambda: self._predict(request_key, prompt, prompt_args)
+            )
         else:
+            logger.debug('%sJoining in-flight request %s%s', c_blue, request_key, c_norm)
+            response = await asyncio.wrap_future(future)
+
+        if self.verbose_response:
+            logger.info('%s%s%s', c_green, response, c_norm)
 
-            prompt_args_copy = prompt_args.copy()
+        return response
+
+    def _request_key(self, prompt:BasePromptTemplate, prompt_args:Dict[str, Any]) -> str:
+        prompt_args_copy = prompt_args.copy()
+        if self.enable_cache:
             for key in prompt_args.get('exclude_cache_keys', []):
                 del prompt_args_copy[key]
 
-            cache_key = f'{self.llm.to_json()},{prompt.format(**prompt_args_copy)}'
-            cache_hex = sha256(cache_key.encode('utf-8')).hexdigest()
-            cache_file = f'cache/llm/{cache_hex}.txt'
-
-            if os.path.exists(cache_file):
-                logger.debug('%sCached response %s%s', c_blue, cache_file, c_norm)
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    response = f.read()
-            else:
-                try:
-                    if isinstance(self.llm, BedrockConverse):
-                        if not hasattr(self.llm, '_client'):
-                            config = Config(
-                                retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'standard'},
-                                connect_timeout=TIMEOUT,
-                                read_timeout=TIMEOUT,
-                            )
-                            
-                            session = GraphRAGConfig.session
-                            self.llm._client = session.client('bedrock-runtime', config=config)
-                    response = self.llm.predict(prompt, **prompt_args)
-                except Exception as e:
-                    raise ModelError(f'{e!s} Model config: {self.llm.to_json()}') from e
-                os.makedirs(os.path.dirname(os.path.realpath(cache_file)), exist_ok=True)
-                with open(cache_file, 'w') as f:
-                    f.write(response)
+        request_key = f'{self.llm.to_json()},{prompt.format(**prompt_args_copy)}'
+        return sha256(request_key.encode('utf-8')).hexdigest()
+
+    def _invoke_llm(self, prompt:BasePromptTemplate, prompt_args:Dict[str, Any]) -> str:
+        with _model_limiter(self.llm):
+            try:
+                self._init_client()
+                return self.llm.predict(prompt, **prompt_args)
+            except Exception as e:
+                raise ModelError(f'{e!s} [Model config: {self.llm.to_json()}]') from e
+
+    def _predict(self, request_key:str, prompt:BasePromptTemplate, prompt_args:Dict[str, Any]) -> str:
+
+        if not self.enable_cache:
+            return self._invoke_llm(prompt, prompt_args)
+        
+        cache_backend = self._get_cache_backend()
+
+        response = cache_backend.get(request_key)
+
+        if response is not None:
+            logger.debug('%sCached response %s%s', c_blue, request_key, c_norm)
+        else:
+            response = self._invoke_llm(prompt, prompt_args)
+            cache_backend.put(request_key, response)
 
-        if self.verbose_response:
-            logger.info('%s%s%s', c_green, response, c_norm)
-            
         return response
     
     @property
@@ -0,0 +1,231 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import abc
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from graphrag_toolkit.lexical_graph.errors import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = 'cache'
+EVICTION_CHECK_INTERVAL = 100
+
+class LLMCacheBackend(abc.ABC):
+    """
+    Abstract base class for stores that hold cached LLM responses.
+
+    Responses are keyed by a hex digest of the model configuration and prompt. Backends
+    record hit, miss, put and eviction counts for the current process, which can be
+    retrieved using `stats()`.
+    """
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'puts': 0, 'evictions': 0}
+
+    def _record(self, stat:str, count:int=1):
+        with self._stats_lock:
+            self._stats[stat] += count
+
+    def get(self, key:str) -> Optional[str]:
+        """
+        Returns the cached response for the given key, or None if there is no (unexpired)
+        entry for the key.
+        """
+        response = self._get(key)
+        self._record('hits' if response is not None else 'misses')
+        return response
+
+    def put(self, key:str, response:str):
+        """
+        Stores a response under the given key, evicting older entries if necessary.
+        """
+        self._put(key, response)
+        self._record('puts')
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit, miss, put and eviction counts recorded by this process.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_stats_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _get(self, key:str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _put(self, key:str, response:str):
+        raise NotImplementedError
+
+
+class FileSystemLLMCacheBackend(LLMCacheBackend):
+    """
+    Stores each cached response in its own file at `<cache_dir>/llm/<key>.txt`.
+
+    This is the original cache layout. It has no size bound; if `ttl` is set, entries
+    older than `ttl` seconds (by file modification time) are treated as misses and removed.
+    """
+    def __init__(self, cache_dir:str=DEFAULT_CACHE_DIR, ttl:Optional[int]=None):
+        super().__init__()
+        self.cache_dir = os.path.join(cache_dir, 'llm')
+        self.ttl = ttl
+
+    def _cache_file(self, key:str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.txt')
+
+    def _get(self, key:str) -> Optional[str]:
+        cache_file = self._cache_file(key)
+        try:
+            if self.ttl and os.path.getmtime(cache_file) < time.time() - self.ttl:
+                os.remove(cache_file)
+                self._record('evictions')
+                return None
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _put(self, key:str, response:str):
+        cache_file = self._cache_file(key)
+        os.makedirs(os.path.dirname(os.path.realpath(cache_file)), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            f.write(response)
+
+
+class SQLiteLLMCacheBackend(LLMCacheBackend):
+    """
+    Stores cached responses in a single embedded SQLite database.
+
+    The database is opened in WAL mode so that multiple worker processes and threads can
+    share it. Each thread uses its own connection. Entries can be bounded by count, with
+    least-recently-used entries evicted first, and can expire after `ttl` seconds.
+
+    Attributes:
+        db_path (str): Path to the SQLite database file.
+        max_entries (Optional[int]): Maximum number of entries retained. None or 0 for unbounded.
+        ttl (Optional[int]): Time-to-live for entries, in seconds. None or 0 for no expiry.
+    """
+    def __init__(self, cache_dir:str=DEFAULT_CACHE_DIR, max_entries:Optional[int]=None, ttl:Optional[int]=None, db_name:str='llm_cache.db'):
+        super().__init__()
+        self.db_path = os.path.join(cache_dir, db_name)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        self._puts_since_eviction_check = 0
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.realpath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS llm_cache ('
+                'key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache(accessed_at)')
+            self._local.conn = conn
+        return conn
+
+    def _get(self, key:str) -> Optional[str]:
+        conn = self._connection()
+        row = conn.execute('SELECT response, created_at FROM llm_cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        (response, created_at) = row
+        now = time.time()
+        if self.ttl and created_at < now - self.ttl:
+            conn.execute('DELETE FROM llm_cache WHERE key = ?', (key,))
+            self._record('evictions')
+            return None
+        if self.max_entries:
+            conn.execute('UPDATE llm_cache SET accessed_at = ? WHERE key = ?', (now, key))
+        return response
+
+    def _put(self, key:str, response:str):
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            'INSERT OR REPLACE INTO llm_cache (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+            (key, response, now, now)
+        )
+        self._puts_since_eviction_check += 1
+        if self._puts_since_eviction_check >= EVICTION_CHECK_INTERVAL:
+            self._puts_since_eviction_check = 0
+            self.evict()
+
+    def evict(self):
+        """
+        Removes expired entries and, if the cache is bounded, the least-recently-used
+        entries in excess of `max_entries`. Eviction runs automatically every
+        `EVICTION_CHECK_INTERVAL` puts.
+        """
+        conn = self._connection()
+        evicted = 0
+        if self.ttl:
+            evicted += conn.execute('DELETE FROM llm_cache WHERE created_at < ?', (time.time() - self.ttl,)).rowcount
+        if self.max_entries:
+            (count,) = conn.execute('SELECT COUNT(*) FROM llm_cache').fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                evicted += conn.execute(
+                    'DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)',
+                    (excess,)
+                ).rowcount
+        if evicted:
+            logger.debug(f'Evicted {evicted} entries from LLM cache [db_path: {self.db_path}]')
+            self._record('evictions', evicted)
+
+
+_default_backends:Dict[tuple, LLMCacheBackend] = {}
+_default_backends_lock = threading.Lock()
+
+def default_llm_cache_backend() -> LLMCacheBackend:
+    """
+    Returns the process-wide cache backend described by `GraphRAGConfig`
+    (`llm_cache_backend`, `llm_cache_max_entries` and `llm_cache_ttl`). Backends are
+    shared by all `LLMCache` instances in a process, so that their statistics are
+    aggregated.
+    """
+    from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+
+    backend_type = GraphRAGConfig.llm_cache_backend
+    max_entries = GraphRAGConfig.llm_cache_max_entries
+    ttl = GraphRAGConfig.llm_cache_ttl
+
+    backend_key = (backend_type, max_entries, ttl)
+
+    with _default_backends_lock:
+        if backend_key not in _default_backends:
+            if backend_type == 'file':
+                _default_backends[backend_key] = FileSystemLLMCacheBackend(ttl=ttl)
+            elif backend_type == 'sqlite':
+                _default_backends[backend_key] = SQLiteLLMCacheBackend(max_entries=max_entries, ttl=ttl)
+            else:
+                raise ConfigurationError(f"Invalid llm_cache_backend: '{backend_type}' (expected 'file' or 'sqlite')")
+        return _default_backends[backend_key]
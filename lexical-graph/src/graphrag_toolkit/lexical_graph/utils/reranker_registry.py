@@ -0,0 +1,168 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+class RerankScoreCache:
+    """
+    A bounded, thread-safe, in-memory LRU cache of reranker scores, keyed by reranking
+    model, query and text.
+
+    Attributes:
+        max_entries (int): Maximum number of scores retained.
+    """
+    def __init__(self, max_entries:int):
+        self.max_entries = max_entries
+        self._scores:OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_scores(self, model_key:str, query:str, texts:Sequence[str]) -> Dict[str, float]:
+        """
+        Returns the cached scores for those of the given texts that are in the cache.
+        """
+        scores = {}
+        with self._lock:
+            for text in texts:
+                key = (model_key, query, text)
+                score = self._scores.get(key)
+                if score is not None:
+                    self._scores.move_to_end(key)
+                    scores[text] = score
+        return scores
+
+    def put_scores(self, model_key:str, query:str, scores:Dict[str, float]):
+        """
+        Caches the given text scores, evicting least-recently-used scores if necessary.
+        """
+        with self._lock:
+            for text, score in scores.items():
+                key = (model_key, query, text)
+                self._scores[key] = score
+                self._scores.move_to_end(key)
+            while len(self._scores) > self.max_entries:
+                self._scores.popitem(last=False)
+
+
+class BatchingPairScorer:
+    """
+    Scores (query, text) pairs with a shared cross-encoder reranker.
+
+    Requests from concurrent threads are coalesced: while one thread is running the model,
+    pairs submitted by other threads are queued, and are then scored together in a single
+    batch by that same thread. The model is therefore only ever invoked by one thread at
+    a time.
+
+    Attributes:
+        reranker (SentenceReranker): The reranker used to score pairs.
+    """
+    def __init__(self, reranker:Any):
+        self.reranker = reranker
+        self._lock = threading.Lock()
+        self._pending:List[Tuple[List[Tuple[str, str]], Future]] = []
+        self._running = False
+
+    def score(self, pairs:List[Tuple[str, str]]) -> List[float]:
+        """
+        Returns the scores for the given pairs, in order.
+        """
+        if not pairs:
+            return []
+
+        future = Future()
+
+        with self._lock:
+            self._pending.append((pairs, future))
+            is_leader = not self._running
+            self._running = True
+
+        if is_leader:
+            self._run_batches()
+
+        return future.result()
+
+    def _run_batches(self):
+        while True:
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+                if not batch:
+                    self._running = False
+                    return
+
+            all_pairs = [pair for (pairs, _) in batch for pair in pairs]
+
+            logger.debug(f'Scoring {len(all_pairs)} pairs for {len(batch)} requests')
+
+            try:
+                scores = self.reranker.rerank_pairs(all_pairs, batch_size=self.reranker.batch_size)
+            except Exception as e:
+                for (_, future) in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for (pairs, future) in batch:
+                future.set_result(scores[offset:offset + len(pairs)])
+                offset += len(pairs)
+
+
+_registry_lock = threading.Lock()
+_pair_scorers:Dict[Tuple[int, str], BatchingPairScorer] = {}
+_bedrock_agent_runtime_clients:Dict[Tuple[int, Optional[str]], Any] = {}
+_score_cache:Optional[RerankScoreCache] = None
+
+def get_pair_scorer(model:str) -> BatchingPairScorer:
+    """
+    Returns the process-wide `BatchingPairScorer` for the given cross-encoder model,
+    loading the model the first time it is requested.
+    """
+    from graphrag_toolkit.lexical_graph.retrieval.post_processors import SentenceReranker
+
+    key = (os.getpid(), model)
+
+    with _registry_lock:
+        if key not in _pair_scorers:
+            logger.debug(f'Loading reranking model [model: {model}]')
+            _pair_scorers[key] = BatchingPairScorer(SentenceReranker(model=model))
+        return _pair_scorers[key]
+
+def get_bedrock_agent_runtime_client(region:Optional[str]) -> Any:
+    """
+    Returns the process-wide Bedrock Agent Runtime client for the given region. boto3
+    clients are thread-safe, so a single client is shared by all reranking requests.
+    """
+    import boto3
+
+    key = (os.getpid(), region)
+
+    with _registry_lock:
+        if key not in _bedrock_agent_runtime_clients:
+            _bedrock_agent_runtime_clients[key] = boto3.client('bedrock-agent-runtime', region_name=region)
+        return _bedrock_agent_runtime_clients[key]
+
+def default_rerank_score_cache() -> Optional[RerankScoreCache]:
+    """
+    Returns the process-wide reranker score cache, sized according to
+    `GraphRAGConfig.reranking_score_cache_size`, or None if score caching is disabled
+    (size 0).
+    """
+    global _score_cache
+
+    from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+
+    max_entries = GraphRAGConfig.reranking_score_cache_size
+
+    if not max_entries or max_entries < 1:
+        return None
+
+    with _registry_lock:
+        if _score_cache is None or _score_cache.max_entries != max_entries:
+            _score_cache = RerankScoreCache(max_entries)
+        return _score_cache
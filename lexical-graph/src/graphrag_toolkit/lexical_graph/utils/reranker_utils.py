@@ -1,11 +1,11 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import statistics
 import numpy
-import tfidf_matcher as tm
 from typing import List, Optional
 
+from graphrag_toolkit.lexical_graph.utils.lexical_scorer import LexicalScorer
+
 def to_float(v):
     if isinstance(v, numpy.float64) or isinstance(v, numpy.float32):
         return v.item()
@@ -17,45 +17,46 @@ def score_values_with_tfidf(values:List[str],
                  limit:Optional[int]=None, 
                  ngram_length:Optional[int]=3, 
                  num_primary_match_values:Optional[int]=None):
+        """
+        Scores values against a list of match values using character n-gram TF-IDF cosine
+        similarity (see `LexicalScorer`).
+
+        For each match value, the top `limit` values are selected. Scores contributed by
+        match values beyond the first `num_primary_match_values` are discounted by 10%. Each
+        selected value is scored with the mean of the scores it received from the match
+        values that selected it. Values not selected by any match value are omitted.
+
+        Returns:
+            dict: Values mapped to their scores, sorted in descending order of score.
+        """
         
-        values_to_score = values.copy()
+        values_to_score = list(dict.fromkeys(values))
         
         num_match_values = len(match_values)
         num_primary_match_values = num_primary_match_values or num_match_values
         max_num_values_to_score =  len(values_to_score)
         
-        def calculate_ranked_score(row_index, score):
-            multiplier = 1.0 if row_index < num_primary_match_values else 0.9
-            return score * multiplier
-        
         if limit:
             max_num_values_to_score = min(limit, max_num_values_to_score)
 
-        while len(values_to_score) <= max_num_values_to_score:
-            values_to_score.append('')
+        scorer = LexicalScorer(values_to_score, ngram_length=ngram_length or 3)
+
+        if not num_match_values or not scorer.vocabulary_size:
+            return {v: 0.0 for v in values_to_score if v}
+
+        indexes, scores = scorer.top_k(match_values, max_num_values_to_score)
 
-        scored_values = {}
+        multipliers = numpy.where(numpy.arange(num_match_values) < num_primary_match_values, 1.0, 0.9)
+        scores = scores * multipliers[:, numpy.newaxis]
 
-        try:
-            
-            matcher_results = tm.matcher(match_values, values_to_score, max_num_values_to_score, ngram_length)
+        score_totals = numpy.bincount(indexes.ravel(), weights=scores.ravel(), minlength=len(values_to_score))
+        score_counts = numpy.bincount(indexes.ravel(), minlength=len(values_to_score))
 
-            max_i = len(matcher_results.columns)
+        scored_values = {
+            values_to_score[i]: float(score_totals[i] / score_counts[i])
+            for i in numpy.flatnonzero(score_counts)
+        }
         
-            for row_index in range(0, num_match_values):
-                for col_index in range(1, max_i, 3) :
-                    value = matcher_results.iloc[row_index, col_index]
-                    base_score = matcher_results.iloc[row_index, col_index+1]
-                    score = calculate_ranked_score(row_index, base_score) if base_score > 0.0 else base_score
-                    if value not in scored_values:
-                        scored_values[value] = [score]
-                    else:
-                        scored_values[value].append(score)
-                                         
-        except ValueError:
-            scored_values = {v: [0.0] for v in values_to_score if v}
-            
-        scored_values = { k: to_float(statistics.mean(v)) for k,v in scored_values.items() }  
         sorted_scored_values = dict(sorted(scored_values.items(), key=lambda item: item[1], reverse=True))
         
-        return sorted_scored_values
\ No newline at end of file
+        return sorted_scored_values
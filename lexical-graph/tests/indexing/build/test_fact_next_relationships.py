@@ -0,0 +1,120 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from typing import Set, Tuple
+
+from graphrag_toolkit.lexical_graph.indexing.model import Fact, Entity, Relation
+from graphrag_toolkit.lexical_graph.indexing.constants import LOCAL_ENTITY_CLASSIFICATION
+from graphrag_toolkit.lexical_graph.indexing.build.fact_graph_builder import FactGraphBuilder
+from graphrag_toolkit.lexical_graph.indexing.build.fused_graph_client import FusedGraphClient
+from graphrag_toolkit.lexical_graph.indexing.build.graph_batch_client import GraphBatchClient
+from graphrag_toolkit.lexical_graph.storage.graph.dummy_graph_store import DummyGraphStore
+
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.schema import TextNode
+
+_ENTITY_FACT_RELATIONSHIP = re.compile(r'MERGE \(entity\)-\[:`(__SUBJECT__|__OBJECT__)`\]->\(fact\)')
+_ENTITY_ID_PARAM = re.compile(r'params\.((?:p\d+_)?entity_id)')
+_FACT_ID_PARAM = re.compile(r'params\.((?:p\d+_)?fact_id)')
+
+class FactGraphStore(DummyGraphStore):
+    """
+    Emulates just enough of a graph to run the fact builder's writes and `__NEXT__`
+    lookups: entity-fact relationships are recorded as they are written, and the
+    prev/next fact lookups are answered from the relationships written so far.
+    """
+    _entity_fact: Set[Tuple[str, str, str]] = PrivateAttr(default_factory=set)
+    _next: Set[Tuple[str, str]] = PrivateAttr(default_factory=set)
+
+    def _facts(self, relationship_type, entity_id):
+        return {f for (r, e, f) in self._entity_fact if r == relationship_type and e == entity_id}
+
+    def _entities(self, relationship_type, fact_id):
+        return {e for (r, e, f) in self._entity_fact if r == relationship_type and f == fact_id}
+
+    def _execute_query(self, cypher, parameters={}, correlation_id=None):
+        super()._execute_query(cypher, parameters, correlation_id)
+
+        rows = parameters.get('params', [])
+        results = []
+
+        if 'get start and end facts for prev conection' in cypher:
+            for row in rows:
+                for entity_id in self._entities('__SUBJECT__', row['fact_id']):
+                    for prev_fact_id in self._facts('__OBJECT__', entity_id) - {row['fact_id']}:
+                        results.append({'startId': prev_fact_id, 'endId': row['fact_id']})
+        elif 'get start and end facts for next conection' in cypher:
+            for row in rows:
+                for entity_id in self._entities('__OBJECT__', row['fact_id']):
+                    for next_fact_id in self._facts('__SUBJECT__', entity_id) - {row['fact_id']}:
+                        results.append({'startId': row['fact_id'], 'endId': next_fact_id})
+        elif 'insert connection to prev facts' in cypher:
+            for row in rows:
+                self._next.add((row['startId'], row['endId']))
+        else:
+            for segment in cypher.split('WITH params'):
+                relationship = _ENTITY_FACT_RELATIONSHIP.search(segment)
+                if not relationship:
+                    continue
+                entity_key = _ENTITY_ID_PARAM.search(segment).group(1)
+                fact_key = _FACT_ID_PARAM.search(segment).group(1)
+                for row in rows:
+                    if row.get(entity_key) and row.get(fact_key):
+                        self._entity_fact.add((relationship.group(1), row[entity_key], row[fact_key]))
+
+        return results
+
+    def expected_next_relationships(self) -> Set[Tuple[str, str]]:
+        return {
+            (prev_fact_id, fact_id)
+            for (r, entity_id, fact_id) in self._entity_fact if r == '__SUBJECT__'
+            for prev_fact_id in self._facts('__OBJECT__', entity_id) - {fact_id}
+        }
+
+def _entity(entity_id, value, classification='Company'):
+    return Entity(entityId=entity_id, value=value, classification=classification)
+
+def _fact_node(fact_id, subject, obj=None, complement=None):
+    fact = Fact(
+        factId=fact_id,
+        statementId=f's-{fact_id}',
+        subject=subject,
+        predicate=Relation(value='RELATED_TO'),
+        object=obj,
+        complement=complement
+    )
+    return TextNode(text=f'fact {fact_id}', metadata={'fact': fact.model_dump()})
+
+def test_next_relationships_created_for_facts_of_mixed_shapes():
+
+    a = _entity('a', 'Alpha')
+    b = _entity('b', 'Beta')
+    c = _entity('c', 'Gamma')
+    local = _entity('l', 'local', LOCAL_ENTITY_CLASSIFICATION)
+
+    # Each fact shape produces a differently shaped fused write, and all but the first
+    # of these are first submitted after the __NEXT__ query tree has been registered.
+    nodes = [
+        _fact_node('f1', a, obj=b),
+        _fact_node('f2', b, obj=c, complement='in 2024'),
+        _fact_node('f3', b, complement='every year'),
+        _fact_node('f4', local, obj=b),
+        _fact_node('f5', c, obj=a)
+    ]
+
+    graph_store = FactGraphStore()
+    batch_client = GraphBatchClient(graph_store, batch_writes_enabled=True, batch_write_size=100, batch_write_concurrency=1)
+    graph_client = FusedGraphClient(batch_client)
+    builder = FactGraphBuilder()
+
+    for node in nodes:
+        builder.build(node, graph_client, include_local_entities=True, include_domain_labels=False)
+        graph_client.flush()
+
+    batch_client.apply_batch_operations()
+
+    expected = {('f1', 'f2'), ('f1', 'f3'), ('f4', 'f2'), ('f4', 'f3'), ('f2', 'f5'), ('f5', 'f1')}
+
+    assert graph_store.expected_next_relationships() == expected
+    assert graph_store._next == expected